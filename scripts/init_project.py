@@ -15,19 +15,215 @@ import os
 import sys
 import json
 import platform
-import subprocess
+import shutil
 import re
+import functools
+import collections
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, FrozenSet, List, Tuple, Optional
 import logging
 
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 logger = logging.getLogger(__name__)
 
+# Host platform, resolved once at import
+_SYSTEM = platform.system()
+_IS_WINDOWS = _SYSTEM == "Windows"
+
+# Output shorter than this cannot match any error pattern (shortest alternative is "OOM")
+_MIN_ERROR_LEN = 3
+
+
+@functools.lru_cache(maxsize=1)
+def _detect_cmake() -> Optional[str]:
+    """Look up CMake once per process. Returns an issue message, or None if found."""
+    if shutil.which("cmake") is None:
+        return "CMake not found. Install from https://cmake.org/download/"
+    return None
+
+
+@functools.lru_cache(maxsize=1)
+def _detect_cxx_compiler() -> Optional[str]:
+    """Look up a C++ compiler on PATH once per process. Returns the first one found."""
+    compilers = ["g++", "clang++", "cl"] if _IS_WINDOWS else ["g++", "clang++"]
+    for compiler in compilers:
+        if shutil.which(compiler):
+            return compiler
+    return None
+
+
+# Scaffold templates, rendered with str.format (literal braces are doubled)
+_CLI_CMAKE_TMPL = """cmake_minimum_required(VERSION 3.15)
+project({name} VERSION 1.0.0 LANGUAGES CXX)
+
+set(CMAKE_CXX_STANDARD 17)
+set(CMAKE_CXX_STANDARD_REQUIRED ON)
+set(CMAKE_CXX_EXTENSIONS OFF)
+
+add_executable({name} src/main.cpp)
+target_include_directories({name} PRIVATE include)
+
+target_compile_options({name} PRIVATE
+    $<$<CXX_COMPILER_ID:MSVC>:/W4>
+    $<$<NOT:$<CXX_COMPILER_ID:MSVC>>:-Wall -Wextra -Wpedantic>
+)
+"""
+
+_GUI_CMAKE_TMPL = """cmake_minimum_required(VERSION 3.15)
+project({name} VERSION 1.0.0 LANGUAGES CXX)
+
+set(CMAKE_CXX_STANDARD 17)
+set(CMAKE_CXX_STANDARD_REQUIRED ON)
+set(CMAKE_CXX_EXTENSIONS OFF)
+
+# Use vcpkg if available
+if(DEFINED ENV{{VCPKG_ROOT}})
+    set(CMAKE_TOOLCHAIN_FILE "$ENV{{VCPKG_ROOT}}/scripts/buildsystems/vcpkg.cmake")
+endif()
+
+{find_package}
+
+add_executable({name} src/main.cpp)
+target_include_directories({name} PRIVATE include)
+{target_link}
+
+target_compile_options({name} PRIVATE
+    $<$<CXX_COMPILER_ID:MSVC>:/W4>
+    $<$<NOT:$<CXX_COMPILER_ID:MSVC>>:-Wall -Wextra -Wpedantic>
+)
+"""
+
+# framework -> (find_package line, target_link_libraries line)
+_GUI_CMAKE_DEPS = {
+    "qt6": ("find_package(Qt6 REQUIRED COMPONENTS Core Gui Widgets)",
+            "target_link_libraries({name} PRIVATE Qt6::Core Qt6::Gui Qt6::Widgets)"),
+    "wxwidgets": ("find_package(wxWidgets REQUIRED COMPONENTS core base)",
+                  "target_link_libraries({name} PRIVATE wx::core wx::base)"),
+}
+# fltk, imgui, etc.
+_GUI_CMAKE_DEPS_DEFAULT = ("find_package({FRAMEWORK} REQUIRED)",
+                           "target_link_libraries({name} PRIVATE {FRAMEWORK}::{framework})")
+
+_CLI_MAIN_TMPL = """// {name} - Command-line application
+// Copyright (c) 2025
+
+#include <iostream>
+
+int main() {{
+  std::cout << "Hello from {name}!" << std::endl;
+  return 0;
+}}
+"""
+
+_GUI_MAIN_TMPLS = {
+    "qt6": """// {name} - Qt6 GUI Application
+// Copyright (c) 2025
+
+#include <QApplication>
+#include <QMainWindow>
+#include <QLabel>
+
+int main(int argc, char* argv[]) {{
+  QApplication app(argc, argv);
+  QMainWindow window;
+  window.setWindowTitle("Qt Application");
+  window.resize(400, 300);
+  window.show();
+  return app.exec();
+}}
+""",
+    "wxwidgets": """// {name} - wxWidgets GUI Application
+// Copyright (c) 2025
+
+#include <wx/wx.h>
+
+class MainFrame : public wxFrame {{
+ public:
+  MainFrame() : wxFrame(nullptr, wxID_ANY, "wxWidgets Application") {{
+    wxPanel* panel = new wxPanel(this);
+    new wxStaticText(panel, wxID_ANY, "Hello, wxWidgets!");
+    SetSize(400, 300);
+  }}
+}};
+
+class MainApp : public wxApp {{
+ public:
+  bool OnInit() override {{
+    MainFrame* frame = new MainFrame();
+    frame->Show();
+    return true;
+  }}
+}};
+
+wxIMPLEMENT_APP(MainApp);
+""",
+}
+
+_GUI_MAIN_TMPL_DEFAULT = """// {name} - {FRAMEWORK} GUI Application
+// Copyright (c) 2025
+
+#include <iostream>
+
+int main() {{
+  std::cout << "Hello from {name}!" << std::endl;
+  return 0;
+}}
+"""
+
+_VCPKG_DEPENDENCIES = {
+    "qt6": ["qt6-base"],
+    "wxwidgets": ["wxwidgets"],
+    "fltk": ["fltk"],
+    "imgui": ["imgui"],
+}
+
+_CLANG_FORMAT_CONFIG = """---
+Language: Cpp
+BasedOnStyle: Google
+IndentWidth: 4
+ColumnLimit: 120
+PointerAlignment: Left
+AllowShortFunctionsOnASingleLine: Empty
+BreakBeforeBraces: Attach
+---
+"""
+
+
+def _run_tail(cmd: List[str], cwd: Optional[str] = None, max_lines: int = 4096) -> Tuple[int, str]:
+    """Run command, keeping only the last max_lines of combined output. Returns (returncode, output)."""
+    import subprocess
+
+    tail = collections.deque(maxlen=max_lines)
+    with subprocess.Popen(cmd, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                          text=True, bufsize=1) as proc:
+        for line in proc.stdout:
+            tail.append(line)
+    return proc.returncode, "".join(tail)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_json_cached(filepath: str) -> dict:
+    """Load and parse JSON file once per process. Use cache_clear() to reload."""
+    try:
+        with open(filepath, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError) as e:
+        logger.warning(f"Failed to load {filepath}: {e}")
+        return {}
+
 
 class AutomationEngine:
     """Orchestrates C++ project generation with auto-decision making and error recovery."""
 
+    # Request keywords, matched against the tokens of a user request
+    _GUI_WORDS = frozenset(["gui", "window", "ui", "app", "viewer", "graphics"])
+    _LIB_WORDS = frozenset(["library", "lib", "static", "shared"])
+    _3D_WORDS = frozenset(["3d", "viewer"])
+    _ENTERPRISE_WORDS = frozenset(["enterprise", "professional"])
+    _GAME_WORDS = frozenset(["game", "debug"])
+    _SIMPLE_WORDS = frozenset(["simple", "minimal"])
+    _TOKEN_RE = re.compile(r"\w+")
+
     def __init__(self, decisions_file: str = None, error_patterns_file: str = None):
         """Initialize the automation engine with decision and error pattern databases."""
         self.decisions_file = decisions_file or self._find_decisions_file()
@@ -36,6 +232,36 @@ class AutomationEngine:
         self.decisions = self._load_json(self.decisions_file)
         self.error_patterns = self._load_json(self.error_patterns_file)
         self.max_retry_attempts = 3
+        self._framework_names_lower = {
+            name.lower(): name for name in self.decisions.get("gui_frameworks", {})
+        }
+        # Per-framework keyword sets for scoring; multi-word keywords contribute their words
+        frameworks = self.decisions.get("gui_frameworks", {})
+        self._framework_keyword_sets = {
+            name: frozenset(word for k in info.get("use_case_keywords", []) for word in k.lower().split())
+            for name, info in frameworks.items()
+        }
+        self._framework_auto_select = {
+            name: frozenset(info.get("auto_select_when", []))
+            for name, info in frameworks.items()
+        }
+
+        # Precompile error-pattern regexes once; build retries reuse them
+        self._compiled_patterns = self._compile_error_patterns()
+        # Only patterns applicable to this host are scanned at match time
+        self._patterns_for_platform = [
+            (compiled, pattern) for compiled, platforms, pattern in self._compiled_patterns
+            if "all" in platforms or _SYSTEM in platforms
+        ]
+        # Single alternation so a log is scanned once instead of once per pattern
+        self._combined_re = None
+        if self._patterns_for_platform:
+            self._combined_re = re.compile(
+                "|".join(f"(?P<p{i}>(?:{compiled.pattern}))"
+                         for i, (compiled, _) in enumerate(self._patterns_for_platform)),
+                re.IGNORECASE,
+            )
+        self._pattern_index = [pattern for _, pattern in self._patterns_for_platform]
 
     def _find_decisions_file(self) -> str:
         """Find decisions.json in the cpp-dev-skills directory."""
@@ -62,39 +288,48 @@ class AutomationEngine:
         raise FileNotFoundError(f"error-patterns.json not found in {[str(c) for c in candidates]}")
 
     def _load_json(self, filepath: str) -> dict:
-        """Load and parse JSON file."""
-        try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError) as e:
-            logger.warning(f"Failed to load {filepath}: {e}")
-            return {}
+        """Load and parse JSON file (cached per absolute path, treat as read-only)."""
+        return _load_json_cached(os.path.abspath(filepath))
+
+    def _compile_error_patterns(self) -> List[Tuple["re.Pattern", FrozenSet[str], Dict]]:
+        """Compile error-pattern regexes and platform sets, skipping invalid entries."""
+        compiled = []
+        for pattern in self.error_patterns.get("patterns", []):
+            regex = pattern.get("regex")
+            if not regex:
+                continue
+            try:
+                compiled.append((re.compile(regex, re.IGNORECASE),
+                                 frozenset(pattern.get("platform", ["all"])), pattern))
+            except re.error as e:
+                logger.warning(f"Skipping invalid error pattern {pattern.get('id', regex)}: {e}")
+        return compiled
 
     def parse_user_request(self, user_request: str) -> Dict[str, any]:
         """Extract keywords and features from user request."""
-        keywords = []
         request_lower = user_request.lower()
+        tokens = set(self._TOKEN_RE.findall(request_lower))
 
         # Extract framework mentions
-        gui_frameworks = self.decisions.get("gui_frameworks", {}).keys()
-        mentioned_frameworks = [f for f in gui_frameworks if f.lower() in request_lower]
+        mentioned_frameworks = [name for lower, name in self._framework_names_lower.items()
+                                if lower in tokens]
 
         # Extract project type keywords
         project_type = "cli"
-        if any(word in request_lower for word in ["gui", "window", "ui", "app", "viewer", "viewer", "graphics"]):
+        if tokens & self._GUI_WORDS:
             project_type = "gui"
-        elif any(word in request_lower for word in ["library", "lib", "static", "shared"]):
+        elif tokens & self._LIB_WORDS:
             project_type = "library"
 
         # Extract use case keywords
         use_cases = []
-        if "3d" in request_lower or "viewer" in request_lower:
+        if tokens & self._3D_WORDS:
             use_cases.append("3d_viewer")
-        if "enterprise" in request_lower or "professional" in request_lower:
+        if tokens & self._ENTERPRISE_WORDS:
             use_cases.append("enterprise_ui")
-        if "game" in request_lower or "debug" in request_lower:
+        if tokens & self._GAME_WORDS:
             use_cases.append("game_tools")
-        if "simple" in request_lower or "minimal" in request_lower:
+        if tokens & self._SIMPLE_WORDS:
             use_cases.append("minimal_gui")
 
         return {
@@ -109,27 +344,20 @@ class AutomationEngine:
         frameworks = self.decisions.get("gui_frameworks", {})
 
         # Score each framework based on use case matches
-        scores = {}
-        for framework_name, framework_info in frameworks.items():
-            score = 0
-            # Check if use case keywords match auto_select_when
-            for use_case in request_info.get("use_cases", []):
-                if use_case in framework_info.get("auto_select_when", []):
-                    score += 10
-            # Check for keyword matches in use_case_keywords
-            for keyword in request_info.get("keywords", []):
-                if keyword in str(framework_info.get("use_case_keywords", [])):
-                    score += 5
-            if score > 0:
-                scores[framework_name] = score
-
-        if not scores:
+        use_cases = set(request_info.get("use_cases", []))
+        keywords = set(request_info.get("keywords", []))
+        selected, best_score = None, 0
+        for framework_name in frameworks:
+            # use cases matching auto_select_when, keywords matching use_case_keywords
+            score = (10 * len(use_cases & self._framework_auto_select.get(framework_name, frozenset()))
+                     + 5 * len(keywords & self._framework_keyword_sets.get(framework_name, frozenset())))
+            if score > best_score:
+                selected, best_score = framework_name, score
+
+        if selected is None:
             # Default to wxWidgets if no clear match
             return "wxwidgets"
 
-        # Return framework with highest score
-        selected = max(scores.items(), key=lambda x: x[1])[0]
-
         # Check if user explicitly mentioned a framework
         if request_info.get("mentioned_frameworks"):
             mentioned = request_info["mentioned_frameworks"][0]
@@ -145,62 +373,46 @@ class AutomationEngine:
         issues = []
 
         # Check CMake
-        try:
-            result = subprocess.run(
-                ["cmake", "--version"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            if result.returncode != 0:
-                issues.append("CMake not found or not in PATH")
-        except FileNotFoundError:
-            issues.append("CMake not found. Install from https://cmake.org/download/")
+        cmake_issue = _detect_cmake()
+        if cmake_issue:
+            issues.append(cmake_issue)
 
         # Check C++ compiler
         cxx = os.environ.get("CXX")
-        if not cxx:
-            # Try to detect
-            compilers = ["g++", "clang++", "cl"] if platform.system() == "Windows" else ["g++", "clang++"]
-            found = False
-            for compiler in compilers:
-                try:
-                    subprocess.run([compiler, "--version"], capture_output=True, timeout=2, check=True)
-                    found = True
-                    break
-                except (FileNotFoundError, subprocess.TimeoutExpired):
-                    continue
-            if not found:
-                issues.append("No C++ compiler detected. Set CXX environment variable.")
+        if not cxx and _detect_cxx_compiler() is None:
+            issues.append("No C++ compiler detected. Set CXX environment variable.")
 
         return len(issues) == 0, issues
 
     def match_error_pattern(self, error_output: str) -> Optional[Dict]:
         """Find matching error pattern in error_output."""
-        patterns = self.error_patterns.get("patterns", [])
-        for pattern in patterns:
-            regex = pattern.get("regex", "")
-            # Check if pattern applies to current platform
-            pattern_platforms = pattern.get("platform", ["all"])
-            current_platform = platform.system()
-            if "all" not in pattern_platforms and current_platform not in pattern_platforms:
-                continue
-
-            if re.search(regex, error_output, re.IGNORECASE):
+        if self._combined_re is None or not error_output or len(error_output) < _MIN_ERROR_LEN:
+            return None
+        match = self._combined_re.search(error_output)
+        if not match:
+            return None
+
+        # The alternation reports the leftmost hit; earlier patterns still take
+        # precedence, and can only match further into the output.
+        index = int(match.lastgroup[1:])
+        for compiled, pattern in self._patterns_for_platform[:index]:
+            if compiled.search(error_output, match.start() + 1):
                 return pattern
-        return None
+        return self._pattern_index[index]
+
+    def execute_auto_fix(self, pattern: Dict, cwd: Optional[Path] = None) -> bool:
+        """Execute auto-fix commands for matched error pattern (in cwd, if given)."""
+        return self._run_fixes(pattern.get("auto_fix", []), cwd=cwd)
 
-    def execute_auto_fix(self, pattern: Dict) -> bool:
-        """Execute auto-fix commands for matched error pattern."""
-        auto_fixes = pattern.get("auto_fix", [])
-        if not auto_fixes:
-            return False
+    def _run_fixes(self, fixes: List[Dict], cwd: Optional[Path] = None) -> bool:
+        """Run fix entries in order until one succeeds."""
+        import subprocess
 
-        for fix in auto_fixes:
+        for fix in fixes:
             method = fix.get("method", "")
 
             # Get platform-specific command
-            if platform.system() == "Windows":
+            if _IS_WINDOWS:
                 cmd = fix.get("command_windows") or fix.get("command")
             else:
                 cmd = fix.get("command_linux") or fix.get("command")
@@ -211,7 +423,8 @@ class AutomationEngine:
 
             try:
                 logger.info(f"  → Executing fix: {method}")
-                result = subprocess.run(cmd, shell=True, capture_output=True, timeout=30)
+                result = subprocess.run(cmd, shell=True, cwd=cwd, stdout=subprocess.DEVNULL,
+                                        stderr=subprocess.DEVNULL, timeout=30)
                 if result.returncode == 0:
                     logger.info(f"  ✓ Fixed: {method}")
                     return True
@@ -225,62 +438,61 @@ class AutomationEngine:
     def build_with_validation(self, project_dir: Path) -> Tuple[bool, str]:
         """Build project with error detection and auto-fix. Returns (success, message)."""
         project_dir = Path(project_dir)
-        os.chdir(project_dir)
 
         for attempt in range(self.max_retry_attempts):
             logger.info(f"\n📦 Build attempt {attempt + 1}/{self.max_retry_attempts}")
 
             # Step 1: CMake configure
             logger.info("  → Running: cmake -B build")
-            result = subprocess.run(
-                ["cmake", "-B", "build"],
-                capture_output=True,
-                text=True,
-            )
+            returncode, error_output = _run_tail(["cmake", "-B", "build"], cwd=str(project_dir))
 
-            if result.returncode != 0:
-                error_output = result.stderr + result.stdout
+            if returncode != 0:
                 logger.error(f"  ✗ CMake configure failed")
 
                 # Try to match and fix error
                 pattern = self.match_error_pattern(error_output)
                 if pattern:
                     logger.warning(f"  → {pattern.get('user_message', 'Attempting auto-fix...')}")
-                    if self.execute_auto_fix(pattern):
+                    if self.execute_auto_fix(pattern, cwd=project_dir):
                         continue  # Retry after fix
 
                 # Try fallback
                 fallbacks = pattern.get("fallback", []) if pattern else []
+                fixed = False
                 for fallback in fallbacks:
-                    if self.execute_auto_fix({"auto_fix": [fallback]}):
-                        continue
+                    if self._run_fixes([fallback], cwd=project_dir):
+                        fixed = True
+                        break
+                if fixed:
+                    continue  # Retry after fallback fix
 
                 return False, f"CMake configure failed: {error_output[:300]}"
 
             # Step 2: CMake build
-            logger.info("  → Running: cmake --build build")
-            result = subprocess.run(
-                ["cmake", "--build", "build"],
-                capture_output=True,
-                text=True,
-            )
+            jobs = str(os.cpu_count() or 1)
+            logger.info(f"  → Running: cmake --build build --parallel {jobs}")
+            returncode, error_output = _run_tail(["cmake", "--build", "build", "--parallel", jobs],
+                                                 cwd=str(project_dir))
 
-            if result.returncode != 0:
-                error_output = result.stderr + result.stdout
+            if returncode != 0:
                 logger.error(f"  ✗ Build failed")
 
                 # Try to match and fix error
                 pattern = self.match_error_pattern(error_output)
                 if pattern:
                     logger.warning(f"  → {pattern.get('user_message', 'Attempting auto-fix...')}")
-                    if self.execute_auto_fix(pattern):
+                    if self.execute_auto_fix(pattern, cwd=project_dir):
                         continue  # Retry after fix
 
                 # Try fallback
                 fallbacks = pattern.get("fallback", []) if pattern else []
+                fixed = False
                 for fallback in fallbacks:
-                    if self.execute_auto_fix({"auto_fix": [fallback]}):
-                        continue
+                    if self._run_fixes([fallback], cwd=project_dir):
+                        fixed = True
+                        break
+                if fixed:
+                    continue  # Retry after fallback fix
 
                 return False, f"Build failed: {error_output[:300]}"
 
@@ -299,196 +511,72 @@ class AutomationEngine:
         # Create directory structure
         (project_dir / "src").mkdir(exist_ok=True)
         (project_dir / "include").mkdir(exist_ok=True)
-        (project_dir / ".gitignore").write_text("build/\n.vs/\n*.o\n*.exe\n")
+
+        files = [(".gitignore", "build/\n.vs/\n*.o\n*.exe\n")]
 
         # Create CMakeLists.txt
         if project_type == "gui" and gui_framework:
-            self._create_gui_cmakelists(project_dir, project_name, gui_framework)
+            files.append(("CMakeLists.txt", self._render_gui_cmakelists(project_name, gui_framework)))
         else:
-            self._create_cli_cmakelists(project_dir, project_name)
+            files.append(("CMakeLists.txt", self._render_cli_cmakelists(project_name)))
 
         # Create main.cpp
         if project_type == "gui":
-            self._create_gui_main(project_dir, gui_framework, project_name)
+            files.append(("src/main.cpp", self._render_gui_main(gui_framework, project_name)))
         else:
-            self._create_cli_main(project_dir, project_name)
+            files.append(("src/main.cpp", self._render_cli_main(project_name)))
 
         # Create vcpkg.json if needed
         if gui_framework:
-            self._create_vcpkg_json(project_dir, gui_framework)
+            files.append(("vcpkg.json", self._render_vcpkg_json(project_dir.name, gui_framework)))
 
         # Create .clang-format configuration (Google C++ Style Guide)
-        self._create_clang_format_config(project_dir)
+        files.append((".clang-format", self._render_clang_format_config()))
 
-        return True
-
-    def _create_cli_cmakelists(self, project_dir: Path, project_name: str):
-        """Create CMakeLists.txt for CLI project."""
-        cmake_content = f"""cmake_minimum_required(VERSION 3.15)
-project({project_name} VERSION 1.0.0 LANGUAGES CXX)
-
-set(CMAKE_CXX_STANDARD 17)
-set(CMAKE_CXX_STANDARD_REQUIRED ON)
-set(CMAKE_CXX_EXTENSIONS OFF)
-
-add_executable({project_name} src/main.cpp)
-target_include_directories({project_name} PRIVATE include)
+        # Small files go out concurrently; helps on network/WSL filesystems
+        from concurrent.futures import ThreadPoolExecutor
 
-target_compile_options({project_name} PRIVATE
-    $<$<CXX_COMPILER_ID:MSVC>:/W4>
-    $<$<NOT:$<CXX_COMPILER_ID:MSVC>>:-Wall -Wextra -Wpedantic>
-)
-"""
-        (project_dir / "CMakeLists.txt").write_text(cmake_content)
-
-    def _create_gui_cmakelists(self, project_dir: Path, project_name: str, framework: str):
-        """Create CMakeLists.txt for GUI project."""
-        # Framework-specific CMakeLists.txt
-        if framework == "qt6":
-            find_package = "find_package(Qt6 REQUIRED COMPONENTS Core Gui Widgets)"
-            target_link = "target_link_libraries({} PRIVATE Qt6::Core Qt6::Gui Qt6::Widgets)".format(project_name)
-        elif framework == "wxwidgets":
-            find_package = "find_package(wxWidgets REQUIRED COMPONENTS core base)"
-            target_link = "target_link_libraries({} PRIVATE {}::core {}::base)".format(project_name, "${wxWidgets_LIBRARIES}")
-        else:  # fltk, imgui, etc.
-            find_package = f"find_package({framework.upper()} REQUIRED)"
-            target_link = f"target_link_libraries({project_name} PRIVATE {framework.upper()}::{{framework}})"
-
-        cmake_content = f"""cmake_minimum_required(VERSION 3.15)
-project({project_name} VERSION 1.0.0 LANGUAGES CXX)
-
-set(CMAKE_CXX_STANDARD 17)
-set(CMAKE_CXX_STANDARD_REQUIRED ON)
-set(CMAKE_CXX_EXTENSIONS OFF)
-
-# Use vcpkg if available
-if(DEFINED ENV{{VCPKG_ROOT}})
-    set(CMAKE_TOOLCHAIN_FILE "$ENV{{VCPKG_ROOT}}/scripts/buildsystems/vcpkg.cmake")
-endif()
-
-{find_package}
-
-add_executable({project_name} src/main.cpp)
-target_include_directories({project_name} PRIVATE include)
-{target_link}
-
-target_compile_options({project_name} PRIVATE
-    $<$<CXX_COMPILER_ID:MSVC>:/W4>
-    $<$<NOT:$<CXX_COMPILER_ID:MSVC>>:-Wall -Wextra -Wpedantic>
-)
-"""
-        (project_dir / "CMakeLists.txt").write_text(cmake_content)
-
-    def _create_cli_main(self, project_dir: Path, project_name: str = None):
-        """Create basic CLI main.cpp with Google C++ Style Guide compliance."""
-        if project_name is None:
-            project_name = project_dir.name
-
-        main_content = f"""// {project_name} - Command-line application
-// Copyright (c) 2025
-
-#include <iostream>
-
-int main() {{
-  std::cout << "Hello from {project_name}!" << std::endl;
-  return 0;
-}}
-"""
-        (project_dir / "src" / "main.cpp").write_text(main_content)
-
-    def _create_gui_main(self, project_dir: Path, framework: str, project_name: str = None):
-        """Create basic GUI main.cpp with Google C++ Style Guide compliance."""
-        if project_name is None:
-            project_name = project_dir.name
-
-        if framework == "qt6":
-            main_content = f"""// {project_name} - Qt6 GUI Application
-// Copyright (c) 2025
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(lambda item: (project_dir / item[0]).write_text(item[1]), files))
 
-#include <QApplication>
-#include <QMainWindow>
-#include <QLabel>
-
-int main(int argc, char* argv[]) {{
-  QApplication app(argc, argv);
-  QMainWindow window;
-  window.setWindowTitle("Qt Application");
-  window.resize(400, 300);
-  window.show();
-  return app.exec();
-}}
-"""
-        elif framework == "wxwidgets":
-            main_content = f"""// {project_name} - wxWidgets GUI Application
-// Copyright (c) 2025
-
-#include <wx/wx.h>
-
-class MainFrame : public wxFrame {{
- public:
-  MainFrame() : wxFrame(nullptr, wxID_ANY, "wxWidgets Application") {{
-    wxPanel* panel = new wxPanel(this);
-    new wxStaticText(panel, wxID_ANY, "Hello, wxWidgets!");
-    SetSize(400, 300);
-  }}
-}};
-
-class MainApp : public wxApp {{
- public:
-  bool OnInit() override {{
-    MainFrame* frame = new MainFrame();
-    frame->Show();
-    return true;
-  }}
-}};
-
-wxIMPLEMENT_APP(MainApp);
-"""
-        else:
-            main_content = f"""// {project_name} - {framework.upper()} GUI Application
-// Copyright (c) 2025
-
-#include <iostream>
-
-int main() {{
-  std::cout << "Hello from {project_name}!" << std::endl;
-  return 0;
-}}
-"""
-        (project_dir / "src" / "main.cpp").write_text(main_content)
-
-    def _create_vcpkg_json(self, project_dir: Path, framework: str):
-        """Create vcpkg.json manifest."""
-        dependencies = []
-        if framework == "qt6":
-            dependencies = ["qt6-base"]
-        elif framework == "wxwidgets":
-            dependencies = ["wxwidgets"]
-        elif framework == "fltk":
-            dependencies = ["fltk"]
-        elif framework == "imgui":
-            dependencies = ["imgui"]
+        return True
 
+    def _render_cli_cmakelists(self, project_name: str) -> str:
+        """Render CMakeLists.txt for CLI project."""
+        return _CLI_CMAKE_TMPL.format(name=project_name)
+
+    def _render_gui_cmakelists(self, project_name: str, framework: str) -> str:
+        """Render CMakeLists.txt for GUI project."""
+        # Framework-specific find_package / target_link_libraries lines
+        find_package, target_link = _GUI_CMAKE_DEPS.get(framework, _GUI_CMAKE_DEPS_DEFAULT)
+        fields = {"name": project_name, "framework": framework, "FRAMEWORK": framework.upper()}
+        return _GUI_CMAKE_TMPL.format(
+            find_package=find_package.format(**fields),
+            target_link=target_link.format(**fields),
+            **fields,
+        )
+
+    def _render_cli_main(self, project_name: str) -> str:
+        """Render basic CLI main.cpp with Google C++ Style Guide compliance."""
+        return _CLI_MAIN_TMPL.format(name=project_name)
+
+    def _render_gui_main(self, framework: str, project_name: str) -> str:
+        """Render basic GUI main.cpp with Google C++ Style Guide compliance."""
+        template = _GUI_MAIN_TMPLS.get(framework, _GUI_MAIN_TMPL_DEFAULT)
+        return template.format(name=project_name, FRAMEWORK=(framework or "").upper())
+
+    def _render_vcpkg_json(self, name: str, framework: str) -> str:
+        """Render vcpkg.json manifest."""
         vcpkg_content = {
-            "name": project_dir.name,
+            "name": name,
             "version": "1.0.0",
-            "dependencies": dependencies
+            "dependencies": _VCPKG_DEPENDENCIES.get(framework, [])
         }
-        (project_dir / "vcpkg.json").write_text(json.dumps(vcpkg_content, indent=2))
+        return json.dumps(vcpkg_content, indent=2)
 
-    def _create_clang_format_config(self, project_dir: Path):
-        """Create .clang-format configuration (Google C++ Style Guide)."""
-        clang_format_config = """---
-Language: Cpp
-BasedOnStyle: Google
-IndentWidth: 4
-ColumnLimit: 120
-PointerAlignment: Left
-AllowShortFunctionsOnASingleLine: Empty
-BreakBeforeBraces: Attach
----
-"""
-        (project_dir / ".clang-format").write_text(clang_format_config)
+    def _render_clang_format_config(self) -> str:
+        """Render .clang-format configuration (Google C++ Style Guide)."""
+        return _CLANG_FORMAT_CONFIG
 
 
 def main():
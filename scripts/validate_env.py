@@ -16,50 +16,219 @@ Usage:
 
 import os
 import sys
+import json
+import hashlib
 import platform
+import shutil
+import stat
 import subprocess
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, List, Optional, Set, Tuple
+
+# Status marks; plain ASCII when the console can't encode the Unicode glyphs (e.g. cp1252)
+_UTF8 = (getattr(sys.stdout, "encoding", None) or "").lower().replace("-", "").startswith("utf")
+MARK_OK = "✓" if _UTF8 else "[OK]"
+MARK_FAIL = "❌" if _UTF8 else "[FAIL]"
+MARK_WARN = "⚠" if _UTF8 else "[WARN]"
+MARK_INFO = "ℹ" if _UTF8 else "[INFO]"
+MARK_SEARCH = "🔍" if _UTF8 else ">>"
+MARK_DONE = "✅" if _UTF8 else "[OK]"
+MARK_BULLET = "•" if _UTF8 else "-"
+MARK_ARROW = "→" if _UTF8 else "->"
+
+# Host platform, resolved once at import
+_SYSTEM = platform.system()
+
+_FILESYSTEM_KEY = r"SYSTEM\CurrentControlSet\Control\FileSystem"
+_CMAKE_VERSION_RE = re.compile(r"cmake version (\d+)\.(\d+)\.(\d+)")
+
+
+def _user_cache_dir() -> Path:
+    """Per-user cache directory: $XDG_CACHE_HOME, then ~/.cache, then %LOCALAPPDATA%."""
+    if os.environ.get("XDG_CACHE_HOME"):
+        return Path(os.environ["XDG_CACHE_HOME"]) / "claude-code-env"
+    if os.environ.get("HOME"):
+        return Path(os.environ["HOME"]) / ".cache" / "claude-code-env"
+    if os.environ.get("LOCALAPPDATA"):
+        return Path(os.environ["LOCALAPPDATA"]) / "claude-code-env"
+    return Path.home() / ".cache" / "claude-code-env"
+
+
+def _cache_key(system: str = _SYSTEM) -> str:
+    """Cache key for the current (platform, PATH, CXX) combination."""
+    path_hash = hashlib.blake2b(os.environ.get("PATH", "").encode()).hexdigest()[:16]
+    return f"{system}:{path_hash}:{os.environ.get('CXX', '')}"
+
+
+def _first_output_line(cmd: List[str], timeout: float) -> str:
+    """First stdout line of cmd; the process is stopped once it has been read.
+
+    Raises subprocess.TimeoutExpired if no line arrives within timeout seconds.
+    """
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+    lines: List[str] = []
+    # Read on a helper thread so the deadline holds even if the pipe never delivers a newline
+    reader = threading.Thread(target=lambda: lines.append(proc.stdout.readline()), daemon=True)
+    reader.start()
+    reader.join(timeout)
+
+    if reader.is_alive():
+        # Leave the pipe to the reader thread; it finishes once the write end closes
+        proc.kill()
+        proc.wait()
+        raise subprocess.TimeoutExpired(cmd, timeout)
+
+    proc.terminate()
+    try:
+        proc.wait(timeout=1)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+    proc.stdout.close()
+    return lines[0]
+
+
+def _tool_stamp(path: Optional[str]) -> Optional[float]:
+    """mtime of a resolved tool path, so an upgrade invalidates cached results."""
+    if not path:
+        return None
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return None
+
+
+def _free_bytes(path: str) -> int:
+    """Free bytes available to the current user on the volume containing path.
+
+    Follows the real host (not a simulated EnvironmentValidator.system): the
+    syscall has to exist here.
+    """
+    if _SYSTEM == "Windows":
+        import ctypes
+
+        free = ctypes.c_ulonglong(0)
+        total = ctypes.c_ulonglong(0)
+        total_free = ctypes.c_ulonglong(0)
+        if not ctypes.windll.kernel32.GetDiskFreeSpaceExW(
+            ctypes.c_wchar_p(path), ctypes.byref(free), ctypes.byref(total), ctypes.byref(total_free)
+        ):
+            raise ctypes.WinError()
+        return free.value
+    st = os.statvfs(path)
+    return st.f_bavail * st.f_frsize
 
 
 class EnvironmentValidator:
     """Validate C++ development environment."""
 
-    def __init__(self, auto_fix: bool = False):
+    CACHE_FILE = _user_cache_dir() / "validator.json"
+    # Disk space needed for a typical build; a warning is shown below twice this
+    REQUIRED_GB = 2
+
+    def __init__(self, auto_fix: bool = False, use_cache: bool = True, system: str = _SYSTEM):
         self.auto_fix = auto_fix
+        self.use_cache = use_cache
+        self.system = system  # platform.system() value; overridable for tests
         self.issues = []
         self.warnings = []
+        # Successful check results for this (platform, PATH, CXX) key
+        self._cache_key = _cache_key(system)
+        self._cache_all = self._load_cache() if use_cache else {}
+        self._cache = self._cache_all.setdefault(self._cache_key, {})
+        # Per-thread output/issue buffers while checks run concurrently
+        self._local = threading.local()
+
+    def _print(self, message: str = "") -> None:
+        """Print, or buffer the line when running inside a concurrent check."""
+        out = getattr(self._local, "out", None)
+        if out is None:
+            print(message)
+        else:
+            out.append(message)
+
+    def _add_issue(self, message: str) -> None:
+        """Record a critical issue (buffered inside a concurrent check)."""
+        issues = getattr(self._local, "issues", None)
+        (self.issues if issues is None else issues).append(message)
+
+    def _add_warning(self, message: str) -> None:
+        """Record a warning (buffered inside a concurrent check)."""
+        warnings = getattr(self._local, "warnings", None)
+        (self.warnings if warnings is None else warnings).append(message)
+
+    def _run_check(self, check_func) -> Tuple[Optional[bool], Optional[Exception], List[str], List[str], List[str]]:
+        """Run a check with buffered output. Returns (result, error, output, issues, warnings)."""
+        self._local.out, self._local.issues, self._local.warnings = [], [], []
+        try:
+            result, error = check_func(), None
+        except Exception as e:
+            result, error = None, e
+        out, issues, warnings = self._local.out, self._local.issues, self._local.warnings
+        self._local.out = self._local.issues = self._local.warnings = None
+        return result, error, out, issues, warnings
+
+    def _load_cache(self) -> Dict:
+        """Load cached check results, ignoring a missing or corrupt cache file."""
+        try:
+            with open(self.CACHE_FILE, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _save_cache(self) -> None:
+        """Persist cached check results (best effort)."""
+        if not self.use_cache:
+            return
+        try:
+            self.CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.CACHE_FILE, "w", encoding="utf-8") as f:
+                json.dump(self._cache_all, f, indent=2)
+        except OSError:
+            pass
 
     def check_cmake(self) -> bool:
         """Check CMake installation and version."""
+        cmake_path = shutil.which("cmake")
+        if not cmake_path:
+            self._add_issue("CMake not found in PATH")
+            self._print(f"{MARK_FAIL} CMake not found")
+            return False
+
+        stamp = _tool_stamp(cmake_path)
+        cached = self._cache.get("cmake")
+        if cached and stamp is not None and cached.get("stamp") == stamp:
+            self._print(f"{MARK_OK} CMake {cached['version']} (>= 3.15 required)")
+            return True
+
         try:
-            result = subprocess.run(
-                ["cmake", "--version"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            version_match = re.search(r"cmake version (\d+)\.(\d+)\.(\d+)", result.stdout)
+            # Only the first line ("cmake version X.Y.Z") is needed
+            first_line = _first_output_line([cmake_path, "--version"], timeout=5)
+            version_match = _CMAKE_VERSION_RE.search(first_line)
 
             if version_match:
                 major, minor, patch = map(int, version_match.groups())
                 version_str = f"{major}.{minor}.{patch}"
 
                 if (major, minor) >= (3, 15):
-                    print(f"✓ CMake {version_str} (>= 3.15 required)")
+                    self._print(f"{MARK_OK} CMake {version_str} (>= 3.15 required)")
+                    self._cache["cmake"] = {"version": version_str, "stamp": stamp}
                     return True
                 else:
-                    self.issues.append(f"CMake {version_str} found, but 3.15+ required")
-                    print(f"❌ CMake {version_str} (< 3.15)")
+                    self._add_issue(f"CMake {version_str} found, but 3.15+ required")
+                    self._print(f"{MARK_FAIL} CMake {version_str} (< 3.15)")
                     return False
             else:
-                self.issues.append("CMake version could not be determined")
+                self._add_issue("CMake version could not be determined")
                 return False
 
         except (FileNotFoundError, subprocess.TimeoutExpired):
-            self.issues.append("CMake not found in PATH")
-            print("❌ CMake not found")
+            self._add_issue("CMake not found in PATH")
+            self._print(f"{MARK_FAIL} CMake not found")
             return False
 
     def check_compiler(self) -> bool:
@@ -67,77 +236,133 @@ class EnvironmentValidator:
         cxx = os.environ.get("CXX")
 
         if cxx:
-            print(f"✓ CXX environment variable set: {cxx}")
+            self._print(f"{MARK_OK} CXX environment variable set: {cxx}")
             return True
 
         # Try to detect compilers
         compilers = {
-            "Windows": ["cl", "g++", "clang++"],
+            # cl is last: it is slow to probe and needs a vcvars environment
+            "Windows": ["clang++", "g++", "cl"],
             "Linux": ["g++", "clang++"],
             "Darwin": ["clang++", "g++"],
         }
 
-        os_name = platform.system()
+        os_name = self.system
         to_check = compilers.get(os_name, ["g++", "clang++"])
 
-        for compiler in to_check:
-            try:
-                result = subprocess.run(
-                    [compiler, "--version"],
-                    capture_output=True,
-                    text=True,
-                    timeout=2,
-                )
-                if result.returncode == 0:
-                    print(f"✓ Detected C++ compiler: {compiler}")
-                    return True
-            except (FileNotFoundError, subprocess.TimeoutExpired):
-                continue
+        cached = self._cache.get("compiler")
+        if cached and cached.get("name") in to_check:
+            stamp = _tool_stamp(shutil.which(cached["name"]))
+            if stamp is not None and cached.get("stamp") == stamp:
+                self._print(f"{MARK_OK} Detected C++ compiler: {cached['name']}")
+                return True
 
-        self.warnings.append(
+        # Probe only compilers on PATH, all in one shell instead of one process each
+        candidates = [c for c in to_check if shutil.which(c)]
+        working = self._probe_compilers(candidates) if candidates else set()
+        for compiler in candidates:
+            if compiler in working:
+                self._print(f"{MARK_OK} Detected C++ compiler: {compiler}")
+                self._cache["compiler"] = {"name": compiler, "stamp": _tool_stamp(shutil.which(compiler))}
+                return True
+
+        self._add_warning(
             "No C++ compiler detected. Set CXX environment variable."
         )
-        print("⚠ No C++ compiler found")
+        self._print(f"{MARK_WARN} No C++ compiler found")
         return False
 
+    def _probe_compilers(self, compilers: List[str]) -> Set[str]:
+        """Run `<compiler> --version` in a single shell, stopping at the first success. Returns the working one(s)."""
+        null = "nul" if self.system == "Windows" else "/dev/null"
+        script = " || ".join(f"({c} --version >{null} 2>&1 && echo {c})" for c in compilers)
+        try:
+            result = subprocess.run(script, shell=True, capture_output=True, text=True, timeout=5,
+                                    env=os.environ.copy())
+        except subprocess.TimeoutExpired:
+            return set()
+        return {line.strip() for line in result.stdout.splitlines()} & set(compilers)
+
     def check_vcpkg(self) -> bool:
         """Check VCPKG_ROOT configuration."""
         vcpkg_root = os.environ.get("VCPKG_ROOT")
 
         if not vcpkg_root:
-            print("ℹ VCPKG_ROOT not set (vcpkg not configured)")
+            self._print(f"{MARK_INFO} VCPKG_ROOT not set (vcpkg not configured)")
             return True  # Not an error
 
-        # Check existence
-        vcpkg_path = Path(vcpkg_root)
-        if not vcpkg_path.exists():
-            self.warnings.append(
+        # Check existence (single stat, reused for the type check)
+        try:
+            st = os.stat(vcpkg_root)
+        except OSError:
+            self._add_warning(
                 f"VCPKG_ROOT points to non-existent path: {vcpkg_root}"
             )
-            print(f"⚠ VCPKG_ROOT path doesn't exist: {vcpkg_root}")
+            self._print(f"{MARK_WARN} VCPKG_ROOT path doesn't exist: {vcpkg_root}")
+            return False
+
+        if not stat.S_ISDIR(st.st_mode):
+            self._add_warning(f"VCPKG_ROOT is not a directory: {vcpkg_root}")
+            self._print(f"{MARK_WARN} VCPKG_ROOT is not a directory: {vcpkg_root}")
             return False
 
         # Check path length (Windows)
-        if platform.system() == "Windows":
-            path_len = len(str(vcpkg_path))
+        if self.system == "Windows":
+            path_len = len(str(Path(vcpkg_root)))
             if path_len > 200:
-                self.warnings.append(
+                self._add_warning(
                     f"VCPKG_ROOT path is long ({path_len} chars). May cause MAX_PATH issues."
                 )
-                print(f"⚠ VCPKG_ROOT path: {path_len} characters (recommend <200)")
+                self._print(f"{MARK_WARN} VCPKG_ROOT path: {path_len} characters (recommend <200)")
             else:
-                print(f"✓ VCPKG_ROOT: {vcpkg_root} ({path_len} chars)")
+                self._print(f"{MARK_OK} VCPKG_ROOT: {vcpkg_root} ({path_len} chars)")
         else:
-            print(f"✓ VCPKG_ROOT: {vcpkg_root}")
+            self._print(f"{MARK_OK} VCPKG_ROOT: {vcpkg_root}")
 
         return True
 
     def check_windows_long_paths(self) -> bool:
         """Check if Windows long path support is enabled."""
-        if platform.system() != "Windows":
+        if self.system != "Windows":
             return True  # Not applicable
 
+        if self._cache.get("long_paths_enabled"):
+            self._print(f"{MARK_OK} Windows long paths enabled")
+            return True
+
+        try:
+            enabled = self._query_long_paths()
+        except Exception:
+            self._add_warning("Could not check Windows long path setting")
+            return True  # Don't fail, just warn
+
+        if enabled:
+            self._print(f"{MARK_OK} Windows long paths enabled")
+            self._cache["long_paths_enabled"] = True
+            return True
+
+        self._add_warning(
+            "Windows long paths not enabled (may cause MAX_PATH errors)"
+        )
+        self._print(f"{MARK_WARN} Windows long paths not enabled")
+
+        if self.auto_fix:
+            self._print(f"  {MARK_ARROW} Attempting to enable long paths...")
+            self.fix_windows_long_paths()
+
+        return False
+
+    def _query_long_paths(self) -> bool:
+        """Read LongPathsEnabled from the registry, via PowerShell only if access is denied."""
+        import winreg
+
         try:
+            with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, _FILESYSTEM_KEY) as key:
+                value, _ = winreg.QueryValueEx(key, "LongPathsEnabled")
+            return value == 1
+        except FileNotFoundError:
+            return False  # Value not present means disabled
+        except PermissionError:
             result = subprocess.run(
                 [
                     "powershell",
@@ -148,65 +373,38 @@ class EnvironmentValidator:
                 text=True,
                 timeout=5,
             )
-
-            if "LongPathsEnabled" in result.stdout and ": 1" in result.stdout:
-                print("✓ Windows long paths enabled")
-                return True
-            else:
-                self.warnings.append(
-                    "Windows long paths not enabled (may cause MAX_PATH errors)"
-                )
-                print("⚠ Windows long paths not enabled")
-
-                if self.auto_fix:
-                    print("  → Attempting to enable long paths...")
-                    self.fix_windows_long_paths()
-
-                return False
-        except (subprocess.TimeoutExpired, Exception):
-            self.warnings.append("Could not check Windows long path setting")
-            return True  # Don't fail, just warn
+            return "LongPathsEnabled" in result.stdout and ": 1" in result.stdout
 
     def fix_windows_long_paths(self) -> bool:
         """Enable Windows long path support (requires admin)."""
         try:
-            result = subprocess.run(
-                [
-                    "powershell",
-                    "-Command",
-                    'New-ItemProperty -Path "HKLM:\\SYSTEM\\CurrentControlSet\\Control\\FileSystem" '
-                    '-Name "LongPathsEnabled" -Value 1 -PropertyType DWORD -Force',
-                ],
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
+            import winreg
 
-            if result.returncode == 0:
-                print("  ✓ Long paths enabled (reboot required)")
-                return True
-            else:
-                print("  ❌ Failed (requires admin privileges)")
-                return False
+            with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, _FILESYSTEM_KEY,
+                                access=winreg.KEY_SET_VALUE) as key:
+                winreg.SetValueEx(key, "LongPathsEnabled", 0, winreg.REG_DWORD, 1)
+            self._print(f"  {MARK_OK} Long paths enabled (reboot required)")
+            return True
+        except PermissionError:
+            self._print(f"  {MARK_FAIL} Failed (requires admin privileges)")
+            return False
         except Exception as e:
-            print(f"  ❌ Error: {e}")
+            self._print(f"  {MARK_FAIL} Error: {e}")
             return False
 
     def check_disk_space(self) -> bool:
-        """Check available disk space (warn if <10GB)."""
+        """Check available disk space (warn if < 2x REQUIRED_GB)."""
         try:
-            import shutil
+            free_gb = _free_bytes(os.getcwd()) // (2**30)  # Convert to GB
+            recommended_gb = 2 * self.REQUIRED_GB
 
-            total, used, free = shutil.disk_usage(Path.cwd())
-            free_gb = free // (2**30)  # Convert to GB
-
-            if free_gb < 10:
-                self.warnings.append(
-                    f"Low disk space: {free_gb}GB available (recommend 10GB+)"
+            if free_gb < recommended_gb:
+                self._add_warning(
+                    f"Low disk space: {free_gb}GB available (recommend {recommended_gb}GB+)"
                 )
-                print(f"⚠ Disk space: {free_gb}GB available")
+                self._print(f"{MARK_WARN} Disk space: {free_gb}GB available")
             else:
-                print(f"✓ Disk space: {free_gb}GB available")
+                self._print(f"{MARK_OK} Disk space: {free_gb}GB available")
 
             return True
         except Exception:
@@ -214,7 +412,7 @@ class EnvironmentValidator:
 
     def validate_all(self) -> bool:
         """Run all validation checks."""
-        print("🔍 Validating C++ development environment...\n")
+        print(f"{MARK_SEARCH} Validating C++ development environment...\n")
 
         checks = [
             ("CMake", self.check_cmake),
@@ -223,36 +421,47 @@ class EnvironmentValidator:
             ("Disk Space", self.check_disk_space),
         ]
 
-        if platform.system() == "Windows":
+        if self.system == "Windows":
             checks.append(("Windows Long Paths", self.check_windows_long_paths))
 
+        # Checks are independent and mostly wait on subprocesses; run them together
+        # and report in submission order so the log stays deterministic.
+        with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+            futures = [(name, executor.submit(self._run_check, check_func))
+                       for name, check_func in checks]
+
         all_passed = True
-        for name, check_func in checks:
-            try:
-                result = check_func()
-                if not result and name in ["CMake"]:  # Critical checks
-                    all_passed = False
-            except Exception as e:
-                print(f"❌ {name} check failed: {e}")
+        for name, future in futures:
+            result, error, out, issues, warnings = future.result()
+            for line in out:
+                print(line)
+            self.issues.extend(issues)
+            self.warnings.extend(warnings)
+            if error is not None:
+                print(f"{MARK_FAIL} {name} check failed: {error}")
                 all_passed = False
+            elif not result and name in ["CMake"]:  # Critical checks
+                all_passed = False
+
+        self._save_cache()
 
         print("\n" + "=" * 50)
 
         if self.issues:
-            print("\n❌ Critical Issues:")
+            print(f"\n{MARK_FAIL} Critical Issues:")
             for issue in self.issues:
-                print(f"  • {issue}")
+                print(f"  {MARK_BULLET} {issue}")
 
         if self.warnings:
-            print("\n⚠ Warnings:")
+            print(f"\n{MARK_WARN} Warnings:")
             for warning in self.warnings:
-                print(f"  • {warning}")
+                print(f"  {MARK_BULLET} {warning}")
 
         if all_passed and not self.issues:
-            print("\n✅ Environment ready for C++ development")
+            print(f"\n{MARK_DONE} Environment ready for C++ development")
             return True
         else:
-            print("\n❌ Environment validation failed")
+            print(f"\n{MARK_FAIL} Environment validation failed")
             print("\nRecommended actions:")
             if "CMake" in str(self.issues):
                 print("  1. Install CMake 3.15+: https://cmake.org/download/")
@@ -271,10 +480,13 @@ def main():
     parser.add_argument(
         "--fix", action="store_true", help="Attempt to auto-fix issues (may require admin)"
     )
+    parser.add_argument(
+        "--no-cache", action="store_true", help="Ignore and don't update cached check results"
+    )
 
     args = parser.parse_args()
 
-    validator = EnvironmentValidator(auto_fix=args.fix)
+    validator = EnvironmentValidator(auto_fix=args.fix, use_cache=not args.no_cache)
     success = validator.validate_all()
 
     return 0 if success else 1
@@ -21,10 +21,9 @@ from pathlib import Path
 import argparse
 
 
-def create_minimal_cmake(project_name):
-    """Generate minimal CMakeLists.txt"""
-    return f"""cmake_minimum_required(VERSION 3.15)
-project({project_name} VERSION 1.0.0 LANGUAGES CXX)
+# Scaffold templates, rendered with str.format_map (literal braces are doubled)
+_CMAKE_TEMPLATE = """cmake_minimum_required(VERSION 3.15)
+project({name} VERSION 1.0.0 LANGUAGES CXX)
 
 set(CMAKE_CXX_STANDARD 17)
 set(CMAKE_CXX_STANDARD_REQUIRED ON)
@@ -40,36 +39,15 @@ target_compile_options(${{PROJECT_NAME}} PRIVATE
 enable_testing()
 """
 
+_MAIN_CPP_TEMPLATE = """#include <iostream>
 
-def init_project(project_name):
-    """Initialize project structure"""
-    project_dir = Path(project_name)
-    if project_dir.exists():
-        print(f"ERROR: Directory {project_name} already exists")
-        return False
-    
-    # Create directories
-    project_dir.mkdir()
-    (project_dir / "src").mkdir()
-    (project_dir / "include").mkdir()
-    (project_dir / "tests").mkdir()
-    
-    # Create CMakeLists.txt
-    cmake_content = create_minimal_cmake(project_name)
-    (project_dir / "CMakeLists.txt").write_text(cmake_content)
-    
-    # Create main.cpp
-    main_cpp = """#include <iostream>
-
-int main() {
-    std::cout << "Hello from """ + project_name + """!\" << std::endl;
+int main() {{
+    std::cout << "Hello from {name}!" << std::endl;
     return 0;
-}
+}}
 """
-    (project_dir / "src" / "main.cpp").write_text(main_cpp)
-    
-    # Create README
-    readme = f"""# {project_name}
+
+_README_TEMPLATE = """# {name}
 
 Modern CMake project.
 
@@ -83,19 +61,45 @@ cmake --build build
 ## Running
 
 ```bash
-./build/{project_name}
+./build/{name}
 ```
 """
-    (project_dir / "README.md").write_text(readme)
-    
-    # Create .gitignore
-    gitignore = """build/
+
+_GITIGNORE = """build/
 cmake-build-*/
 .vscode/
 .idea/
 *.swp
 """
-    (project_dir / ".gitignore").write_text(gitignore)
+
+
+def create_minimal_cmake(project_name):
+    """Generate minimal CMakeLists.txt"""
+    return _CMAKE_TEMPLATE.format_map({"name": project_name})
+
+
+def init_project(project_name):
+    """Initialize project structure"""
+    project_dir = Path(project_name)
+    if project_dir.exists():
+        print(f"ERROR: Directory {project_name} already exists")
+        return False
+    
+    # Create directories
+    project_dir.mkdir()
+    for subdir in ("src", "include", "tests"):
+        (project_dir / subdir).mkdir()
+    
+    # CMakeLists.txt, main.cpp, README, .gitignore - written in one pass
+    fields = {"name": project_name}
+    files = {
+        "CMakeLists.txt": create_minimal_cmake(project_name),
+        "src/main.cpp": _MAIN_CPP_TEMPLATE.format_map(fields),
+        "README.md": _README_TEMPLATE.format_map(fields),
+        ".gitignore": _GITIGNORE,
+    }
+    for relative_path, content in files.items():
+        (project_dir / relative_path).write_text(content)
     
     print(f"Created project: {project_name}")
     print(f"Directory structure created")
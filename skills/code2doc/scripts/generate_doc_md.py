@@ -12,6 +12,9 @@ import os
 from datetime import datetime
 from typing import Dict, List, Optional
 
+# 목차 앵커 변환표 (공백/슬래시 -> '-', 마침표/괄호 제거)
+_ANCHOR_TRANS = str.maketrans({" ": "-", ".": "", "/": "-", "(": "", ")": ""})
+
 class MarkdownDocGenerator:
     """Markdown 문서 생성기"""
     
@@ -43,28 +46,23 @@ class MarkdownDocGenerator:
         # Separator
         self.content.append("| " + " | ".join(["---"] * len(headers)) + " |")
         # Rows
-        for row in rows:
-            self.content.append("| " + " | ".join(row) + " |")
+        self.content.extend("| " + " | ".join(row) + " |" for row in rows)
         self.content.append("")
         
     def add_bullet_list(self, items: List[str], indent: int = 0):
         """글머리 기호 목록 추가"""
         prefix = "  " * indent + "- "
-        for item in items:
-            self.content.append(f"{prefix}{item}")
+        self.content.extend(f"{prefix}{item}" for item in items)
         self.content.append("")
         
     def add_numbered_list(self, items: List[str]):
         """번호 목록 추가"""
-        for i, item in enumerate(items, 1):
-            self.content.append(f"{i}. {item}")
+        self.content.extend(f"{i}. {item}" for i, item in enumerate(items, 1))
         self.content.append("")
         
     def add_blockquote(self, text: str):
         """인용문 추가"""
-        lines = text.split('\n')
-        for line in lines:
-            self.content.append(f"> {line}")
+        self.content.extend(f"> {line}" for line in text.splitlines())
         self.content.append("")
         
     def add_horizontal_rule(self):
@@ -74,9 +72,10 @@ class MarkdownDocGenerator:
     def add_toc(self, sections: List[str]):
         """목차 추가"""
         self.add_title("Table of Contents", 2)
-        for section in sections:
-            anchor = section.lower().replace(" ", "-").replace(".", "")
-            self.content.append(f"- [{section}](#{anchor})")
+        self.content.extend(
+            f"- [{section}](#{section.lower().translate(_ANCHOR_TRANS)})"
+            for section in sections
+        )
         self.content.append("")
         
     def generate_header(self):
@@ -187,8 +186,11 @@ class MarkdownDocGenerator:
             
         filepath = os.path.join(self.output_dir, filename)
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(self.content))
+        # 전체 문자열을 만들지 않고 줄 단위로 버퍼링하여 기록
+        with open(filepath, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            lines = iter(self.content)
+            f.write(next(lines, ""))
+            f.writelines("\n" + line for line in lines)
             
         return filepath
         
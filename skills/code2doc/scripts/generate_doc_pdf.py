@@ -17,21 +17,22 @@ Dependencies:
     pip install reportlab --break-system-packages
 """
 
+import io
 import os
+import copy
+import itertools
+from collections import deque
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
-
-from reportlab.lib.pagesizes import A4
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import cm, mm
-from reportlab.platypus import (
-    SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, 
-    PageBreak, Preformatted, KeepTogether
-)
-from reportlab.lib.colors import HexColor, black, white, grey
-from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
+from functools import lru_cache, partial
+from xml.sax.saxutils import escape
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# 표지에 넣는 생성 날짜 (프로세스당 1회 계산)
+_TODAY_STR = datetime.now().strftime("%Y-%m-%d")
+
+# reportlab은 import 비용이 크므로 실제로 PDF를 만드는 함수 안에서 지연 import
+if TYPE_CHECKING:
+    from reportlab.platypus import Table
 
 # =============================================================================
 # 폰트 설정
@@ -42,10 +43,26 @@ FONT_PATHS = {
     'mono': '/usr/share/fonts/truetype/dejavu/DejaVuSansMono.ttf',
 }
 
-for name, path in FONT_PATHS.items():
-    if os.path.exists(path):
+
+@lru_cache(maxsize=None)
+def _font_available(path: str) -> bool:
+    """폰트 파일 존재 여부 (경로별 1회 확인)"""
+    return os.path.exists(path)
+
+
+@lru_cache(maxsize=1)
+def _ensure_fonts():
+    """문서 폰트 등록 (프로세스당 1회)"""
+    from reportlab.pdfbase import pdfmetrics
+    from reportlab.pdfbase.ttfonts import TTFont
+    
+    for name, path in FONT_PATHS.items():
         font_name = f'DocFont_{name}'
-        pdfmetrics.registerFont(TTFont(font_name, path))
+        try:
+            pdfmetrics.getFont(font_name)  # 이미 등록됨
+        except KeyError:
+            if _font_available(path):
+                pdfmetrics.registerFont(TTFont(font_name, path))
 
 FONT_MAIN = 'DocFont_main'
 FONT_BOLD = 'DocFont_bold'
@@ -54,18 +71,47 @@ FONT_MONO = 'DocFont_mono'
 # =============================================================================
 # 색상 팔레트
 # =============================================================================
-COLORS = {
-    'primary': HexColor('#1a365d'),
-    'secondary': HexColor('#2c5282'),
-    'accent': HexColor('#3182ce'),
-    'text': HexColor('#2d3748'),
-    'light_text': HexColor('#718096'),
-    'bg_light': HexColor('#f7fafc'),
-    'border': HexColor('#cbd5e0'),
-    'success': HexColor('#38a169'),
-    'warning': HexColor('#dd6b20'),
+COLOR_HEX = {
+    'primary': '#1a365d',
+    'secondary': '#2c5282',
+    'accent': '#3182ce',
+    'text': '#2d3748',
+    'light_text': '#718096',
+    'bg_light': '#f7fafc',
+    'border': '#cbd5e0',
+    'success': '#38a169',
+    'warning': '#dd6b20',
 }
 
+
+@lru_cache(maxsize=1)
+def get_colors() -> Dict:
+    """색상 팔레트를 reportlab Color 객체로 변환 (1회 생성 후 공유)"""
+    from reportlab.lib.colors import HexColor
+    return {key: HexColor(value) for key, value in COLOR_HEX.items()}
+
+# =============================================================================
+# reportlab 실행 설정
+# =============================================================================
+@lru_cache(maxsize=1)
+def _configure_reportlab():
+    """C 가속 모듈 확인 및 빌드 중 불필요한 검사 비활성화 (프로세스당 1회)"""
+    from reportlab import rl_config
+    from reportlab.lib import rl_accel
+    
+    if rl_accel._py_funcs:
+        print("Warning: reportlab C accelerator not installed (slower text layout). "
+              "Run: pip install rl_accel --break-system-packages")
+    rl_config.shapeChecking = 0
+    rl_config.verbose = 0
+
+# =============================================================================
+# 페이지 설정 (reportlab.lib.units / pagesizes 값과 동일)
+# =============================================================================
+cm = 72.0 / 2.54
+mm = cm * 0.1
+A4 = (210 * mm, 297 * mm)
+
 PAGE_WIDTH, PAGE_HEIGHT = A4
 MARGIN = 2 * cm
 CONTENT_WIDTH = PAGE_WIDTH - 2 * MARGIN
@@ -76,21 +122,22 @@ CONTENT_WIDTH = PAGE_WIDTH - 2 * MARGIN
 # =============================================================================
 def add_page_number(canvas, doc):
     """페이지 번호와 헤더 추가"""
+    colors = get_colors()
     page_num = canvas.getPageNumber()
     canvas.saveState()
     
     # 페이지 번호 (하단 중앙)
     canvas.setFont(FONT_MAIN, 9)
-    canvas.setFillColor(COLORS['text'])
+    canvas.setFillColor(colors['text'])
     canvas.drawCentredString(PAGE_WIDTH / 2, 1.5 * cm, f"- {page_num} -")
     
     # 헤더 (2페이지부터)
     if page_num > 1:
         canvas.setFont(FONT_MAIN, 8)
-        canvas.setFillColor(COLORS['light_text'])
+        canvas.setFillColor(colors['light_text'])
         canvas.drawString(MARGIN, PAGE_HEIGHT - 1.2 * cm, 
                          f"{doc.project_name} - Technical Documentation")
-        canvas.setStrokeColor(COLORS['border'])
+        canvas.setStrokeColor(colors['border'])
         canvas.setLineWidth(0.5)
         canvas.line(MARGIN, PAGE_HEIGHT - 1.4 * cm, 
                    PAGE_WIDTH - MARGIN, PAGE_HEIGHT - 1.4 * cm)
@@ -101,8 +148,15 @@ def add_page_number(canvas, doc):
 # =============================================================================
 # 스타일 정의
 # =============================================================================
-def create_styles():
-    """문서 스타일 생성"""
+@lru_cache(maxsize=1)
+def _base_styles():
+    """문서 스타일 생성 (모듈 단위로 1회 생성 후 공유 - 수정하지 말 것)"""
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.colors import HexColor, white
+    from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY
+    
+    _ensure_fonts()
+    COLORS = get_colors()
     styles = getSampleStyleSheet()
     
     styles.add(ParagraphStyle(
@@ -165,6 +219,12 @@ def create_styles():
         textColor=COLORS['text'], spaceAfter=8, leading=16
     ))
     
+    # 목차 전체를 한 Paragraph로 배치할 때 사용 (TOCEntry의 leading + spaceAfter 간격)
+    styles.add(ParagraphStyle(
+        name='TOCBlock', fontName=FONT_MAIN, fontSize=11,
+        textColor=COLORS['text'], spaceAfter=8, leading=24
+    ))
+    
     styles.add(ParagraphStyle(
         name='AppendixTitle', fontName=FONT_BOLD, fontSize=14,
         textColor=COLORS['secondary'], spaceBefore=20, spaceAfter=12
@@ -173,30 +233,53 @@ def create_styles():
     return styles
 
 
+def create_styles():
+    """
+    문서 스타일시트 반환
+    
+    캐시된 스타일시트의 얕은 복사본 - 문서별로 styles.add()한 스타일은 다른 문서와
+    공유되지 않음 (기존 스타일 객체 자체는 공유되므로 속성을 바꾸지 말 것)
+    """
+    base = _base_styles()
+    styles = type(base)()  # StyleSheet1은 __getattr__ 때문에 copy.copy 사용 불가
+    styles.byName = dict(base.byName)
+    styles.byAlias = dict(base.byAlias)
+    return styles
+
+
+# =============================================================================
+# Paragraph 캐시
+# =============================================================================
+# 목차 한 줄 템플릿 (점선 리더를 미리 포함)
+_TOC_LINE = "{title} " + '.' * 50 + " {page}"
+
+
+@lru_cache(maxsize=2048)
+def _cached_paragraph(text: str, style_name: str):
+    """(텍스트, 스타일명)별로 마크업을 1회만 파싱한 원본 Paragraph (직접 배치하지 말 것)"""
+    from reportlab.platypus import Paragraph
+    return Paragraph(text, _base_styles()[style_name])
+
+
+def cached_paragraph(text: str, style_name: str):
+    """캐시된 Paragraph의 얕은 복사본 반환 (파싱 결과는 공유, 배치 상태는 분리)"""
+    return copy.copy(_cached_paragraph(text, style_name))
+
+
 # =============================================================================
 # 테이블 생성 헬퍼
 # =============================================================================
-def create_table(data: List[List[str]], col_widths: List[float], 
-                 header_bg=None) -> Table:
-    """
-    테이블 생성 - 컬럼 너비를 명시적으로 지정
+@lru_cache(maxsize=None)
+def _table_style(header_bg=None):
+    """헤더 배경색별 테이블 스타일 (1회 생성 후 공유 - setStyle은 명령을 읽기만 함)"""
+    from reportlab.platypus import TableStyle
+    from reportlab.lib.colors import white
     
-    Args:
-        data: 2D 리스트 (첫 행이 헤더)
-        col_widths: 각 컬럼의 너비 리스트 (cm 단위)
-        header_bg: 헤더 배경색
-    
-    Returns:
-        Table: 스타일이 적용된 테이블
-    """
+    COLORS = get_colors()
     if header_bg is None:
         header_bg = COLORS['primary']
     
-    # cm를 포인트로 변환
-    widths = [w * cm for w in col_widths]
-    
-    table = Table(data, colWidths=widths)
-    table.setStyle(TableStyle([
+    return TableStyle([
         # 헤더 스타일
         ('BACKGROUND', (0, 0), (-1, 0), header_bg),
         ('TEXTCOLOR', (0, 0), (-1, 0), white),
@@ -220,115 +303,229 @@ def create_table(data: List[List[str]], col_widths: List[float],
         
         # 줄무늬 배경
         ('ROWBACKGROUNDS', (0, 1), (-1, -1), [white, COLORS['bg_light']]),
-    ]))
+    ])
+
+
+def create_table(data: List[List[str]], col_widths: List[float], 
+                 header_bg=None) -> "Table":
+    """
+    테이블 생성 - 컬럼 너비를 명시적으로 지정
+    
+    Args:
+        data: 2D 리스트 (첫 행이 헤더)
+        col_widths: 각 컬럼의 너비 리스트 (cm 단위)
+        header_bg: 헤더 배경색
+    
+    Returns:
+        Table: 스타일이 적용된 테이블
+    """
+    from reportlab.platypus import Table
+    
+    # cm를 포인트로 변환
+    table = Table(data, colWidths=[w * cm for w in col_widths])
+    table.setStyle(_table_style(header_bg))
     return table
 
 
+# =============================================================================
+# 스트리밍 문서 템플릿
+# =============================================================================
+@lru_cache(maxsize=1)
+def streaming_doc_template():
+    """StreamingDocTemplate 클래스 반환 (BaseDocTemplate 상속을 위해 지연 정의)"""
+    from reportlab.platypus import BaseDocTemplate, Frame, PageTemplate
+    
+    class StreamingDocTemplate(BaseDocTemplate):
+        """
+        flowable을 이터레이터에서 조금씩 가져와 배치하는 문서 템플릿
+    
+        전체 story 대신 lookahead 개수만큼만 메모리에 유지 (대용량 문서의 peak 메모리 감소)
+        페이지 템플릿은 생성 시 1회만 만들고 build마다 재사용
+        (SimpleDocTemplate은 build마다 Frame/PageTemplate을 새로 추가함)
+        """
+        lookahead = 16
+        
+        def __init__(self, filename, on_page=None, **kwargs):
+            super().__init__(filename, **kwargs)
+            # SimpleDocTemplate과 같은 본문 프레임 (첫 페이지/이후 페이지 공통)
+            frame = Frame(self.leftMargin, self.bottomMargin, self.width, self.height, id='normal')
+            self.addPageTemplates([PageTemplate(id='main', frames=frame,
+                                                onPage=on_page or (lambda canvas, doc: None),
+                                                pagesize=self.pagesize)])
+    
+        def stream_build(self, source: Iterable, **kwargs):
+            """source에서 flowable을 순서대로 가져오며 문서 빌드"""
+            self._source = iter(source)
+            self._window: List = []
+            self._refill()
+            self.build(self._window, **kwargs)
+        
+        def _refill(self):
+            """처리 대기 목록을 lookahead 개수까지 채움"""
+            missing = self.lookahead - len(self._window)
+            if missing > 0:
+                self._window.extend(itertools.islice(self._source, missing))
+            
+        def handle_flowable(self, flowables):
+            super().handle_flowable(flowables)
+            # reportlab이 내부적으로 만드는 임시 목록(페이지 액션 등)은 채우지 않음
+            if flowables is self._window:
+                self._refill()
+    
+    return StreamingDocTemplate
+
+
 # =============================================================================
 # PDF 문서 생성기 클래스
 # =============================================================================
 class PDFDocGenerator:
     """PDF 문서 생성기"""
     
-    def __init__(self, project_name: str, output_dir: str = "/mnt/user-data/outputs"):
+    def __init__(self, project_name: str, output_dir: str = "/mnt/user-data/outputs",
+                 enable_paragraph_cache: bool = True):
         self.project_name = project_name
         self.output_dir = output_dir
         self.styles = create_styles()
-        self.story: List = []
+        # 같은 (텍스트, 스타일) Paragraph의 마크업 파싱 결과 재사용 (메모리가 중요하면 False)
+        self.enable_paragraph_cache = enable_paragraph_cache
+        self._doc = None
+        # 빌드된 PDF 바이트 (story는 빌드 중 소비되므로 save/save_to_bytes가 결과를 공유)
+        self._pdf_bytes: Optional[bytes] = None
+        # Flowable 또는 Flowable을 만드는 지연 생성자 (save 시점에 생성)
+        self.story: deque = deque()
+        
+    def _defer(self, factory, *args):
+        """Flowable 생성을 빌드 시점까지 지연하여 story에 추가"""
+        self.story.append(partial(factory, *args))
+        
+    def _doc_template(self):
+        """페이지 템플릿이 구성된 문서 템플릿 (생성기당 1회 생성 후 save마다 재사용)"""
+        if self._doc is None:
+            _configure_reportlab()
+            self._doc = streaming_doc_template()(
+                "",
+                on_page=add_page_number,
+                pagesize=A4,
+                rightMargin=MARGIN, leftMargin=MARGIN,
+                topMargin=2.5*cm, bottomMargin=2*cm
+            )
+        return self._doc
+        
+    def _paragraph_factory(self, style_name: str):
+        """텍스트를 받아 지연 Paragraph 생성자를 만드는 함수 반환"""
+        if self.enable_paragraph_cache:
+            return lambda text: partial(cached_paragraph, text, style_name)
+        from reportlab.platypus import Paragraph
+        style = self.styles[style_name]
+        return lambda text: partial(Paragraph, text, style)
+        
+    def _defer_paragraph(self, text: str, style_name: str):
+        """Paragraph 생성을 빌드 시점까지 지연하여 story에 추가"""
+        self.story.append(self._paragraph_factory(style_name)(text))
+        
+    def _iter_story(self) -> Iterator:
+        """story를 순서대로 꺼내며 지연 생성자를 Flowable로 변환하고 참조를 해제"""
+        from reportlab.platypus import Flowable
+        story, self.story = self.story, deque()
+        while story:
+            item = story.popleft()
+            yield item if isinstance(item, Flowable) else item()
         
     def add_cover(self, subtitle: str = "Technical Documentation", 
                   description: str = ""):
         """표지 추가"""
+        from reportlab.platypus import Spacer, PageBreak, Table, TableStyle
         self.story.append(Spacer(1, 2*cm))
         
         # 표지 배경
         cover_data = [['']]
         cover_table = Table(cover_data, colWidths=[CONTENT_WIDTH], rowHeights=[8*cm])
         cover_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, -1), COLORS['primary']),
+            ('BACKGROUND', (0, 0), (-1, -1), get_colors()['primary']),
             ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
             ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
         ]))
         self.story.append(cover_table)
         
         self.story.append(Spacer(1, -7*cm))
-        self.story.append(Paragraph(self.project_name, self.styles['DocTitle']))
-        self.story.append(Paragraph(subtitle, self.styles['DocSubtitle']))
+        self._defer_paragraph(self.project_name, 'DocTitle')
+        self._defer_paragraph(subtitle, 'DocSubtitle')
         
         if description:
-            self.story.append(Paragraph(description, self.styles['DocSubtitle']))
+            self._defer_paragraph(description, 'DocSubtitle')
             
         self.story.append(Spacer(1, 5*cm))
-        self.story.append(Paragraph(
-            datetime.now().strftime("%Y-%m-%d"), 
-            self.styles['Body']
-        ))
+        self._defer_paragraph(_TODAY_STR, 'Body')
         self.story.append(PageBreak())
         
     def add_toc(self, sections: List[Tuple[str, str]]):
         """목차 추가 (섹션명, 페이지번호)"""
-        self.story.append(Paragraph("Table of Contents", self.styles['ChapterTitle']))
+        from reportlab.platypus import Spacer, PageBreak
+        self._defer_paragraph("Table of Contents", 'ChapterTitle')
         self.story.append(Spacer(1, 0.5*cm))
         
-        for title, page in sections:
-            if title:
-                dots = '.' * 50
-                toc_text = f"{title} {dots} {page}"
-                self.story.append(Paragraph(toc_text, self.styles['TOCEntry']))
-            else:
-                self.story.append(Spacer(1, 0.3*cm))
-                
+        # 항목마다 Paragraph를 만들지 않고 <br/>로 이어 한 번만 파싱 (빈 항목은 빈 줄)
+        lines = [
+            _TOC_LINE.format(title=escape(title), page=escape(str(page))) if title else "&nbsp;"
+            for title, page in sections
+        ]
+        if lines:
+            self._defer_paragraph("<br/>".join(lines), 'TOCBlock')
         self.story.append(PageBreak())
         
     def add_chapter(self, title: str):
         """챕터 제목 추가"""
-        self.story.append(Paragraph(title, self.styles['ChapterTitle']))
+        self._defer_paragraph(title, 'ChapterTitle')
         
     def add_section(self, title: str):
         """섹션 제목 추가"""
-        self.story.append(Paragraph(title, self.styles['SectionTitle']))
+        self._defer_paragraph(title, 'SectionTitle')
         
     def add_subsection(self, title: str):
         """소섹션 제목 추가"""
-        self.story.append(Paragraph(title, self.styles['SubsectionTitle']))
+        self._defer_paragraph(title, 'SubsectionTitle')
         
     def add_paragraph(self, text: str):
         """본문 단락 추가"""
-        self.story.append(Paragraph(text, self.styles['Body']))
+        self._defer_paragraph(text, 'Body')
         
     def add_tip(self, text: str):
         """팁 박스 추가"""
-        self.story.append(Paragraph(text, self.styles['TipBox']))
+        self._defer_paragraph(text, 'TipBox')
         
     def add_warning(self, text: str):
         """경고 박스 추가"""
-        self.story.append(Paragraph(text, self.styles['WarningBox']))
+        self._defer_paragraph(text, 'WarningBox')
         
     def add_code(self, code: str):
         """코드 블록 추가"""
-        self.story.append(Preformatted(code, self.styles['CodeStyle']))
+        from reportlab.platypus import Preformatted
+        self._defer(Preformatted, code, self.styles['CodeStyle'])
         
     def add_bullet_list(self, items: List[str]):
         """글머리 기호 목록 추가"""
-        for item in items:
-            self.story.append(Paragraph(f"  *  {item}", self.styles['BodyIndent']))
+        bullet = self._paragraph_factory('BodyIndent')
+        self.story.extend(bullet(f"  *  {item}") for item in items)
             
     def add_table(self, data: List[List[str]], col_widths: List[float]):
         """테이블 추가"""
+        from reportlab.platypus import Spacer
         self.story.append(create_table(data, col_widths))
         self.story.append(Spacer(1, 0.3*cm))
         
     def add_page_break(self):
         """페이지 넘김"""
+        from reportlab.platypus import PageBreak
         self.story.append(PageBreak())
         
     def add_spacer(self, height_cm: float = 0.5):
         """여백 추가"""
+        from reportlab.platypus import Spacer
         self.story.append(Spacer(1, height_cm * cm))
         
     def add_appendix_title(self, title: str):
         """부록 제목 추가"""
-        self.story.append(Paragraph(title, self.styles['AppendixTitle']))
+        self._defer_paragraph(title, 'AppendixTitle')
         
     def save(self, filename: Optional[str] = None) -> str:
         """문서 저장"""
@@ -337,19 +534,68 @@ class PDFDocGenerator:
             
         filepath = os.path.join(self.output_dir, filename)
         
-        doc = SimpleDocTemplate(
-            filepath,
-            pagesize=A4,
-            rightMargin=MARGIN, leftMargin=MARGIN,
-            topMargin=2.5*cm, bottomMargin=2*cm
-        )
-        doc.project_name = self.project_name
+        with open(filepath, 'wb') as f:
+            f.write(self._build())
+        return filepath
         
-        doc.build(self.story, 
-                  onFirstPage=add_page_number, 
-                  onLaterPages=add_page_number)
+    def save_to_bytes(self) -> bytes:
+        """문서를 메모리에서 빌드하여 PDF 바이트 반환 (파일 저장 없이 전송 등에 사용)"""
+        return self._build()
         
-        return filepath
+    def _build(self) -> bytes:
+        """story를 한 번만 빌드하고 결과 바이트를 재사용 (save 후 save_to_bytes 호출 등)"""
+        if self._pdf_bytes is not None:
+            if self.story:
+                raise RuntimeError(
+                    "Document was already built; content added after save() "
+                    "cannot be rendered")
+            return self._pdf_bytes
+            
+        buf = io.BytesIO()
+        doc = self._doc_template()
+        doc.filename = buf
+        doc.project_name = self.project_name
+        doc.stream_build(self._iter_story())
+        self._pdf_bytes = buf.getvalue()
+        return self._pdf_bytes
+
+
+# =============================================================================
+# 일괄 생성 (문서별 프로세스 병렬 처리)
+# =============================================================================
+def _build_from_spec(spec: Dict) -> str:
+    """
+    spec으로 문서를 다시 구성하여 저장 (워커 프로세스에서 실행)
+    
+    spec 형식:
+        {"project_name": str, "output_dir": str (선택), "filename": str (선택),
+         "calls": [("add_chapter", {"title": "1. Intro"}), ...]}
+    """
+    doc = PDFDocGenerator(spec["project_name"],
+                          spec.get("output_dir", "/mnt/user-data/outputs"))
+    for method, kwargs in spec.get("calls", ()):
+        if not method.startswith("add_"):
+            raise ValueError(f"Unsupported call in spec: {method}")
+        getattr(doc, method)(**kwargs)
+    return doc.save(spec.get("filename"))
+
+
+def build_many(project_specs: List[Dict], workers: Optional[int] = None) -> List[str]:
+    """
+    여러 PDF 문서를 프로세스 풀에서 병렬 생성
+    
+    각 문서는 독립적이므로 spec(문자열/리스트만 포함)을 워커로 보내 다시 구성함
+    (스타일은 워커마다 create_styles()로 새로 생성)
+    
+    Returns:
+        List[str]: spec 순서대로 저장된 파일 경로
+    """
+    if len(project_specs) <= 1 or workers == 1:
+        return [_build_from_spec(spec) for spec in project_specs]
+    
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_build_from_spec, project_specs))
 
 
 # =============================================================================
@@ -425,10 +671,20 @@ if __name__ == "__main__":
     parser.add_argument("--project", default="Project", help="Project name")
     parser.add_argument("--output", default="/mnt/user-data/outputs", help="Output directory")
     parser.add_argument("--example", action="store_true", help="Generate example document")
+    parser.add_argument("--batch", help="JSON file with a list of document specs to build in parallel")
+    parser.add_argument("--workers", type=int, help="Worker processes for --batch (default: CPU count)")
     
     args = parser.parse_args()
     
-    if args.example:
+    if args.batch:
+        import json
+        with open(args.batch, encoding="utf-8") as f:
+            specs = json.load(f)
+        for spec in specs:
+            spec.setdefault("output_dir", args.output)
+        for filepath in build_many(specs, args.workers):
+            print(f"PDF saved: {filepath}")
+    elif args.example:
         example_usage()
     else:
         print(f"Creating template for: {args.project}")
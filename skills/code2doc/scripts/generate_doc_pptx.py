@@ -11,40 +11,140 @@ Dependencies:
     pip install python-pptx --break-system-packages
 """
 
+import io
 import os
+import copy
+import hashlib
+import importlib.util
+import re
+import zipfile
+from collections import Counter
 from datetime import datetime
+from xml.sax.saxutils import escape
 from typing import Dict, List, Optional, Tuple
 
-try:
+# python-pptx(+lxml)는 import 비용이 크므로 설치 여부만 확인하고
+# 실제 import는 첫 PowerPointDocGenerator 생성 시 _import_pptx()에서 수행
+PPTX_AVAILABLE = importlib.util.find_spec("pptx") is not None
+if not PPTX_AVAILABLE:
+    print("Warning: python-pptx not installed. Run: pip install python-pptx --break-system-packages")
+
+
+def _import_pptx():
+    """python-pptx 모듈을 전역 이름으로 불러옴 (이미 불러왔으면 아무것도 하지 않음)"""
+    global Presentation, Inches, Pt, RGBColor, PP_ALIGN, MSO_ANCHOR, MSO_AUTO_SIZE
+    global MSO_SHAPE, parse_xml, nsdecls
+    if "Presentation" in globals():
+        return
     from pptx import Presentation
     from pptx.util import Inches, Pt
-    from pptx.dml.color import RgbColor
-    from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
+    from pptx.dml.color import RGBColor
+    from pptx.enum.text import PP_ALIGN, MSO_ANCHOR, MSO_AUTO_SIZE
     from pptx.enum.shapes import MSO_SHAPE
-    PPTX_AVAILABLE = True
-except ImportError:
-    PPTX_AVAILABLE = False
-    print("Warning: python-pptx not installed. Run: pip install python-pptx --break-system-packages")
+    from pptx.oxml import parse_xml
+    from pptx.oxml.ns import nsdecls
+
+# 표지에 넣는 생성 날짜 (프로세스당 1회 계산)
+_TODAY_STR = datetime.now().strftime("%Y-%m-%d")
+
+
+# =============================================================================
+# 테이블 셀 XML 템플릿 (python-pptx가 셀 단위 설정으로 만드는 구조와 동일)
+# =============================================================================
+_TC_TEMPLATE = '<a:tc><a:txBody><a:bodyPr/><a:lstStyle/>{paragraphs}</a:txBody>{tc_pr}</a:tc>'
+_TC_EMPTY = '<a:tc><a:txBody><a:bodyPr/><a:lstStyle/><a:p/></a:txBody><a:tcPr/></a:tc>'
+_P_FIRST_TEMPLATE = ('<a:p><a:pPr><a:defRPr {r_attrs}><a:solidFill><a:srgbClr val="{color}"/>'
+                     '</a:solidFill></a:defRPr></a:pPr>{run}</a:p>')
+_TC_PR_FILL_TEMPLATE = '<a:tcPr><a:solidFill><a:srgbClr val="{fill}"/></a:solidFill></a:tcPr>'
+_TC_PR_EMPTY = '<a:tcPr/>'
+
+# 줄바꿈(\n) 외 제어 문자는 python-pptx의 변환 규칙(<a:br/>, _xHHHH_)을 그대로 따르도록 셀 API로 처리
+_SPECIAL_TEXT_RE = re.compile(r'[\x00-\x08\x0b-\x1f]')
+
+
+def _run_xml(text: str) -> str:
+    """텍스트 run XML (빈 문자열이면 run 없음)"""
+    return f'<a:r><a:t>{escape(text)}</a:t></a:r>' if text else ''
+
+
+def _cell_xml(text: str, r_attrs: str, color: str, fill: Optional[str]) -> str:
+    """셀 하나의 <a:tc> XML 조립 (첫 단락에만 글꼴 설정)"""
+    first, *rest = text.split('\n')
+    paragraphs = _P_FIRST_TEMPLATE.format(r_attrs=r_attrs, color=color, run=_run_xml(first))
+    paragraphs += ''.join(f'<a:p>{_run_xml(line)}</a:p>' for line in rest)
+    tc_pr = _TC_PR_FILL_TEMPLATE.format(fill=fill) if fill else _TC_PR_EMPTY
+    return _TC_TEMPLATE.format(paragraphs=paragraphs, tc_pr=tc_pr)
+
+
+# =============================================================================
+# 패키지 저장 (압축 수준 지정)
+# =============================================================================
+class _ZipPartWriter:
+    """python-pptx PackageWriter가 쓰는 write(pack_uri, blob) 인터페이스를 ZipFile에 연결"""
+    
+    def __init__(self, zipf: zipfile.ZipFile):
+        self._zipf = zipf
+        
+    def write(self, pack_uri, blob: bytes):
+        self._zipf.writestr(pack_uri.membername, blob)
+
+
+def _save_package(prs, pkg_file, compresslevel: int):
+    """python-pptx와 같은 구성으로 패키지를 쓰되 deflate 압축 수준만 지정"""
+    from pptx.opc.serialized import PackageWriter
+    
+    package = prs.part.package
+    writer = PackageWriter(pkg_file, package._rels, tuple(package.iter_parts()))
+    with zipfile.ZipFile(pkg_file, "w", compression=zipfile.ZIP_DEFLATED,
+                         compresslevel=compresslevel, strict_timestamps=False) as zipf:
+        out = _ZipPartWriter(zipf)
+        writer._write_content_types_stream(out)
+        writer._write_pkg_rels(out)
+        writer._write_parts(out)
 
 
 class PowerPointDocGenerator:
     """PowerPoint 문서 생성기"""
     
-    # 색상 팔레트
-    COLORS = {
-        'dark_blue': RgbColor(26, 54, 93),      # #1a365d
-        'light_blue': RgbColor(49, 130, 206),   # #3182ce
-        'white': RgbColor(255, 255, 255),
-        'light_gray': RgbColor(247, 250, 252),  # #f7fafc
-        'dark_gray': RgbColor(45, 55, 72),      # #2d3748
-        'accent_green': RgbColor(56, 161, 105), # #38a169
-        'accent_orange': RgbColor(221, 107, 32) # #dd6b20
+    # 색상 팔레트 (hex 문자열은 XML에 직접 쓰는 곳에서 사용)
+    COLORS_HEX = {
+        'dark_blue': '1A365D',
+        'light_blue': '3182CE',
+        'white': 'FFFFFF',
+        'light_gray': 'F7FAFC',
+        'dark_gray': '2D3748',
+        'accent_green': '38A169',
+        'accent_orange': 'DD6B20',
     }
     
+    # python-pptx 객체로 된 공유 값 - 첫 인스턴스 생성 시 _init_shared()가 채움
+    # COLORS: RGBColor 팔레트, 나머지: 자주 쓰는 위치/크기 (슬라이드마다 새로 만들지 않도록 공유)
+    COLORS: Dict = {}
+    FONT_SIZES: Dict = {}
+    LEFT_05 = WIDTH_FULL = HEIGHT_05 = HEIGHT_08 = HEIGHT_15 = None
+    CODE_MARGIN_X = CODE_MARGIN_Y = None
+    
+    @classmethod
+    def _init_shared(cls):
+        """python-pptx를 불러오고 클래스 공유 값 생성 (1회)"""
+        _import_pptx()
+        if cls.COLORS:
+            return
+        cls.COLORS = {name: RGBColor.from_string(value) for name, value in cls.COLORS_HEX.items()}
+        cls.LEFT_05 = Inches(0.5)
+        cls.WIDTH_FULL = Inches(12.333)
+        cls.HEIGHT_05 = Inches(0.5)
+        cls.HEIGHT_08 = Inches(0.8)
+        cls.HEIGHT_15 = Inches(1.5)
+        cls.CODE_MARGIN_X = Inches(0.3)
+        cls.CODE_MARGIN_Y = Inches(0.25)
+        cls.FONT_SIZES = {size: Pt(size) for size in (12, 14, 16, 18, 20, 24, 28, 36, 54, 72)}
+    
     def __init__(self, project_name: str, output_dir: str = "/mnt/user-data/outputs"):
         if not PPTX_AVAILABLE:
             raise ImportError("python-pptx is required. Install with: pip install python-pptx --break-system-packages")
             
+        self._init_shared()
         self.project_name = project_name
         self.output_dir = output_dir
         self.prs = Presentation()
@@ -53,10 +153,20 @@ class PowerPointDocGenerator:
         self.prs.slide_width = Inches(13.333)
         self.prs.slide_height = Inches(7.5)
         
+    def _pt(self, size: int):
+        """포인트 크기 반환 (자주 쓰는 크기는 공유 객체 사용)"""
+        return self.FONT_SIZES.get(size) or Pt(size)
+        
     def _get_blank_slide(self):
         """빈 슬라이드 레이아웃 반환"""
         return self.prs.slide_layouts[6]  # Blank layout
         
+    def _fill_background(self, slide, color):
+        """슬라이드 배경을 단색으로 채움 (도형을 추가하지 않음)"""
+        fill = slide.background.fill
+        fill.solid()
+        fill.fore_color.rgb = color
+        
     def _add_title_shape(self, slide, text: str, top: float = 0.5, 
                          font_size: int = 36, color=None):
         """제목 텍스트 박스 추가"""
@@ -64,14 +174,14 @@ class PowerPointDocGenerator:
             color = self.COLORS['dark_blue']
             
         shape = slide.shapes.add_textbox(
-            Inches(0.5), Inches(top),
-            Inches(12.333), Inches(0.8)
+            self.LEFT_05, Inches(top),
+            self.WIDTH_FULL, self.HEIGHT_08
         )
         tf = shape.text_frame
         tf.word_wrap = True
         p = tf.paragraphs[0]
         p.text = text
-        p.font.size = Pt(font_size)
+        p.font.size = self._pt(font_size)
         p.font.bold = True
         p.font.color.rgb = color
         return shape
@@ -88,7 +198,7 @@ class PowerPointDocGenerator:
         tf.word_wrap = True
         p = tf.paragraphs[0]
         p.text = text
-        p.font.size = Pt(font_size)
+        p.font.size = self._pt(font_size)
         p.font.color.rgb = self.COLORS['dark_gray']
         return shape
         
@@ -103,42 +213,40 @@ class PowerPointDocGenerator:
         tf = shape.text_frame
         tf.word_wrap = True
         
+        # 항목마다 같은 값이므로 루프 밖에서 한 번만 준비
+        size = self._pt(font_size)
+        color = self.COLORS['dark_gray']
+        space = self.FONT_SIZES[12]
         for i, item in enumerate(items):
-            if i == 0:
-                p = tf.paragraphs[0]
-            else:
-                p = tf.add_paragraph()
+            p = tf.paragraphs[0] if i == 0 else tf.add_paragraph()
             p.text = f"• {item}"
-            p.font.size = Pt(font_size)
-            p.font.color.rgb = self.COLORS['dark_gray']
-            p.space_after = Pt(12)
+            p.font.size = size
+            p.font.color.rgb = color
+            p.space_after = space
             
         return shape
         
     def _add_code_box(self, slide, code: str, left: float = 0.5,
                       top: float = 1.5, width: float = 12.333,
                       height: float = 5.5):
-        """코드 박스 추가"""
-        # 배경 사각형
-        bg = slide.shapes.add_shape(
-            MSO_SHAPE.RECTANGLE,
+        """코드 박스 추가 (배경/테두리를 텍스트 상자 자체에 적용한 단일 도형)"""
+        shape = slide.shapes.add_textbox(
             Inches(left), Inches(top),
             Inches(width), Inches(height)
         )
-        bg.fill.solid()
-        bg.fill.fore_color.rgb = self.COLORS['light_gray']
-        bg.line.color.rgb = self.COLORS['light_blue']
+        shape.fill.solid()
+        shape.fill.fore_color.rgb = self.COLORS['light_gray']
+        shape.line.color.rgb = self.COLORS['light_blue']
         
-        # 코드 텍스트
-        shape = slide.shapes.add_textbox(
-            Inches(left + 0.2), Inches(top + 0.2),
-            Inches(width - 0.4), Inches(height - 0.4)
-        )
+        # 상자 크기 고정, 텍스트 위치는 기존 배치(0.2in 안쪽 + 기본 여백)와 동일
         tf = shape.text_frame
+        tf.auto_size = MSO_AUTO_SIZE.NONE
+        tf.margin_left = tf.margin_right = self.CODE_MARGIN_X
+        tf.margin_top = tf.margin_bottom = self.CODE_MARGIN_Y
         tf.word_wrap = True
         p = tf.paragraphs[0]
         p.text = code
-        p.font.size = Pt(12)
+        p.font.size = self.FONT_SIZES[12]
         p.font.name = "Courier New"
         p.font.color.rgb = self.COLORS['dark_gray']
         
@@ -147,10 +255,9 @@ class PowerPointDocGenerator:
     def _add_table(self, slide, headers: List[str], rows: List[List[str]],
                    left: float = 0.5, top: float = 1.5,
                    width: float = 12.333, row_height: float = 0.5):
-        """테이블 추가"""
+        """테이블 추가 (셀 XML을 행 단위로 조립하여 한 번에 교체)"""
         num_rows = len(rows) + 1  # +1 for header
         num_cols = len(headers)
-        col_width = width / num_cols
         
         table = slide.shapes.add_table(
             num_rows, num_cols,
@@ -158,82 +265,97 @@ class PowerPointDocGenerator:
             Inches(width), Inches(row_height * num_rows)
         ).table
         
-        # 헤더 설정
-        for i, header in enumerate(headers):
-            cell = table.cell(0, i)
-            cell.text = header
-            cell.fill.solid()
-            cell.fill.fore_color.rgb = self.COLORS['dark_blue']
-            p = cell.text_frame.paragraphs[0]
-            p.font.bold = True
-            p.font.color.rgb = self.COLORS['white']
-            p.font.size = Pt(14)
+        # 헤더: 굵게/흰색/14pt + 진한 파랑 배경, 데이터: 12pt + 짝수 행 줄무늬 배경
+        header_style = ('b="1" sz="1400"', self.COLORS_HEX['white'], self.COLORS_HEX['dark_blue'])
+        body_color = self.COLORS_HEX['dark_gray']
+        stripe_fill = self.COLORS_HEX['light_gray']
+        
+        special_cells = []
+        tbl = table._tbl
+        for row_idx, (tr, values) in enumerate(zip(tbl.tr_lst, [headers, *rows])):
+            if len(values) > num_cols:
+                raise IndexError(f"row {row_idx} has {len(values)} values for {num_cols} columns")
+            if row_idx == 0:
+                r_attrs, color, fill = header_style
+            else:
+                r_attrs, color = 'sz="1200"', body_color
+                fill = stripe_fill if row_idx % 2 == 0 else None
+                
+            cells = []
+            for col_idx, value in enumerate(values):
+                text = str(value)
+                if _SPECIAL_TEXT_RE.search(text):
+                    special_cells.append((row_idx, col_idx, text))
+                    text = ''
+                cells.append(_cell_xml(text, r_attrs, color, fill))
+            cells.extend([_TC_EMPTY] * (num_cols - len(values)))
+            
+            tbl.replace(tr, parse_xml(
+                f'<a:tr {nsdecls("a")} h="{tr.get("h")}">{"".join(cells)}</a:tr>'
+            ))
             
-        # 데이터 행
-        for row_idx, row in enumerate(rows, 1):
-            for col_idx, value in enumerate(row):
-                cell = table.cell(row_idx, col_idx)
-                cell.text = str(value)
-                p = cell.text_frame.paragraphs[0]
-                p.font.size = Pt(12)
+        # 제어 문자가 포함된 셀은 python-pptx 텍스트 설정으로 처리 후 글꼴 재적용
+        for row_idx, col_idx, text in special_cells:
+            cell = table.cell(row_idx, col_idx)
+            cell.text = text
+            p = cell.text_frame.paragraphs[0]
+            if row_idx == 0:
+                p.font.bold = True
+                p.font.color.rgb = self.COLORS['white']
+                p.font.size = self.FONT_SIZES[14]
+            else:
+                p.font.size = self.FONT_SIZES[12]
                 p.font.color.rgb = self.COLORS['dark_gray']
-                
-                # 줄무늬 배경
-                if row_idx % 2 == 0:
-                    cell.fill.solid()
-                    cell.fill.fore_color.rgb = self.COLORS['light_gray']
                     
         return table
         
     def add_title_slide(self, subtitle: str = "Technical Documentation"):
         """표지 슬라이드 추가"""
         slide = self.prs.slides.add_slide(self._get_blank_slide())
+        shapes = slide.shapes
+        center = PP_ALIGN.CENTER
+        colors = self.COLORS
+        white, light_blue, dark_blue = colors['white'], colors['light_blue'], colors['dark_blue']
         
-        # 배경 색상
-        background = slide.shapes.add_shape(
-            MSO_SHAPE.RECTANGLE, 0, 0,
-            self.prs.slide_width, self.prs.slide_height
-        )
-        background.fill.solid()
-        background.fill.fore_color.rgb = self.COLORS['dark_blue']
-        background.line.fill.background()
+        # 배경 색상 (전체 크기 사각형 대신 슬라이드 배경 채우기)
+        self._fill_background(slide, dark_blue)
         
         # 메인 제목
-        title_box = slide.shapes.add_textbox(
-            Inches(0.5), Inches(2.5),
-            Inches(12.333), Inches(1.5)
+        title_box = shapes.add_textbox(
+            self.LEFT_05, Inches(2.5),
+            self.WIDTH_FULL, self.HEIGHT_15
         )
         tf = title_box.text_frame
         p = tf.paragraphs[0]
         p.text = self.project_name
-        p.font.size = Pt(54)
+        p.font.size = self.FONT_SIZES[54]
         p.font.bold = True
-        p.font.color.rgb = self.COLORS['white']
-        p.alignment = PP_ALIGN.CENTER
+        p.font.color.rgb = white
+        p.alignment = center
         
         # 부제목
-        subtitle_box = slide.shapes.add_textbox(
-            Inches(0.5), Inches(4),
-            Inches(12.333), Inches(0.8)
+        subtitle_box = shapes.add_textbox(
+            self.LEFT_05, Inches(4),
+            self.WIDTH_FULL, self.HEIGHT_08
         )
         tf = subtitle_box.text_frame
         p = tf.paragraphs[0]
         p.text = subtitle
-        p.font.size = Pt(28)
-        p.font.color.rgb = self.COLORS['light_blue']
-        p.alignment = PP_ALIGN.CENTER
+        p.font.size = self.FONT_SIZES[28]
+        p.font.color.rgb = light_blue
+        p.alignment = center
         
         # 날짜
-        date_box = slide.shapes.add_textbox(
-            Inches(0.5), Inches(6.5),
-            Inches(12.333), Inches(0.5)
+        date_box = shapes.add_textbox(
+            self.LEFT_05, Inches(6.5),
+            self.WIDTH_FULL, self.HEIGHT_05
         )
         tf = date_box.text_frame
         p = tf.paragraphs[0]
-        p.text = datetime.now().strftime("%Y-%m-%d")
-        p.font.size = Pt(18)
-        p.font.color.rgb = self.COLORS['white']
-        p.alignment = PP_ALIGN.CENTER
+        p.text = _TODAY_STR
+        p.font.size = self.FONT_SIZES[18]
+        p.font.color.rgb = white
+        p.alignment = center
         
         return slide
         
@@ -243,8 +365,6 @@ class PowerPointDocGenerator:
         self._add_title_shape(slide, "Table of Contents")
         
         # 목차 항목
-        items_text = "\n".join([f"{i+1}. {section}" for i, section in enumerate(sections)])
-        
         shape = slide.shapes.add_textbox(
             Inches(1), Inches(1.5),
             Inches(11), Inches(5.5)
@@ -252,15 +372,15 @@ class PowerPointDocGenerator:
         tf = shape.text_frame
         tf.word_wrap = True
         
+        size = self.FONT_SIZES[24]
+        color = self.COLORS['dark_gray']
+        space = self.FONT_SIZES[20]
         for i, section in enumerate(sections):
-            if i == 0:
-                p = tf.paragraphs[0]
-            else:
-                p = tf.add_paragraph()
+            p = tf.paragraphs[0] if i == 0 else tf.add_paragraph()
             p.text = f"{i+1}.  {section}"
-            p.font.size = Pt(24)
-            p.font.color.rgb = self.COLORS['dark_gray']
-            p.space_after = Pt(20)
+            p.font.size = size
+            p.font.color.rgb = color
+            p.space_after = space
             
         return slide
         
@@ -311,13 +431,13 @@ class PowerPointDocGenerator:
         
         # 왼쪽 열 제목
         left_title_shape = slide.shapes.add_textbox(
-            Inches(0.5), Inches(1.3),
-            Inches(6), Inches(0.5)
+            self.LEFT_05, Inches(1.3),
+            Inches(6), self.HEIGHT_05
         )
         tf = left_title_shape.text_frame
         p = tf.paragraphs[0]
         p.text = left_title
-        p.font.size = Pt(20)
+        p.font.size = self.FONT_SIZES[20]
         p.font.bold = True
         p.font.color.rgb = self.COLORS['light_blue']
         
@@ -328,12 +448,12 @@ class PowerPointDocGenerator:
         # 오른쪽 열 제목
         right_title_shape = slide.shapes.add_textbox(
             Inches(6.8), Inches(1.3),
-            Inches(6), Inches(0.5)
+            Inches(6), self.HEIGHT_05
         )
         tf = right_title_shape.text_frame
         p = tf.paragraphs[0]
         p.text = right_title
-        p.font.size = Pt(20)
+        p.font.size = self.FONT_SIZES[20]
         p.font.bold = True
         p.font.color.rgb = self.COLORS['light_blue']
         
@@ -346,51 +466,200 @@ class PowerPointDocGenerator:
     def add_qa_slide(self):
         """Q&A 슬라이드 추가"""
         slide = self.prs.slides.add_slide(self._get_blank_slide())
+        shapes = slide.shapes
+        center = PP_ALIGN.CENTER
+        colors = self.COLORS
+        white, light_blue, dark_blue = colors['white'], colors['light_blue'], colors['dark_blue']
         
-        # 배경 색상
-        background = slide.shapes.add_shape(
-            MSO_SHAPE.RECTANGLE, 0, 0,
-            self.prs.slide_width, self.prs.slide_height
-        )
-        background.fill.solid()
-        background.fill.fore_color.rgb = self.COLORS['dark_blue']
-        background.line.fill.background()
+        # 배경 색상 (전체 크기 사각형 대신 슬라이드 배경 채우기)
+        self._fill_background(slide, dark_blue)
         
         # Q&A 텍스트
-        qa_box = slide.shapes.add_textbox(
-            Inches(0.5), Inches(3),
-            Inches(12.333), Inches(1.5)
+        qa_box = shapes.add_textbox(
+            self.LEFT_05, Inches(3),
+            self.WIDTH_FULL, self.HEIGHT_15
         )
         tf = qa_box.text_frame
         p = tf.paragraphs[0]
         p.text = "Q & A"
-        p.font.size = Pt(72)
+        p.font.size = self.FONT_SIZES[72]
         p.font.bold = True
-        p.font.color.rgb = self.COLORS['white']
-        p.alignment = PP_ALIGN.CENTER
+        p.font.color.rgb = white
+        p.alignment = center
         
         # 감사 메시지
-        thanks_box = slide.shapes.add_textbox(
-            Inches(0.5), Inches(5),
-            Inches(12.333), Inches(0.8)
+        thanks_box = shapes.add_textbox(
+            self.LEFT_05, Inches(5),
+            self.WIDTH_FULL, self.HEIGHT_08
         )
         tf = thanks_box.text_frame
         p = tf.paragraphs[0]
         p.text = "Thank you for your attention"
-        p.font.size = Pt(24)
-        p.font.color.rgb = self.COLORS['light_blue']
-        p.alignment = PP_ALIGN.CENTER
+        p.font.size = self.FONT_SIZES[24]
+        p.font.color.rgb = light_blue
+        p.alignment = center
         
         return slide
         
-    def save(self, filename: Optional[str] = None) -> str:
-        """프레젠테이션 저장"""
+    def promote_repeated_shapes(self, min_slides: int = 3) -> int:
+        """
+        여러 슬라이드에 똑같이 반복되는 도형을 전용 슬라이드 레이아웃으로 옮김
+        
+        min_slides개 이상의 슬라이드에 같은 XML(도형 id 제외)로 나타나는 도형을 찾아,
+        같은 조합을 쓰는 슬라이드끼리 빈 레이아웃을 복제한 레이아웃 하나를 공유하도록 함.
+        레이아웃 도형은 슬라이드 도형 뒤에 그려지므로 z-순서가 바뀔 수 있음.
+        관계(이미지, 링크 등)를 참조하는 도형은 옮기지 않음.
+        
+        Returns:
+            int: 슬라이드에서 제거된 도형 수
+        """
+        from lxml import etree
+        from pptx.opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
+        from pptx.oxml.ns import qn
+        from pptx.parts.slide import SlideLayoutPart
+        
+        def shape_key(sp) -> bytes:
+            el = copy.deepcopy(sp)
+            for c_nv_pr in el.iter(qn('p:cNvPr')):
+                c_nv_pr.set('id', '0')
+            return hashlib.blake2b(etree.tostring(el), digest_size=16).digest()
+        
+        # 슬라이드별 (키, 도형) 목록과 키가 나타나는 슬라이드 수
+        slide_entries = []
+        slide_counts = Counter()
+        for slide in self.prs.slides:
+            entries = [(shape_key(sp), sp) for sp in slide.shapes._spTree.iter_shape_elms()
+                       if not sp.xpath('.//@r:embed | .//@r:link | .//@r:id')]
+            slide_counts.update({key for key, _ in entries})
+            slide_entries.append((slide, entries))
+            
+        base_layout = self._get_blank_slide()
+        master_part = base_layout.slide_master.part
+        layout_id_lst = base_layout.slide_master._element.get_or_add_sldLayoutIdLst()
+        package = master_part.package
+        layouts: Dict[Tuple[bytes, ...], SlideLayoutPart] = {}
+        removed = 0
+        
+        for slide, entries in slide_entries:
+            promoted = [(key, sp) for key, sp in entries if slide_counts[key] >= min_slides]
+            if not promoted:
+                continue
+            combo = tuple(key for key, _ in promoted)
+            
+            layout_part = layouts.get(combo)
+            if layout_part is None:
+                layout_xml = copy.deepcopy(base_layout._element)
+                sp_tree = layout_xml.cSld.spTree
+                next_id = max((int(i) for i in sp_tree.xpath('.//p:cNvPr/@id')), default=1) + 1
+                for _, sp in promoted:
+                    shared = copy.deepcopy(sp)
+                    for c_nv_pr in shared.iter(qn('p:cNvPr')):
+                        c_nv_pr.set('id', str(next_id))
+                        next_id += 1
+                    sp_tree.append(shared)
+                layout_xml.cSld.set('name', f"Blank (shared shapes {len(layouts) + 1})")
+                
+                partname = package.next_partname('/ppt/slideLayouts/slideLayout%d.xml')
+                layout_part = SlideLayoutPart(partname, CT.PML_SLIDE_LAYOUT, package, layout_xml)
+                layout_part.relate_to(master_part, RT.SLIDE_MASTER)
+                r_id = master_part.relate_to(layout_part, RT.SLIDE_LAYOUT)
+                layout_id = max(int(e.get('id')) for e in layout_id_lst.sldLayoutId_lst) + 1
+                entry = layout_id_lst._add_sldLayoutId()
+                entry.set('id', str(layout_id))
+                entry.rId = r_id
+                layouts[combo] = layout_part
+                
+            # 슬라이드의 레이아웃 관계를 새 레이아웃으로 교체하고 옮긴 도형 제거
+            slide_part = slide.part
+            for r_id, rel in list(slide_part.rels.items()):
+                if rel.reltype == RT.SLIDE_LAYOUT:
+                    slide_part.drop_rel(r_id)
+            slide_part.relate_to(layout_part, RT.SLIDE_LAYOUT)
+            for _, sp in promoted:
+                sp.getparent().remove(sp)
+            removed += len(promoted)
+            
+        return removed
+        
+    def save(self, filename: Optional[str] = None,
+             compresslevel: Optional[int] = 1,
+             optimize_for_size: bool = False) -> str:
+        """
+        프레젠테이션 저장
+        
+        Args:
+            filename: 파일명 (기본: <project>_presentation.pptx)
+            compresslevel: deflate 압축 수준 (기본 1: 저장 속도 우선, 파일은 10~20% 커짐).
+                None이면 python-pptx 기본값(6)으로 저장
+            optimize_for_size: True면 저장 전 promote_repeated_shapes()로 반복 도형을 레이아웃으로 이동
+        """
         if filename is None:
             filename = f"{self.project_name.lower()}_presentation.pptx"
             
         filepath = os.path.join(self.output_dir, filename)
-        self.prs.save(filepath)
+        self._write(filepath, compresslevel, optimize_for_size)
         return filepath
+        
+    def save_to_bytes(self, compresslevel: Optional[int] = 1,
+                      optimize_for_size: bool = False) -> bytes:
+        """프레젠테이션을 메모리에 저장하여 .pptx 바이트 반환 (파일 저장 없이 전송 등에 사용)"""
+        buf = io.BytesIO()
+        self._write(buf, compresslevel, optimize_for_size)
+        return buf.getvalue()
+        
+    def _write(self, target, compresslevel: Optional[int], optimize_for_size: bool = False):
+        """target(파일 경로 또는 바이너리 파일 객체)에 패키지 기록"""
+        if optimize_for_size:
+            self.promote_repeated_shapes()
+        if compresslevel is None:
+            self.prs.save(target)
+            return
+            
+        try:
+            _save_package(self.prs, target, compresslevel)
+        except AttributeError:
+            # python-pptx 내부 구조가 다르면 기본 저장 방식 사용
+            if hasattr(target, "seek"):
+                target.seek(0)
+                target.truncate()
+            self.prs.save(target)
+
+
+# =============================================================================
+# 일괄 생성 (발표자료별 프로세스 병렬 처리)
+# =============================================================================
+def _build_from_spec(spec: Dict) -> str:
+    """
+    슬라이드 spec으로 발표자료를 다시 구성하여 저장 (워커 프로세스에서 실행)
+    
+    Presentation 객체는 pickle 비용이 크므로 슬라이드 spec만 전달받아 재구성
+    
+    spec 형식:
+        {"project_name": str, "output_dir": str (선택), "filename": str (선택),
+         "slides": [("add_title_slide", {}), ("add_content_slide", {"title": "...", "bullets": [...]}), ...]}
+    """
+    ppt = PowerPointDocGenerator(spec["project_name"],
+                                 spec.get("output_dir", "/mnt/user-data/outputs"))
+    for method, kwargs in spec.get("slides", ()):
+        if not method.startswith("add_"):
+            raise ValueError(f"Unsupported slide in spec: {method}")
+        getattr(ppt, method)(**kwargs)
+    return ppt.save(spec.get("filename"))
+
+
+def build_many(project_specs: List[Dict], workers: Optional[int] = None) -> List[str]:
+    """
+    여러 발표자료를 프로세스 풀에서 병렬 생성
+    
+    Returns:
+        List[str]: spec 순서대로 저장된 파일 경로
+    """
+    if len(project_specs) <= 1 or workers == 1:
+        return [_build_from_spec(spec) for spec in project_specs]
+    
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_build_from_spec, project_specs))
 
 
 # =============================================================================
@@ -509,10 +778,20 @@ if __name__ == "__main__":
     parser.add_argument("--project", default="Project", help="Project name")
     parser.add_argument("--output", default="/mnt/user-data/outputs", help="Output directory")
     parser.add_argument("--example", action="store_true", help="Generate example presentation")
+    parser.add_argument("--batch", help="JSON file with a list of presentation specs to build in parallel")
+    parser.add_argument("--workers", type=int, help="Worker processes for --batch (default: CPU count)")
     
     args = parser.parse_args()
     
-    if args.example:
+    if args.batch:
+        import json
+        with open(args.batch, encoding="utf-8") as f:
+            specs = json.load(f)
+        for spec in specs:
+            spec.setdefault("output_dir", args.output)
+        for filepath in build_many(specs, args.workers):
+            print(f"Presentation saved: {filepath}")
+    elif args.example:
         example_usage()
     else:
         print(f"Creating template for: {args.project}")
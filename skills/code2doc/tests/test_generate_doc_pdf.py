@@ -0,0 +1,44 @@
+"""PDFDocGenerator 저장 동작 테스트"""
+
+import io
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("reportlab")
+PdfReader = pytest.importorskip("pypdf").PdfReader
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "scripts"))
+
+from generate_doc_pdf import PDFDocGenerator  # noqa: E402
+
+
+def _make_doc(tmp_path) -> PDFDocGenerator:
+    doc = PDFDocGenerator("Sample Project", str(tmp_path))
+    doc.add_cover(description="For Junior Developers")
+    doc.add_chapter("1. Introduction")
+    doc.add_paragraph("This is a sample project documentation.")
+    return doc
+
+
+def test_save_then_save_to_bytes_returns_same_document(tmp_path):
+    doc = _make_doc(tmp_path)
+
+    filepath = doc.save()
+    data = doc.save_to_bytes()
+
+    saved_pages = len(PdfReader(filepath).pages)
+    assert saved_pages == 2
+    assert len(PdfReader(io.BytesIO(data)).pages) == saved_pages
+    with open(filepath, "rb") as f:
+        assert f.read() == data
+
+
+def test_content_added_after_build_raises(tmp_path):
+    doc = _make_doc(tmp_path)
+    doc.save_to_bytes()
+
+    doc.add_paragraph("Added too late")
+    with pytest.raises(RuntimeError):
+        doc.save()
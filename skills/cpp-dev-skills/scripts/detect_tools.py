@@ -5,314 +5,334 @@ C++ Development Tools Detector
 Detects available compilers, build tools, package managers, and code quality tools.
 """
 
+import argparse
+import hashlib
 import json
+import os
 import platform
 import re
+import shutil
 import subprocess
 import sys
-from typing import Dict, Optional, Tuple
+import time
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional, Pattern, Sequence, Tuple
+
+# Version patterns, compiled once
+_RE_SEMVER = re.compile(r'(\d+\.\d+\.\d+)')
+_RE_CLANG_VERSION = re.compile(r'version (\d+\.\d+\.\d+)')
+_RE_APPLE_VERSION = re.compile(r'version (\d+\.\d+)')
+_RE_CMAKE = re.compile(r'cmake version (\d+\.\d+\.\d+)')
+_RE_MAKE = re.compile(r'Make (\d+\.\d+)')
+_RE_CONAN = re.compile(r'Conan version (\d+\.\d+\.\d+)')
+
+# A version probe that takes longer than this is treated as a broken install
+PROBE_TIMEOUT = 2  # seconds
+
+
+@dataclass(frozen=True)
+class Probe:
+    """A `<exe> <args>` version probe and how to read its output."""
+    category: str
+    name: str
+    exe: str
+    regex: Optional[Pattern] = None             # None: the whole output is the version
+    args: Tuple[str, ...] = ("--version",)
+    required_text: str = ""                     # output must contain this
+    accept_text: str = ""                       # counts as found even on a non-zero exit
+    fallback_version: Optional[str] = None      # used when the regex doesn't match
+    os_name: Optional[str] = None               # only probe on this platform
+    fixed_path: Optional[str] = None            # reported instead of the resolved path
+
+    @property
+    def argv(self) -> Tuple[str, ...]:
+        return (self.exe, *self.args)
+
+
+class ToolInfo(NamedTuple):
+    """Report entry for one tool (unset fields are left out of the JSON output)."""
+    version: Optional[str] = None
+    root: Optional[str] = None
+    path: Optional[str] = None
+    status: str = ""
+
+    def to_dict(self) -> Dict[str, str]:
+        return {key: value for key, value in self._asdict().items() if value is not None}
+
+
+# Every probed tool, in report order
+PROBES = (
+    Probe('compilers', 'GCC', 'g++', _RE_SEMVER),
+    Probe('compilers', 'Clang', 'clang++', _RE_CLANG_VERSION),
+    Probe('compilers', 'MSVC', 'cl.exe', _RE_SEMVER, args=(), accept_text="Version",
+          os_name="Windows", fixed_path='cl.exe'),
+    Probe('compilers', 'Apple Clang', 'clang++', _RE_APPLE_VERSION, required_text="Apple"),
+    Probe('build_tools', 'CMake', 'cmake', _RE_CMAKE),
+    Probe('build_tools', 'Ninja', 'ninja'),
+    Probe('build_tools', 'Make', 'make', _RE_MAKE, fallback_version="Unknown"),
+    Probe('package_managers', 'Conan', 'conan', _RE_CONAN),
+    Probe('code_quality_tools', 'clang-format', 'clang-format', _RE_CLANG_VERSION),
+    Probe('code_quality_tools', 'clang-tidy', 'clang-tidy', _RE_CLANG_VERSION),
+)
+
+# Detection results are reused across runs until PATH or its directories change
+CACHE_DIR = Path.home() / ".cache" / "cpp-dev-skills"
+CACHE_MAX_AGE = 24 * 60 * 60  # seconds
 
 
 class ToolDetector:
     """Detect available C++ development tools."""
 
+    EMPTY_STATUS = {
+        'compilers': '❌ No compilers detected',
+        'build_tools': '❌ No build tools detected',
+        'package_managers': '❌ No package managers detected',
+        'code_quality_tools': '❌ No tools detected'
+    }
+
     def __init__(self):
         self.os_name = platform.system()
-        self.tools = {
+        self.tools: Dict[str, Dict[str, ToolInfo]] = {
             'compilers': {},
             'build_tools': {},
             'package_managers': {},
             'code_quality_tools': {}
         }
-
-    def run_command(self, cmd: str) -> Tuple[bool, str]:
-        """Run command and return (success, output)."""
+        self._cmd_cache: Dict[Tuple[str, ...], Tuple[bool, str, str]] = {}
+
+    def run_command(self, argv: Sequence[str]) -> Tuple[bool, str, str]:
+        """Run command and return (success, output, resolved executable path).
+
+        Results are cached per argv, so detectors sharing a probe
+        (e.g. Clang and Apple Clang) only spawn it once.
+        """
+        key = tuple(argv)
+        if key not in self._cmd_cache:
+            self._cmd_cache[key] = self._execute(argv)
+        return self._cmd_cache[key]
+
+    def _execute(self, argv: Sequence[str]) -> Tuple[bool, str, str]:
+        """Spawn the command without caching."""
+        path = shutil.which(argv[0])
+        if not path:
+            return False, "", ""
         try:
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True, timeout=5)
-            return result.returncode == 0, result.stdout.strip() + result.stderr.strip()
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            return False, ""
-
-    def detect_gcc(self) -> Optional[str]:
-        """Detect GCC compiler."""
-        success, output = self.run_command("g++ --version")
-        if success:
-            match = re.search(r'(\d+\.\d+\.\d+)', output)
-            if match:
-                return match.group(1)
-        return None
-
-    def detect_clang(self) -> Optional[str]:
-        """Detect Clang compiler."""
-        success, output = self.run_command("clang++ --version")
-        if success:
-            match = re.search(r'version (\d+\.\d+\.\d+)', output)
-            if match:
-                return match.group(1)
-        return None
-
-    def detect_msvc(self) -> Optional[str]:
-        """Detect MSVC compiler (Windows)."""
-        if self.os_name != "Windows":
+            result = subprocess.run([path, *argv[1:]], capture_output=True, text=True, timeout=PROBE_TIMEOUT)
+            return result.returncode == 0, result.stdout.strip() + result.stderr.strip(), path
+        except (subprocess.TimeoutExpired, OSError):
+            return False, "", path
+
+    def _probe_all(self, commands: List[Tuple[str, ...]]) -> None:
+        """Start every uncached probe at once, then reap them and store the results in the cache."""
+        procs = []
+        for argv in dict.fromkeys(commands):
+            if argv in self._cmd_cache:
+                continue
+            path = shutil.which(argv[0])
+            if not path:
+                self._cmd_cache[argv] = (False, "", "")
+                continue
+            try:
+                proc = subprocess.Popen([path, *argv[1:]], stdout=subprocess.PIPE,
+                                        stderr=subprocess.PIPE, text=True)
+            except OSError:
+                self._cmd_cache[argv] = (False, "", path)
+                continue
+            procs.append((argv, path, proc))
+
+        # The probes run side by side, so they share one deadline; the short floor
+        # still lets probes that already exited be drained after a slow one
+        deadline = time.monotonic() + PROBE_TIMEOUT
+        for argv, path, proc in procs:
+            try:
+                stdout, stderr = proc.communicate(timeout=max(0.1, deadline - time.monotonic()))
+            except subprocess.TimeoutExpired:
+                # Don't drain the pipes: a grandchild may still hold them open
+                proc.kill()
+                proc.wait()
+                proc.stdout.close()
+                proc.stderr.close()
+                self._cmd_cache[argv] = (False, "", path)
+                continue
+            self._cmd_cache[argv] = (proc.returncode == 0, stdout.strip() + stderr.strip(), path)
+
+    def _run_probe(self, probe: Probe) -> Optional[ToolInfo]:
+        """Run one registry probe and build its report entry."""
+        success, output, path = self.run_command(probe.argv)
+        if not (success or (probe.accept_text and probe.accept_text in output)):
             return None
-        success, output = self.run_command("cl.exe")
-        if success or "Version" in output:
-            match = re.search(r'(\d+\.\d+\.\d+)', output)
-            if match:
-                return match.group(1)
-        return None
+        if probe.required_text not in output:
+            return None
+        if probe.regex is None:
+            version = output.strip()
+        else:
+            match = probe.regex.search(output)
+            version = match.group(1) if match else probe.fallback_version
+        if version is None:
+            return None
+        return ToolInfo(version=version, path=probe.fixed_path or path, status='✅ Available')
 
-    def detect_apple_clang(self) -> Optional[str]:
-        """Detect Apple Clang compiler."""
-        success, output = self.run_command("clang++ --version")
-        if success and "Apple" in output:
-            match = re.search(r'version (\d+\.\d+)', output)
-            if match:
-                return match.group(1)
+    def detect_vcpkg(self) -> Optional[ToolInfo]:
+        """Detect vcpkg package manager."""
+        vcpkg_root = os.environ.get('VCPKG_ROOT')
+        if vcpkg_root:
+            return ToolInfo(root=vcpkg_root, path=vcpkg_root, status='✅ Available (VCPKG_ROOT set)')
         return None
 
+    def _detection_tasks(self) -> List[Tuple[str, str, Optional[Tuple[str, ...]], Callable[[], Optional[ToolInfo]]]]:
+        """Return (category, name, probe argv, detector) for every tool, in report order."""
+        tasks = [
+            (probe.category, probe.name, probe.argv, partial(self._run_probe, probe))
+            for probe in PROBES
+            if probe.os_name in (None, self.os_name)
+        ]
+        tasks.append(('package_managers', 'vcpkg', None, self.detect_vcpkg))
+        return tasks
+
+    def _run_detections(self, categories: Tuple[str, ...]) -> None:
+        """Probe the given categories concurrently, then parse and merge the results."""
+        tasks = [task for task in self._detection_tasks() if task[0] in categories]
+        self._probe_all([argv for _, _, argv, _ in tasks if argv])
+
+        # Every probe is cached now, so the detectors only parse output
+        for category in categories:
+            self.tools[category] = {}
+        for category, name, _, detect in tasks:
+            info = detect()
+            if info:
+                self.tools[category][name] = info
+        for category in categories:
+            if not self.tools[category]:
+                self.tools[category]['None'] = ToolInfo(status=self.EMPTY_STATUS[category])
+
     def detect_compilers(self) -> None:
         """Detect all installed compilers."""
-        compilers = {}
-
-        # GCC
-        gcc_version = self.detect_gcc()
-        if gcc_version:
-            compilers['GCC'] = {
-                'version': gcc_version,
-                'path': self._find_path('g++'),
-                'status': '✅ Available'
-            }
-
-        # Clang
-        clang_version = self.detect_clang()
-        if clang_version:
-            compilers['Clang'] = {
-                'version': clang_version,
-                'path': self._find_path('clang++'),
-                'status': '✅ Available'
-            }
-
-        # MSVC
-        msvc_version = self.detect_msvc()
-        if msvc_version:
-            compilers['MSVC'] = {
-                'version': msvc_version,
-                'path': 'cl.exe',
-                'status': '✅ Available'
-            }
-
-        # Apple Clang
-        apple_clang_version = self.detect_apple_clang()
-        if apple_clang_version:
-            compilers['Apple Clang'] = {
-                'version': apple_clang_version,
-                'path': self._find_path('clang++'),
-                'status': '✅ Available'
-            }
-
-        self.tools['compilers'] = compilers if compilers else {'None': {'status': '❌ No compilers detected'}}
-
-    def detect_cmake(self) -> None:
-        """Detect CMake."""
-        success, output = self.run_command("cmake --version")
-        if success:
-            match = re.search(r'cmake version (\d+\.\d+\.\d+)', output)
-            if match:
-                self.tools['build_tools']['CMake'] = {
-                    'version': match.group(1),
-                    'path': self._find_path('cmake'),
-                    'status': '✅ Available'
-                }
-
-    def detect_ninja(self) -> None:
-        """Detect Ninja build system."""
-        success, output = self.run_command("ninja --version")
-        if success:
-            self.tools['build_tools']['Ninja'] = {
-                'version': output.strip(),
-                'path': self._find_path('ninja'),
-                'status': '✅ Available'
-            }
-
-    def detect_make(self) -> None:
-        """Detect Make build tool."""
-        success, output = self.run_command("make --version")
-        if success:
-            match = re.search(r'Make (\d+\.\d+)', output)
-            version = match.group(1) if match else "Unknown"
-            self.tools['build_tools']['Make'] = {
-                'version': version,
-                'path': self._find_path('make'),
-                'status': '✅ Available'
-            }
+        self._run_detections(('compilers',))
 
     def detect_build_tools(self) -> None:
         """Detect build tools."""
-        self.detect_cmake()
-        self.detect_ninja()
-        self.detect_make()
-
-        if not self.tools['build_tools']:
-            self.tools['build_tools']['None'] = {'status': '❌ No build tools detected'}
-
-    def detect_conan(self) -> None:
-        """Detect Conan package manager."""
-        success, output = self.run_command("conan --version")
-        if success:
-            match = re.search(r'Conan version (\d+\.\d+\.\d+)', output)
-            if match:
-                self.tools['package_managers']['Conan'] = {
-                    'version': match.group(1),
-                    'path': self._find_path('conan'),
-                    'status': '✅ Available'
-                }
-
-    def detect_vcpkg(self) -> None:
-        """Detect vcpkg package manager."""
-        import os
-        vcpkg_root = os.environ.get('VCPKG_ROOT')
-        if vcpkg_root:
-            self.tools['package_managers']['vcpkg'] = {
-                'root': vcpkg_root,
-                'path': vcpkg_root,
-                'status': '✅ Available (VCPKG_ROOT set)'
-            }
+        self._run_detections(('build_tools',))
 
     def detect_package_managers(self) -> None:
         """Detect package managers."""
-        self.detect_conan()
-        self.detect_vcpkg()
-
-        if not self.tools['package_managers']:
-            self.tools['package_managers']['None'] = {'status': '❌ No package managers detected'}
-
-    def detect_clang_format(self) -> None:
-        """Detect clang-format."""
-        success, output = self.run_command("clang-format --version")
-        if success:
-            match = re.search(r'version (\d+\.\d+\.\d+)', output)
-            if match:
-                self.tools['code_quality_tools']['clang-format'] = {
-                    'version': match.group(1),
-                    'path': self._find_path('clang-format'),
-                    'status': '✅ Available'
-                }
-
-    def detect_clang_tidy(self) -> None:
-        """Detect clang-tidy."""
-        success, output = self.run_command("clang-tidy --version")
-        if success:
-            match = re.search(r'version (\d+\.\d+\.\d+)', output)
-            if match:
-                self.tools['code_quality_tools']['clang-tidy'] = {
-                    'version': match.group(1),
-                    'path': self._find_path('clang-tidy'),
-                    'status': '✅ Available'
-                }
+        self._run_detections(('package_managers',))
 
     def detect_code_quality_tools(self) -> None:
         """Detect code quality tools."""
-        self.detect_clang_format()
-        self.detect_clang_tidy()
+        self._run_detections(('code_quality_tools',))
 
-        if not self.tools['code_quality_tools']:
-            self.tools['code_quality_tools']['None'] = {'status': '❌ No tools detected'}
-
-    def detect_all(self) -> None:
-        """Detect all tools."""
+    def detect_all(self, use_cache: bool = True) -> None:
+        """Detect all tools, reusing a fresh on-disk result when the environment is unchanged."""
         print("🔍 Detecting C++ development tools...\n")
-        self.detect_compilers()
-        self.detect_build_tools()
-        self.detect_package_managers()
-        self.detect_code_quality_tools()
-
-    def _find_path(self, tool: str) -> str:
-        """Find tool path."""
+        cache_file = CACHE_DIR / f"{self._environment_key()}.json"
+        if use_cache and self._load_cache(cache_file):
+            return
+        self._run_detections(tuple(self.tools))
+        if use_cache:
+            self._save_cache(cache_file)
+
+    def _environment_key(self) -> str:
+        """Digest of everything the detection result depends on."""
+        search_path = os.environ.get('PATH', '')
+        parts = [search_path, self.os_name, os.environ.get('VCPKG_ROOT', '')]
+        for directory in search_path.split(os.pathsep):
+            try:
+                parts.append(str(os.stat(directory).st_mtime_ns))
+            except OSError:
+                continue
+        return hashlib.blake2b("|".join(parts).encode(), digest_size=16).hexdigest()
+
+    def _load_cache(self, cache_file: Path) -> bool:
+        """Load cached tools if the cache file is fresh. Returns True on hit."""
+        try:
+            if time.time() - cache_file.stat().st_mtime > CACHE_MAX_AGE:
+                return False
+            cached = json.loads(cache_file.read_text(encoding='utf-8'))
+            tools = {category: {name: ToolInfo(**info) for name, info in entries.items()}
+                     for category, entries in cached.items()}
+        except (OSError, ValueError, TypeError, AttributeError):
+            return False
+        if set(tools) != set(self.tools):
+            return False
+        self.tools = tools
+        return True
+
+    def _save_cache(self, cache_file: Path) -> None:
+        """Write the detection result to the cache (best effort)."""
         try:
-            result = subprocess.run(
-                f"which {tool}" if self.os_name != "Windows" else f"where {tool}",
-                shell=True,
-                capture_output=True,
-                text=True
-            )
-            return result.stdout.strip() if result.returncode == 0 else "Unknown"
-        except:
-            return "Unknown"
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            tmp_file.write_text(json.dumps(self.get_tools_dict()), encoding='utf-8')
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            pass
 
     def print_report(self) -> None:
         """Print human-readable report."""
-        print("=" * 60)
-        print("C++ Development Tools Report")
-        print("=" * 60)
-        print(f"\nPlatform: {self.os_name}")
-        print()
-
-        # Compilers
-        print("📦 Compilers:")
-        print("-" * 60)
-        for name, info in self.tools['compilers'].items():
-            if 'version' in info:
-                print(f"  {name:20} {info['status']:15} v{info['version']}")
-                print(f"  {'Path:':20} {info.get('path', 'N/A')}")
-            else:
-                print(f"  {info['status']}")
-
-        # Build Tools
-        print("\n🔨 Build Tools:")
-        print("-" * 60)
-        for name, info in self.tools['build_tools'].items():
-            if 'version' in info:
-                print(f"  {name:20} {info['status']:15} v{info['version']}")
-                print(f"  {'Path:':20} {info.get('path', 'N/A')}")
-            else:
-                print(f"  {info['status']}")
-
-        # Package Managers
-        print("\n📚 Package Managers:")
-        print("-" * 60)
-        for name, info in self.tools['package_managers'].items():
-            if 'version' in info:
-                print(f"  {name:20} {info['status']:15} v{info['version']}")
-            elif 'root' in info:
-                print(f"  {name:20} {info['status']}")
-                print(f"  {'Root:':20} {info['root']}")
-            else:
-                print(f"  {info['status']}")
-
-        # Code Quality Tools
-        print("\n✨ Code Quality Tools:")
-        print("-" * 60)
-        for name, info in self.tools['code_quality_tools'].items():
-            if 'version' in info:
-                print(f"  {name:20} {info['status']:15} v{info['version']}")
-                print(f"  {'Path:':20} {info.get('path', 'N/A')}")
-            else:
-                print(f"  {info['status']}")
-
-        print("\n" + "=" * 60)
+        lines = [
+            "=" * 60,
+            "C++ Development Tools Report",
+            "=" * 60,
+            f"\nPlatform: {self.os_name}",
+            ""
+        ]
+
+        sections = (
+            ("📦 Compilers:", 'compilers'),
+            ("\n🔨 Build Tools:", 'build_tools'),
+            ("\n📚 Package Managers:", 'package_managers'),
+            ("\n✨ Code Quality Tools:", 'code_quality_tools')
+        )
+        for heading, category in sections:
+            lines.append(heading)
+            lines.append("-" * 60)
+            for name, info in self.tools[category].items():
+                if info.version is not None:
+                    lines.append(f"  {name:20} {info.status:15} v{info.version}")
+                    # Package managers are listed without their path
+                    if category != 'package_managers':
+                        lines.append(f"  {'Path:':20} {info.path or 'N/A'}")
+                elif info.root is not None:
+                    lines.append(f"  {name:20} {info.status}")
+                    lines.append(f"  {'Root:':20} {info.root}")
+                else:
+                    lines.append(f"  {info.status}")
+
+        lines.append("\n" + "=" * 60)
+        sys.stdout.write("\n".join(lines) + "\n")
+
+    def has_compiler(self) -> bool:
+        """Return True if at least one compiler was detected."""
+        return any(info.version is not None for info in self.tools['compilers'].values())
+
+    def has_build_tool(self) -> bool:
+        """Return True if at least one build tool was detected."""
+        return any(info.version is not None for info in self.tools['build_tools'].values())
 
     def get_tools_dict(self) -> Dict:
         """Return tools as dictionary."""
-        return self.tools
+        return {category: {name: info.to_dict() for name, info in entries.items()}
+                for category, entries in self.tools.items()}
 
     def print_json(self) -> None:
         """Print report as JSON."""
-        print(json.dumps(self.tools, indent=2))
+        sys.stdout.write(json.dumps(self.get_tools_dict(), indent=2) + "\n")
 
 
-def main():
-    import argparse
+_PARSER = argparse.ArgumentParser(description="Detect C++ development tools")
+_PARSER.add_argument("--json", action="store_true", help="Output as JSON")
+_PARSER.add_argument("--check", choices=["compilers", "build-tools", "package-managers", "quality-tools"],
+                     help="Check specific category")
+_PARSER.add_argument("--no-cache", action="store_true", help="Ignore and do not update the detection cache")
 
-    parser = argparse.ArgumentParser(description="Detect C++ development tools")
-    parser.add_argument("--json", action="store_true", help="Output as JSON")
-    parser.add_argument("--check", choices=["compilers", "build-tools", "package-managers", "quality-tools"],
-                       help="Check specific category")
 
-    args = parser.parse_args()
+def main():
+    args = _PARSER.parse_args()
 
     detector = ToolDetector()
-    detector.detect_all()
+    detector.detect_all(use_cache=not args.no_cache)
 
     if args.json:
         detector.print_json()
@@ -320,12 +340,12 @@ def main():
         detector.print_report()
 
     # Exit with error if critical tools missing
-    if not detector.tools['compilers'] or "No compilers" in str(detector.tools['compilers']):
+    if not detector.has_compiler():
         print("\n⚠️  Warning: No C++ compiler detected!")
         print("Please install GCC, Clang, or MSVC to compile C++ projects.")
         return 1
 
-    if not detector.tools['build_tools'] or "No build tools" in str(detector.tools['build_tools']):
+    if not detector.has_build_tool():
         print("\n⚠️  Warning: No build tools detected!")
         print("Please install CMake to build C++ projects.")
         return 1
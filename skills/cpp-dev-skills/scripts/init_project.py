@@ -14,359 +14,150 @@ Platform-aware defaults:
 - macOS: Clang, Unix Makefiles/Ninja, Homebrew
 """
 
-import argparse
+import contextlib
+import functools
+import io
 import os
 import platform
 import shutil
-import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
 
+import project_templates as tmpl
 
-class ProjectTemplates:
-    """Generate templates for each project type."""
 
-    @staticmethod
-    def cli_application(project_name: str, cpp_standard: int = 17) -> Dict[str, str]:
-        """CLI Application templates."""
-        templates = {}
+class _PlatformProfile(NamedTuple):
+    """Recommended toolchain defaults for a platform."""
+    compiler: str
+    generator: str
+    package_manager: str
 
-        # CMakeLists.txt
-        templates['CMakeLists.txt'] = f"""cmake_minimum_required(VERSION 3.15)
-project({project_name} VERSION 1.0.0 LANGUAGES CXX)
 
-set(CMAKE_CXX_STANDARD {cpp_standard})
-set(CMAKE_CXX_STANDARD_REQUIRED ON)
-set(CMAKE_CXX_EXTENSIONS OFF)
+# Host platform and its defaults, resolved once at import
+_OS_NAME = {'Windows': 'Windows', 'Linux': 'Linux', 'Darwin': 'macOS'}.get(platform.system(), 'Unknown')
+_PROFILE = {
+    'Windows': _PlatformProfile('MSVC', 'Visual Studio 17 2022', 'vcpkg'),
+    'Linux': _PlatformProfile('GCC', 'Unix Makefiles', 'Conan'),
+    'macOS': _PlatformProfile('Clang', 'Unix Makefiles', 'Conan'),
+}.get(_OS_NAME, _PlatformProfile('GCC', 'Unix Makefiles', 'None'))
 
-# Main executable
-add_executable({project_name}
-    src/main.cpp
-)
 
-target_include_directories({project_name} PRIVATE include)
+class _Marks(NamedTuple):
+    """Status prefixes used in progress output."""
+    start: str
+    step: str
+    ok: str
+    error: str
 
-# Compiler warnings
-target_compile_options({project_name} PRIVATE
-    $<$<CXX_COMPILER_ID:MSVC>:/W4>
-    $<$<NOT:$<CXX_COMPILER_ID:MSVC>>:-Wall -Wextra -Wpedantic>
-)
 
-# Optional: Add find_package here
-# find_package(fmt REQUIRED)
-# target_link_libraries({project_name} PRIVATE fmt::fmt)
+# Emoji by default; plain ASCII with --quiet (avoids multibyte encoding on legacy consoles)
+_EMOJI_MARKS = _Marks('🔧', '→', '✅', '❌')
+_ASCII_MARKS = _Marks('*', '->', '[ok]', '[error]')
 
-# Testing
-enable_testing()
-add_subdirectory(tests)
-"""
 
-        # main.cpp
-        templates['src/main.cpp'] = f"""#include <iostream>
+def _dump(path: str, data: bytes) -> None:
+    """Write bytes to path with raw os calls (no text or buffering layer)."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
 
-int main(int argc, char* argv[]) {{
-    std::cout << "Hello from {project_name}!" << std::endl;
-    return 0;
-}}
-"""
 
-        # test_main.cpp
-        templates['tests/CMakeLists.txt'] = f"""# Simple test example
-# For Google Test, use: find_package(GTest REQUIRED)
-# add_executable(tests test_main.cpp)
-# target_link_libraries(tests PRIVATE GTest::Main)
-# add_test(NAME MainTests COMMAND tests)
-"""
+def _dump_all(jobs: List[Tuple[str, bytes]]) -> None:
+    """Write (path, data) pairs; batches of more than two go through a thread pool.
 
-        templates['tests/test_main.cpp'] = f"""#include <cassert>
+    Set CPPDEV_PARALLEL_WRITES=0 to force sequential writes.
+    """
+    if len(jobs) <= 2 or os.environ.get('CPPDEV_PARALLEL_WRITES') == '0':
+        for path, data in jobs:
+            _dump(path, data)
+        return
+    with ThreadPoolExecutor(max_workers=min(8, len(jobs))) as pool:
+        futures = [pool.submit(_dump, path, data) for path, data in jobs]
+    for future in futures:
+        future.result()  # re-raise the first write error
 
-// Simple test example
-int main() {{
-    assert(1 + 1 == 2);
-    return 0;
-}}
-"""
 
-        return templates
+def _cli_templates(project_name: str, cpp_standard: int = 17) -> Dict[str, str]:
+    """CLI Application templates."""
+    return tmpl.render_cli(project_name=project_name, cpp_standard=cpp_standard)
 
-    @staticmethod
-    def gui_application(project_name: str, framework: str = "qt6") -> Dict[str, str]:
-        """GUI Application templates."""
-        templates = {}
 
-        if framework == "qt6":
-            templates['CMakeLists.txt'] = f"""cmake_minimum_required(VERSION 3.16)
-project({project_name} LANGUAGES CXX)
+def _gui_templates(project_name: str, framework: str = "qt6") -> Dict[str, str]:
+    """GUI Application templates."""
+    if framework != "qt6":
+        return {}
+    return tmpl.render_gui_qt6(project_name=project_name)
 
-set(CMAKE_CXX_STANDARD 17)
-set(CMAKE_AUTOMOC ON)
-set(CMAKE_AUTORCC ON)
-set(CMAKE_AUTOUIC ON)
 
-find_package(Qt6 REQUIRED COMPONENTS
-    Core
-    Gui
-    Widgets
-)
+def _static_library_templates(project_name: str) -> Dict[str, str]:
+    """Static Library templates."""
+    return tmpl.render_static_lib(project_name=project_name)
 
-add_executable({project_name}
-    src/main.cpp
-    src/mainwindow.cpp
-    src/mainwindow.h
-    resources/icons.qrc
-)
 
-target_link_libraries({project_name} PRIVATE Qt6::Widgets)
+def _shared_library_templates(project_name: str) -> Dict[str, str]:
+    """Shared Library templates."""
+    return tmpl.render_shared_lib(project_name=project_name)
 
-if(WIN32)
-    set_target_properties({project_name} PROPERTIES WIN32_EXECUTABLE ON)
-endif()
-"""
 
-            templates['src/main.cpp'] = f"""#include <QApplication>
-#include "mainwindow.h"
+def _header_only_templates(project_name: str) -> Dict[str, str]:
+    """Header-Only Library templates."""
+    return tmpl.render_header_only(project_name=project_name)
 
-int main(int argc, char *argv[])
-{{
-    QApplication app(argc, argv);
 
-    MainWindow window;
-    window.show();
+# Project type -> source templates for a ProjectInitializer
+_SOURCE_GENERATORS: Dict[str, Callable[['ProjectInitializer'], Dict[str, str]]] = {
+    'cli': lambda init: _cli_templates(init.project_name, init.cpp_standard),
+    'gui': lambda init: _gui_templates(init.project_name, init.gui_framework),
+    'static-lib': lambda init: _static_library_templates(init.project_name),
+    'shared-lib': lambda init: _shared_library_templates(init.project_name),
+    'header-only': lambda init: _header_only_templates(init.project_name),
+}
 
-    return app.exec();
-}}
-"""
 
-            templates['src/mainwindow.h'] = f"""#ifndef MAINWINDOW_H
-#define MAINWINDOW_H
+def _detect_os() -> str:
+    """Detect operating system."""
+    return _OS_NAME
 
-#include <QMainWindow>
 
-class MainWindow : public QMainWindow {{
-    Q_OBJECT
+def _recommend_compiler() -> str:
+    """Recommend compiler based on platform."""
+    return _PROFILE.compiler
 
-public:
-    MainWindow(QWidget *parent = nullptr);
-    ~MainWindow();
-}};
-
-#endif // MAINWINDOW_H
-"""
-
-            templates['src/mainwindow.cpp'] = f"""#include "mainwindow.h"
-#include <QLabel>
-
-MainWindow::MainWindow(QWidget *parent)
-    : QMainWindow(parent)
-{{
-    setWindowTitle("Hello Qt 6");
-    setGeometry(100, 100, 400, 300);
-
-    auto *label = new QLabel("Welcome to Qt 6!", this);
-    setCentralWidget(label);
-}}
-
-MainWindow::~MainWindow() {{}}
-"""
 
-        return templates
+def _recommend_generator() -> str:
+    """Recommend CMake generator based on platform."""
+    return _PROFILE.generator
 
-    @staticmethod
-    def static_library(project_name: str) -> Dict[str, str]:
-        """Static Library templates."""
-        templates = {}
 
-        templates['CMakeLists.txt'] = f"""cmake_minimum_required(VERSION 3.15)
-project({project_name} VERSION 1.0.0 LANGUAGES CXX)
+def _recommend_package_manager() -> str:
+    """Recommend package manager based on platform."""
+    return _PROFILE.package_manager
 
-set(CMAKE_CXX_STANDARD 17)
-set(CMAKE_CXX_STANDARD_REQUIRED ON)
 
-add_library({project_name} STATIC
-    src/lib.cpp
-)
+@functools.lru_cache(maxsize=1)
+def _detect_vcpkg() -> Optional[str]:
+    """Detect vcpkg installation (looked up once per process)."""
+    vcpkg_root = os.environ.get('VCPKG_ROOT')
+    if vcpkg_root and os.path.exists(vcpkg_root):
+        return vcpkg_root
+    return None
 
-add_library({project_name}::{project_name} ALIAS {project_name})
 
-target_include_directories({project_name}
-    PUBLIC
-        $<BUILD_INTERFACE:${{CMAKE_CURRENT_SOURCE_DIR}}/include>
-        $<INSTALL_INTERFACE:include>
-    PRIVATE
-        ${{CMAKE_CURRENT_SOURCE_DIR}}/src
-)
+@functools.lru_cache(maxsize=1)
+def _detect_conan() -> bool:
+    """Detect Conan installation (looked up on PATH once per process)."""
+    return shutil.which('conan') is not None
 
-target_compile_features({project_name} PUBLIC cxx_std_17)
 
-# Testing
-enable_testing()
-add_subdirectory(tests)
-
-# Installation
-install(TARGETS {project_name} ARCHIVE DESTINATION lib)
-install(DIRECTORY include/{project_name} DESTINATION include)
-"""
-
-        templates['include/lib.h'] = f"""#pragma once
-
-namespace {project_name} {{
-
-void hello();
-
-}}  // namespace {project_name}
-"""
-
-        templates['src/lib.cpp'] = f"""#include "{project_name}/lib.h"
-#include <iostream>
-
-namespace {project_name} {{
-
-void hello() {{
-    std::cout << "Hello from {project_name} library!" << std::endl;
-}}
-
-}}  // namespace {project_name}
-"""
-
-        return templates
-
-    @staticmethod
-    def shared_library(project_name: str) -> Dict[str, str]:
-        """Shared Library templates."""
-        templates = ProjectTemplates.static_library(project_name)
-
-        # Change to SHARED
-        templates['CMakeLists.txt'] = templates['CMakeLists.txt'].replace(
-            'add_library(' + project_name + ' STATIC',
-            'add_library(' + project_name + ' SHARED'
-        ).replace(
-            'install(TARGETS',
-            '''set_target_properties(''' + project_name + ''' PROPERTIES
-    VERSION 1.0.0
-    SOVERSION 1
-)
-
-# Installation (update)
-install(TARGETS'''
-        )
-
-        return templates
-
-    @staticmethod
-    def header_only_library(project_name: str) -> Dict[str, str]:
-        """Header-Only Library templates."""
-        templates = {}
-
-        templates['CMakeLists.txt'] = f"""cmake_minimum_required(VERSION 3.15)
-project({project_name} VERSION 1.0.0 LANGUAGES CXX)
-
-add_library({project_name} INTERFACE)
-add_library({project_name}::{project_name} ALIAS {project_name})
-
-target_include_directories({project_name} INTERFACE
-    $<BUILD_INTERFACE:${{CMAKE_CURRENT_SOURCE_DIR}}/include>
-    $<INSTALL_INTERFACE:include>
-)
-
-target_compile_features({project_name} INTERFACE cxx_std_17)
-
-enable_testing()
-add_subdirectory(tests)
-
-install(DIRECTORY include/{project_name} DESTINATION include)
-"""
-
-        templates['include/lib.h'] = f"""#pragma once
-
-namespace {project_name} {{
-
-template<typename T>
-T add(T a, T b) {{
-    return a + b;
-}}
-
-}}  // namespace {project_name}
-"""
-
-        return templates
-
-
-class PlatformDetector:
-    """Detect platform and recommend defaults."""
-
-    @staticmethod
-    def detect_os() -> str:
-        """Detect operating system."""
-        system = platform.system()
-        if system == 'Windows':
-            return 'Windows'
-        elif system == 'Linux':
-            return 'Linux'
-        elif system == 'Darwin':
-            return 'macOS'
-        return 'Unknown'
-
-    @staticmethod
-    def recommend_compiler() -> str:
-        """Recommend compiler based on platform."""
-        os_name = PlatformDetector.detect_os()
-        if os_name == 'Windows':
-            return 'MSVC'
-        elif os_name == 'Linux':
-            return 'GCC'
-        elif os_name == 'macOS':
-            return 'Clang'
-        return 'GCC'
-
-    @staticmethod
-    def recommend_generator() -> str:
-        """Recommend CMake generator based on platform."""
-        os_name = PlatformDetector.detect_os()
-        if os_name == 'Windows':
-            return 'Visual Studio 17 2022'
-        elif os_name == 'macOS':
-            return 'Unix Makefiles'
-        else:
-            return 'Unix Makefiles'
-
-    @staticmethod
-    def recommend_package_manager() -> str:
-        """Recommend package manager based on platform."""
-        os_name = PlatformDetector.detect_os()
-        if os_name == 'Windows':
-            return 'vcpkg'
-        elif os_name == 'Linux':
-            return 'Conan'
-        elif os_name == 'macOS':
-            return 'Conan'
-        return 'None'
-
-
-class DependencyManager:
-    """Manage dependency strategies."""
-
-    @staticmethod
-    def detect_vcpkg() -> Optional[str]:
-        """Detect vcpkg installation."""
-        vcpkg_root = os.environ.get('VCPKG_ROOT')
-        if vcpkg_root and os.path.exists(vcpkg_root):
-            return vcpkg_root
-        return None
-
-    @staticmethod
-    def detect_conan() -> bool:
-        """Detect Conan installation."""
-        try:
-            subprocess.run(['conan', '--version'], capture_output=True, check=True)
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            return False
-
-    @staticmethod
-    def generate_dependencies_cmake() -> str:
-        """Generate Dependencies.cmake template."""
-        return '''# Common dependencies for all targets
+def _dependencies_cmake() -> str:
+    """Generate Dependencies.cmake template."""
+    return '''# Common dependencies for all targets
 include(FetchContent)
 
 # Example 1: Using FetchContent
@@ -385,10 +176,10 @@ function(link_common_dependencies target)
 endfunction()
 '''
 
-    @staticmethod
-    def generate_compiler_warnings_cmake() -> str:
-        """Generate CompilerWarnings.cmake template."""
-        return '''# Compiler warnings setup
+
+def _compiler_warnings_cmake() -> str:
+    """Generate CompilerWarnings.cmake template."""
+    return '''# Compiler warnings setup
 
 function(target_set_warnings target)
     target_compile_options(${target} PRIVATE
@@ -405,10 +196,10 @@ function(target_set_warnings target)
 endfunction()
 '''
 
-    @staticmethod
-    def generate_sanitizers_cmake() -> str:
-        """Generate Sanitizers.cmake template."""
-        return '''# Sanitizer options
+
+def _sanitizers_cmake() -> str:
+    """Generate Sanitizers.cmake template."""
+    return '''# Sanitizer options
 
 option(ENABLE_ASAN "Enable AddressSanitizer" OFF)
 option(ENABLE_TSAN "Enable ThreadSanitizer" OFF)
@@ -433,208 +224,213 @@ endfunction()
 '''
 
 
+def _should_create_cmake_folder(num_targets: int, num_dependencies: int) -> bool:
+    """Determine if cmake/ folder is needed."""
+    return num_targets >= 3 or num_dependencies >= 3
+
+
+def _create_cmake_modules(project_path: Path, project_name: str) -> None:
+    """Create cmake/ folder and modules."""
+    cmake_dir = project_path / 'cmake'
+    cmake_dir.mkdir(exist_ok=True)
+
+    # Dependencies.cmake
+    _dump(str(cmake_dir / 'Dependencies.cmake'),
+          _dependencies_cmake().encode('utf-8'))
+
+    # CompilerWarnings.cmake
+    _dump(str(cmake_dir / 'CompilerWarnings.cmake'),
+          _compiler_warnings_cmake().encode('utf-8'))
+
+    # Sanitizers.cmake
+    _dump(str(cmake_dir / 'Sanitizers.cmake'),
+          _sanitizers_cmake().encode('utf-8'))
+
+
+# Class namespaces kept for existing callers
+class ProjectTemplates:
+    """Generate templates for each project type.
+
+    Kept for backward compatibility; the module-level functions are used internally.
+    """
+
+    __slots__ = ()
+
+    cli_application = staticmethod(_cli_templates)
+    gui_application = staticmethod(_gui_templates)
+    static_library = staticmethod(_static_library_templates)
+    shared_library = staticmethod(_shared_library_templates)
+    header_only_library = staticmethod(_header_only_templates)
+
+
+class PlatformDetector:
+    """Detect platform and recommend defaults.
+
+    Kept for backward compatibility; the module-level functions are used internally.
+    """
+
+    __slots__ = ()
+
+    detect_os = staticmethod(_detect_os)
+    recommend_compiler = staticmethod(_recommend_compiler)
+    recommend_generator = staticmethod(_recommend_generator)
+    recommend_package_manager = staticmethod(_recommend_package_manager)
+
+
+class DependencyManager:
+    """Manage dependency strategies.
+
+    Kept for backward compatibility; the module-level functions are used internally.
+    """
+
+    __slots__ = ()
+
+    detect_vcpkg = staticmethod(_detect_vcpkg)
+    detect_conan = staticmethod(_detect_conan)
+    generate_dependencies_cmake = staticmethod(_dependencies_cmake)
+    generate_compiler_warnings_cmake = staticmethod(_compiler_warnings_cmake)
+    generate_sanitizers_cmake = staticmethod(_sanitizers_cmake)
+
+
 class CMakeModuleGenerator:
-    """Generate cmake/ folder and modules for complex projects."""
-
-    @staticmethod
-    def should_create_cmake_folder(num_targets: int, num_dependencies: int) -> bool:
-        """Determine if cmake/ folder is needed."""
-        return num_targets >= 3 or num_dependencies >= 3
-
-    @staticmethod
-    def create_cmake_modules(project_path: Path, project_name: str) -> None:
-        """Create cmake/ folder and modules."""
-        cmake_dir = project_path / 'cmake'
-        cmake_dir.mkdir(exist_ok=True)
-
-        # Dependencies.cmake
-        (cmake_dir / 'Dependencies.cmake').write_text(
-            DependencyManager.generate_dependencies_cmake()
-        )
+    """Generate cmake/ folder and modules for complex projects.
 
-        # CompilerWarnings.cmake
-        (cmake_dir / 'CompilerWarnings.cmake').write_text(
-            DependencyManager.generate_compiler_warnings_cmake()
-        )
+    Kept for backward compatibility; the module-level functions are used internally.
+    """
 
-        # Sanitizers.cmake
-        (cmake_dir / 'Sanitizers.cmake').write_text(
-            DependencyManager.generate_sanitizers_cmake()
-        )
+    __slots__ = ()
+
+    should_create_cmake_folder = staticmethod(_should_create_cmake_folder)
+    create_cmake_modules = staticmethod(_create_cmake_modules)
 
 
 class ProjectInitializer:
     """Main project initialization orchestrator."""
 
+    __slots__ = (
+        'project_name', 'project_type', 'interactive', 'project_path', '_root',
+        'compiler', 'generator', 'package_manager', 'cpp_standard', 'gui_framework',
+        'use_cmake_modules', 'quiet',
+    )
+
     def __init__(self, project_name: str, project_type: str, interactive: bool = False):
         self.project_name = project_name
         self.project_type = project_type
         self.interactive = interactive
         self.project_path = Path(project_name)
+        self._root = str(self.project_path)
 
         # Defaults
-        self.compiler = PlatformDetector.recommend_compiler()
-        self.generator = PlatformDetector.recommend_generator()
-        self.package_manager = PlatformDetector.recommend_package_manager()
+        self.compiler, self.generator, self.package_manager = _PROFILE
         self.cpp_standard = 17
         self.gui_framework = 'qt6'
         self.use_cmake_modules = False
+        self.quiet = False
+
+    @property
+    def marks(self) -> _Marks:
+        """Status prefixes for the current output mode."""
+        return _ASCII_MARKS if self.quiet else _EMOJI_MARKS
 
     def create_directory_structure(self) -> bool:
         """Create project directories."""
-        try:
-            self.project_path.mkdir(exist_ok=False)
-            (self.project_path / 'src').mkdir()
-            (self.project_path / 'include').mkdir()
-            (self.project_path / 'tests').mkdir()
-            return True
-        except FileExistsError:
-            print(f"❌ Directory '{self.project_name}' already exists!")
+        if os.path.lexists(self._root):
+            print(f"{self.marks.error} Directory '{self.project_name}' already exists!")
             return False
+        os.mkdir(self._root)
+        for sub in ('src', 'include', 'tests'):
+            os.mkdir(os.path.join(self._root, sub))
+        return True
 
-    def generate_source_files(self) -> bool:
-        """Generate source code templates."""
-        try:
-            if self.project_type == 'cli':
-                templates = ProjectTemplates.cli_application(self.project_name, self.cpp_standard)
-            elif self.project_type == 'gui':
-                templates = ProjectTemplates.gui_application(self.project_name, self.gui_framework)
-            elif self.project_type == 'static-lib':
-                templates = ProjectTemplates.static_library(self.project_name)
-            elif self.project_type == 'shared-lib':
-                templates = ProjectTemplates.shared_library(self.project_name)
-            elif self.project_type == 'header-only':
-                templates = ProjectTemplates.header_only_library(self.project_name)
-            else:
-                print(f"❌ Unknown project type: {self.project_type}")
-                return False
-
-            # Write files
-            for file_path, content in templates.items():
-                full_path = self.project_path / file_path
-                full_path.parent.mkdir(parents=True, exist_ok=True)
-                full_path.write_text(content)
-
-            return True
-        except Exception as e:
-            print(f"❌ Error generating source files: {e}")
+    def _source_files(self) -> Optional[Dict[str, str]]:
+        """Source code templates for the project type (None if the type is unknown)."""
+        generator = _SOURCE_GENERATORS.get(self.project_type)
+        return generator(self) if generator is not None else None
+
+    def _config_files(self) -> Dict[str, bytes]:
+        """Configuration files (identical for every project)."""
+        return {
+            '.clang-format': tmpl.CLANG_FORMAT_BYTES,
+            '.gitignore': tmpl.GITIGNORE_BYTES,
+        }
+
+    def _documentation(self) -> Dict[str, bytes]:
+        """README.md."""
+        readme = tmpl.README_TMPL % {
+            b'project_name': self.project_name.encode('utf-8'),
+            b'cpp_standard': str(self.cpp_standard).encode('ascii'),
+        }
+        return {'README.md': readme}
+
+    def _collect_all_files(self) -> Optional[Dict[str, bytes]]:
+        """Every project file as {relative path: UTF-8 content} (None if the type is unknown)."""
+        sources = self._source_files()
+        if sources is None:
+            return None
+        files = {file_path: content.encode('utf-8') for file_path, content in sources.items()}
+        files.update(self._config_files())
+        files.update(self._documentation())
+        return files
+
+    def generate_project_files(self) -> bool:
+        """Generate source, configuration and documentation files in one pass."""
+        files = self._collect_all_files()
+        if files is None:
+            print(f"{self.marks.error} Unknown project type: {self.project_type}")
             return False
 
-    def generate_config_files(self) -> bool:
-        """Generate configuration files."""
-        try:
-            # .clang-format
-            clang_format = """---
-Language:        Cpp
-BasedOnStyle:    LLVM
-IndentWidth:     4
-TabWidth:        4
-UseTab:          Never
-ColumnLimit:     120
----
-"""
-            (self.project_path / '.clang-format').write_text(clang_format)
-
-            # .gitignore
-            gitignore = """# Build directories
-build/
-cmake-build-*/
-out/
-
-# CMake
-CMakeCache.txt
-CMakeFiles/
-*.cmake
-
-# IDE
-.vscode/
-.idea/
-*.vcxproj
-*.sln
-
-# Executables
-*.exe
-*.out
-*.o
-*.a
-*.so
-
-# OS
-.DS_Store
-.vs/
-"""
-            (self.project_path / '.gitignore').write_text(gitignore)
+        paths = {file_path: os.path.join(self._root, file_path) for file_path in files}
+        parents = {os.path.dirname(full_path) for full_path in paths.values()}
+        jobs = [(paths[file_path], data) for file_path, data in files.items()]
 
-            return True
-        except Exception as e:
-            print(f"❌ Error generating config files: {e}")
-            return False
-
-    def generate_documentation(self) -> bool:
-        """Generate README.md."""
+        # Only filesystem errors are reported here; template bugs propagate
         try:
-            readme = f"""# {self.project_name}
-
-Modern C++ project using CMake.
-
-## Building
-
-```bash
-cmake -B build
-cmake --build build
-```
-
-## Running
-
-```bash
-./build/{self.project_name}
-```
-
-## Testing
-
-```bash
-ctest --test-dir build
-```
-
-## Requirements
-
-- CMake 3.15+
-- C++{self.cpp_standard} compiler
-- (Additional dependencies as needed)
-"""
-            (self.project_path / 'README.md').write_text(readme)
-            return True
-        except Exception as e:
-            print(f"❌ Error generating documentation: {e}")
+            # Create each parent directory once (parents before children), then write files
+            for directory in sorted(parents, key=len):
+                os.makedirs(directory, exist_ok=True)
+            _dump_all(jobs)
+        except OSError as e:
+            print(f"{self.marks.error} Error generating project files: {e}")
             return False
+        return True
 
     def initialize(self) -> bool:
-        """Run full initialization."""
-        print(f"🔧 Initializing {self.project_type} project '{self.project_name}'...\n")
+        """Run full initialization, writing the collected progress output to stdout once."""
+        buffer = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(buffer):
+                return self._run_steps()
+        finally:
+            sys.stdout.write(buffer.getvalue())
+
+    def _run_steps(self) -> bool:
+        """Initialization steps; progress is printed as each one completes."""
+        marks = self.marks
+        print(f"{marks.start} Initializing {self.project_type} project '{self.project_name}'...\n")
 
         steps = [
             ("Creating directory structure", self.create_directory_structure),
-            ("Generating source files", self.generate_source_files),
-            ("Generating configuration files", self.generate_config_files),
-            ("Generating documentation", self.generate_documentation),
+            ("Generating project files", self.generate_project_files),
         ]
 
         for step_name, step_func in steps:
-            print(f"→ {step_name}...")
+            print(f"{marks.step} {step_name}...")
             if not step_func():
                 return False
-            print(f"  ✅ {step_name}")
+            print(f"  {marks.ok} {step_name}")
 
         # Create cmake/ folder if needed
         if self.use_cmake_modules:
-            print("→ Creating cmake/ modules...")
-            CMakeModuleGenerator.create_cmake_modules(self.project_path, self.project_name)
-            print("  ✅ CMake modules created")
+            print(f"{marks.step} Creating cmake/ modules...")
+            _create_cmake_modules(self.project_path, self.project_name)
+            print(f"  {marks.ok} CMake modules created")
 
         return True
 
 
 def main():
+    import argparse
+
     parser = argparse.ArgumentParser(description="Initialize modern C++ project")
     parser.add_argument("name", help="Project name")
     parser.add_argument("--type", choices=["cli", "gui", "static-lib", "shared-lib", "header-only"],
@@ -648,6 +444,8 @@ def main():
                        help="Create cmake/ modules for complex projects")
     parser.add_argument("--interactive", action="store_true",
                        help="Interactive mode with prompts")
+    parser.add_argument("--quiet", action="store_true",
+                       help="Plain ASCII status markers instead of emoji")
 
     args = parser.parse_args()
 
@@ -658,16 +456,20 @@ def main():
     if args.compiler:
         initializer.compiler = args.compiler
     initializer.use_cmake_modules = args.use_cmake_modules
+    initializer.quiet = args.quiet
+    marks = initializer.marks
 
     if initializer.initialize():
-        print(f"\n✅ Project '{args.name}' created successfully!\n")
-        print(f"Next steps:")
-        print(f"  cd {args.name}")
-        print(f"  cmake -B build")
-        print(f"  cmake --build build")
+        sys.stdout.write(
+            f"\n{marks.ok} Project '{args.name}' created successfully!\n\n"
+            f"Next steps:\n"
+            f"  cd {args.name}\n"
+            f"  cmake -B build\n"
+            f"  cmake --build build\n"
+        )
         return 0
     else:
-        print(f"\n❌ Failed to create project")
+        sys.stdout.write(f"\n{marks.error} Failed to create project\n")
         return 1
 
 
@@ -0,0 +1,331 @@
+"""
+Project templates for init_project.py.
+
+Kept in their own module so that, unlike the script that is run directly,
+they are compiled once and loaded from __pycache__ on later runs.
+
+Each project kind has a render function built from f-string literals, so
+rendering is a single string build per file with no template parsing.
+Literal braces in the templates are doubled.
+"""
+
+from typing import Dict
+
+
+def render_cli(project_name: str, cpp_standard: int = 17) -> Dict[str, str]:
+    """CLI application."""
+    return {
+        'CMakeLists.txt': f"""cmake_minimum_required(VERSION 3.15)
+project({project_name} VERSION 1.0.0 LANGUAGES CXX)
+
+set(CMAKE_CXX_STANDARD {cpp_standard})
+set(CMAKE_CXX_STANDARD_REQUIRED ON)
+set(CMAKE_CXX_EXTENSIONS OFF)
+
+# Main executable
+add_executable({project_name}
+    src/main.cpp
+)
+
+target_include_directories({project_name} PRIVATE include)
+
+# Compiler warnings
+target_compile_options({project_name} PRIVATE
+    $<$<CXX_COMPILER_ID:MSVC>:/W4>
+    $<$<NOT:$<CXX_COMPILER_ID:MSVC>>:-Wall -Wextra -Wpedantic>
+)
+
+# Optional: Add find_package here
+# find_package(fmt REQUIRED)
+# target_link_libraries({project_name} PRIVATE fmt::fmt)
+
+# Testing
+enable_testing()
+add_subdirectory(tests)
+""",
+        'src/main.cpp': f"""#include <iostream>
+
+int main(int argc, char* argv[]) {{
+    std::cout << "Hello from {project_name}!" << std::endl;
+    return 0;
+}}
+""",
+        'tests/CMakeLists.txt': f"""# Simple test example
+# For Google Test, use: find_package(GTest REQUIRED)
+# add_executable(tests test_main.cpp)
+# target_link_libraries(tests PRIVATE GTest::Main)
+# add_test(NAME MainTests COMMAND tests)
+""",
+        'tests/test_main.cpp': f"""#include <cassert>
+
+// Simple test example
+int main() {{
+    assert(1 + 1 == 2);
+    return 0;
+}}
+""",
+    }
+
+
+def render_gui_qt6(project_name: str) -> Dict[str, str]:
+    """Qt 6 GUI application."""
+    return {
+        'CMakeLists.txt': f"""cmake_minimum_required(VERSION 3.16)
+project({project_name} LANGUAGES CXX)
+
+set(CMAKE_CXX_STANDARD 17)
+set(CMAKE_AUTOMOC ON)
+set(CMAKE_AUTORCC ON)
+set(CMAKE_AUTOUIC ON)
+
+find_package(Qt6 REQUIRED COMPONENTS
+    Core
+    Gui
+    Widgets
+)
+
+add_executable({project_name}
+    src/main.cpp
+    src/mainwindow.cpp
+    src/mainwindow.h
+    resources/icons.qrc
+)
+
+target_link_libraries({project_name} PRIVATE Qt6::Widgets)
+
+if(WIN32)
+    set_target_properties({project_name} PROPERTIES WIN32_EXECUTABLE ON)
+endif()
+""",
+        'src/main.cpp': f"""#include <QApplication>
+#include "mainwindow.h"
+
+int main(int argc, char *argv[])
+{{
+    QApplication app(argc, argv);
+
+    MainWindow window;
+    window.show();
+
+    return app.exec();
+}}
+""",
+        'src/mainwindow.h': f"""#ifndef MAINWINDOW_H
+#define MAINWINDOW_H
+
+#include <QMainWindow>
+
+class MainWindow : public QMainWindow {{
+    Q_OBJECT
+
+public:
+    MainWindow(QWidget *parent = nullptr);
+    ~MainWindow();
+}};
+
+#endif // MAINWINDOW_H
+""",
+        'src/mainwindow.cpp': f"""#include "mainwindow.h"
+#include <QLabel>
+
+MainWindow::MainWindow(QWidget *parent)
+    : QMainWindow(parent)
+{{
+    setWindowTitle("Hello Qt 6");
+    setGeometry(100, 100, 400, 300);
+
+    auto *label = new QLabel("Welcome to Qt 6!", this);
+    setCentralWidget(label);
+}}
+
+MainWindow::~MainWindow() {{}}
+""",
+    }
+
+
+def _library_cmake(project_name: str, library_kind: str, extra_properties: str = "") -> str:
+    """Library CMakeLists shared by the static and shared variants, with the two blocks that differ filled in."""
+    return f"""cmake_minimum_required(VERSION 3.15)
+project({project_name} VERSION 1.0.0 LANGUAGES CXX)
+
+set(CMAKE_CXX_STANDARD 17)
+set(CMAKE_CXX_STANDARD_REQUIRED ON)
+
+add_library({project_name} {library_kind}
+    src/lib.cpp
+)
+
+add_library({project_name}::{project_name} ALIAS {project_name})
+
+target_include_directories({project_name}
+    PUBLIC
+        $<BUILD_INTERFACE:${{CMAKE_CURRENT_SOURCE_DIR}}/include>
+        $<INSTALL_INTERFACE:include>
+    PRIVATE
+        ${{CMAKE_CURRENT_SOURCE_DIR}}/src
+)
+
+target_compile_features({project_name} PUBLIC cxx_std_17)
+
+# Testing
+enable_testing()
+add_subdirectory(tests)
+
+# Installation
+{extra_properties}install(TARGETS {project_name} ARCHIVE DESTINATION lib)
+install(DIRECTORY include/{project_name} DESTINATION include)
+"""
+
+
+def _library_sources(project_name: str) -> Dict[str, str]:
+    """Header and source shared by the static and shared libraries."""
+    return {
+        'include/lib.h': f"""#pragma once
+
+namespace {project_name} {{
+
+void hello();
+
+}}  // namespace {project_name}
+""",
+        'src/lib.cpp': f"""#include "{project_name}/lib.h"
+#include <iostream>
+
+namespace {project_name} {{
+
+void hello() {{
+    std::cout << "Hello from {project_name} library!" << std::endl;
+}}
+
+}}  // namespace {project_name}
+""",
+    }
+
+
+def render_static_lib(project_name: str) -> Dict[str, str]:
+    """Static library."""
+    return {
+        'CMakeLists.txt': _library_cmake(project_name, "STATIC"),
+        **_library_sources(project_name),
+    }
+
+
+def render_shared_lib(project_name: str) -> Dict[str, str]:
+    """Shared library."""
+    extra_properties = f"""set_target_properties({project_name} PROPERTIES
+    VERSION 1.0.0
+    SOVERSION 1
+)
+
+# Installation (update)
+"""
+    return {
+        'CMakeLists.txt': _library_cmake(project_name, "SHARED", extra_properties),
+        **_library_sources(project_name),
+    }
+
+
+def render_header_only(project_name: str) -> Dict[str, str]:
+    """Header-only library."""
+    return {
+        'CMakeLists.txt': f"""cmake_minimum_required(VERSION 3.15)
+project({project_name} VERSION 1.0.0 LANGUAGES CXX)
+
+add_library({project_name} INTERFACE)
+add_library({project_name}::{project_name} ALIAS {project_name})
+
+target_include_directories({project_name} INTERFACE
+    $<BUILD_INTERFACE:${{CMAKE_CURRENT_SOURCE_DIR}}/include>
+    $<INSTALL_INTERFACE:include>
+)
+
+target_compile_features({project_name} INTERFACE cxx_std_17)
+
+enable_testing()
+add_subdirectory(tests)
+
+install(DIRECTORY include/{project_name} DESTINATION include)
+""",
+        'include/lib.h': f"""#pragma once
+
+namespace {project_name} {{
+
+template<typename T>
+T add(T a, T b) {{
+    return a + b;
+}}
+
+}}  // namespace {project_name}
+""",
+    }
+
+
+# Static files and the README skeleton, kept as bytes so they are written without re-encoding
+CLANG_FORMAT_BYTES = b"""---
+Language:        Cpp
+BasedOnStyle:    LLVM
+IndentWidth:     4
+TabWidth:        4
+UseTab:          Never
+ColumnLimit:     120
+---
+"""
+
+GITIGNORE_BYTES = b"""# Build directories
+build/
+cmake-build-*/
+out/
+
+# CMake
+CMakeCache.txt
+CMakeFiles/
+*.cmake
+
+# IDE
+.vscode/
+.idea/
+*.vcxproj
+*.sln
+
+# Executables
+*.exe
+*.out
+*.o
+*.a
+*.so
+
+# OS
+.DS_Store
+.vs/
+"""
+
+# Rendered with bytes %-formatting: %(project_name)b, %(cpp_standard)b
+README_TMPL = b"""# %(project_name)b
+
+Modern C++ project using CMake.
+
+## Building
+
+```bash
+cmake -B build
+cmake --build build
+```
+
+## Running
+
+```bash
+./build/%(project_name)b
+```
+
+## Testing
+
+```bash
+ctest --test-dir build
+```
+
+## Requirements
+
+- CMake 3.15+
+- C++%(cpp_standard)b compiler
+- (Additional dependencies as needed)
+"""
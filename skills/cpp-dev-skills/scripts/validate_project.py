@@ -19,10 +19,32 @@ Usage:
 
 import os
 import sys
+import shutil
 import subprocess
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Tuple, Dict, Optional
+from typing import Callable, List, Tuple, Dict, Optional
+
+# orjson is optional; it serializes the JSON report faster than the stdlib
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def _parallel_jobs(reserve: int) -> int:
+    """Number of parallel jobs, leaving `reserve` cores free (at least 1)."""
+    return max(1, (os.cpu_count() or 2) - reserve)
+
+
+# C++ sources/headers checked by clang-format, and files per clang-format call
+# (only the project's own directories: build trees and vendored code are not the user's)
+_FORMAT_DIRS = ("src", "include", "tests")
+_FORMAT_SUFFIXES = frozenset({".cpp", ".cc", ".cxx", ".h", ".hh", ".hpp", ".hxx"})
+_FORMAT_BATCH = 100
 
 
 class ProjectValidator:
@@ -33,54 +55,113 @@ class ProjectValidator:
         self.strict = strict
         self.verbose = verbose
         self.checks: List[Tuple[str, bool, Optional[str]]] = []
+        # Compiler cache wrapper, if installed
+        self.compiler_launcher = shutil.which("sccache") or shutil.which("ccache")
+        # Results of side-effect-free commands (version probes), keyed by argv
+        self._cmd_cache: Dict[Tuple[str, ...], Tuple[int, str, str]] = {}
+        # (stdout, stderr) of the last check_build run
+        self._last_build_output: Optional[Tuple[str, str]] = None
+        # Per-thread (log lines, check results) buffer while checks run concurrently
+        self._local = threading.local()
+        # Passed-check count computed by _print_report, reused by export_json
+        self._passed: Optional[int] = None
 
     def log(self, level: str, message: str):
         """Log message with level prefix."""
         if level == "INFO" or self.verbose:
             prefix = "ℹ️ " if level == "INFO" else "⚠️  " if level == "WARN" else "❌"
-            print(f"{prefix} {message}")
+            buffer = getattr(self._local, "buffer", None)
+            if buffer is not None:
+                buffer[0].append(f"{prefix} {message}")
+            else:
+                print(f"{prefix} {message}")
+
+    def _record(self, name: str, passed: bool, error: Optional[str]):
+        """Record a check result (into the thread's buffer when running concurrently)."""
+        buffer = getattr(self._local, "buffer", None)
+        (buffer[1] if buffer is not None else self.checks).append((name, passed, error))
 
-    def run_command(self, cmd: List[str], check: bool = True) -> Tuple[int, str, str]:
-        """Run command and return (return_code, stdout, stderr)."""
+    def _run_concurrently(self, checks: List[Callable[[], bool]]):
+        """Run independent checks on a thread pool.
+
+        Each check's log lines and results are buffered per thread and then
+        emitted in list order, so the output matches a sequential run.
+        """
+        def run(check: Callable[[], bool]) -> Tuple[List[str], List[Tuple[str, bool, Optional[str]]]]:
+            self._local.buffer = buffer = ([], [])
+            try:
+                check()
+            finally:
+                self._local.buffer = None
+            return buffer
+
+        with ThreadPoolExecutor(max_workers=len(checks)) as pool:
+            buffers = list(pool.map(run, checks))
+        for lines, results in buffers:
+            for line in lines:
+                print(line)
+            self.checks.extend(results)
+
+    def run_command(self, cmd: List[str], check: bool = True,
+                    env: Optional[Dict[str, str]] = None, *,
+                    capture_stdout: bool = True,
+                    capture_stderr: bool = True) -> Tuple[int, str, str]:
+        """Run command and return (return_code, stdout, stderr).
+
+        `env` entries are added on top of the current environment.
+        Streams that are not captured go to /dev/null and come back as "".
+        """
         try:
             result = subprocess.run(
                 cmd,
                 cwd=self.project_dir,
-                capture_output=True,
+                env={**os.environ, **env} if env else None,
+                stdout=subprocess.PIPE if capture_stdout else subprocess.DEVNULL,
+                stderr=subprocess.PIPE if capture_stderr else subprocess.DEVNULL,
                 text=True,
                 check=False
             )
-            return result.returncode, result.stdout, result.stderr
+            return result.returncode, result.stdout or "", result.stderr or ""
         except Exception as e:
             return -1, "", str(e)
 
+    def run_command_cached(self, cmd: List[str], **kwargs) -> Tuple[int, str, str]:
+        """run_command for side-effect-free commands; repeated calls reuse the first result."""
+        key = tuple(cmd)
+        result = self._cmd_cache.get(key)
+        if result is None:
+            result = self._cmd_cache[key] = self.run_command(cmd, **kwargs)
+        return result
+
     def check_directory_structure(self) -> bool:
         """Verify basic project directory structure."""
-        required_dirs = ["src", "CMakeLists.txt"]
-        optional_dirs = ["include", "tests", "cmake", ".git"]
-
         self.log("INFO", "Checking directory structure...")
 
-        cmake_exists = (self.project_dir / "CMakeLists.txt").exists()
-        if not cmake_exists:
-            self.checks.append(("Directory: CMakeLists.txt", False, "CMakeLists.txt not found"))
+        # One directory listing instead of a stat per entry
+        try:
+            with os.scandir(self.project_dir) as it:
+                entries = {entry.name: entry.is_dir() for entry in it}
+        except OSError:
+            entries = {}
+
+        if "CMakeLists.txt" not in entries:
+            self._record("Directory: CMakeLists.txt", False, "CMakeLists.txt not found")
             return False
 
-        src_exists = (self.project_dir / "src").exists()
-        if not src_exists:
+        if not entries.get("src", False):
             self.log("WARN", "src/ directory not found (optional for header-only libraries)")
 
-        self.checks.append(("Directory: CMakeLists.txt", True, None))
+        self._record("Directory: CMakeLists.txt", True, None)
         return True
 
     def check_cmake_version(self) -> bool:
         """Verify CMake is installed and version >= 3.15."""
         self.log("INFO", "Checking CMake version...")
 
-        returncode, stdout, stderr = self.run_command(["cmake", "--version"])
+        returncode, stdout, stderr = self.run_command_cached(["cmake", "--version"], capture_stderr=False)
 
         if returncode != 0:
-            self.checks.append(("CMake: Installation", False, "CMake not found in PATH"))
+            self._record("CMake: Installation", False, "CMake not found in PATH")
             return False
 
         # Parse version from output: "cmake version 3.x.x"
@@ -91,14 +172,14 @@ class ProjectValidator:
 
             if major < 3 or (major == 3 and minor < 15):
                 msg = f"CMake 3.15+ required, found {major}.{minor}.{patch}"
-                self.checks.append(("CMake: Version", False, msg))
+                self._record("CMake: Version", False, msg)
                 return False
 
             self.log("INFO", f"CMake {major}.{minor}.{patch} ✓")
-            self.checks.append(("CMake: Version", True, None))
+            self._record("CMake: Version", True, None)
             return True
         except Exception as e:
-            self.checks.append(("CMake: Version", False, f"Failed to parse version: {str(e)}"))
+            self._record("CMake: Version", False, f"Failed to parse version: {str(e)}")
             return False
 
     def check_cmake_configuration(self) -> bool:
@@ -108,17 +189,29 @@ class ProjectValidator:
         build_dir = self.project_dir / "build" / "validate"
         build_dir.mkdir(parents=True, exist_ok=True)
 
-        returncode, stdout, stderr = self.run_command([
-            "cmake", "-B", str(build_dir), "-DCMAKE_BUILD_TYPE=Debug"
-        ])
+        cmd = ["cmake", "-B", str(build_dir), "-DCMAKE_BUILD_TYPE=Debug"]
+        # Prefer Ninja for a fresh build tree (an existing one keeps its generator)
+        if shutil.which("ninja") and not (build_dir / "CMakeCache.txt").exists():
+            cmd += ["-G", "Ninja"]
+        if self.compiler_launcher:
+            cmd += [
+                f"-DCMAKE_C_COMPILER_LAUNCHER={self.compiler_launcher}",
+                f"-DCMAKE_CXX_COMPILER_LAUNCHER={self.compiler_launcher}",
+            ]
+
+        returncode, stdout, stderr = self.run_command(cmd)
 
         if returncode != 0:
             msg = f"CMake configuration failed: {stderr[:200]}"
-            self.checks.append(("CMake: Configuration", False, msg))
+            self._record("CMake: Configuration", False, msg)
             return False
 
         self.log("INFO", "CMake configuration successful ✓")
-        self.checks.append(("CMake: Configuration", True, None))
+        self._record("CMake: Configuration", True, None)
+        if self.compiler_launcher:
+            launcher = Path(self.compiler_launcher).stem
+            self.log("INFO", f"Compiler launcher: {launcher} ✓")
+            self._record("CMake: Compiler Launcher", True, launcher)
         return True
 
     def check_build(self) -> bool:
@@ -127,20 +220,22 @@ class ProjectValidator:
 
         build_dir = self.project_dir / "build" / "validate"
         if not build_dir.exists():
-            self.checks.append(("Build", False, "Build directory not configured"))
+            self._record("Build", False, "Build directory not configured")
             return False
 
         returncode, stdout, stderr = self.run_command([
-            "cmake", "--build", str(build_dir), "--config", "Debug"
+            "cmake", "--build", str(build_dir), "--config", "Debug",
+            "--parallel", str(_parallel_jobs(1))
         ])
+        self._last_build_output = (stdout, stderr)
 
         if returncode != 0:
             msg = f"Build failed: {stderr[:200]}"
-            self.checks.append(("Build", False, msg))
+            self._record("Build", False, msg)
             return False
 
         self.log("INFO", "Build successful ✓")
-        self.checks.append(("Build", True, None))
+        self._record("Build", True, None)
         return True
 
     def check_tests(self) -> bool:
@@ -148,28 +243,39 @@ class ProjectValidator:
         test_dir = self.project_dir / "tests"
         if not test_dir.exists():
             self.log("INFO", "No tests/ directory found (optional)")
-            self.checks.append(("Tests", True, "No tests configured (optional)"))
+            self._record("Tests", True, "No tests configured (optional)")
             return True
 
         self.log("INFO", "Running tests...")
 
         build_dir = self.project_dir / "build" / "validate"
+
+        # List tests without running them; skip ctest entirely if none are registered
+        returncode, stdout, _ = self.run_command(
+            ["ctest", "--test-dir", str(build_dir), "-N"], capture_stderr=False
+        )
+        if returncode == 0 and "Total Tests: 0" in stdout:
+            self.log("INFO", "No tests registered (optional)")
+            self._record("Tests", True, "No tests registered (optional)")
+            return True
+
+        jobs = str(_parallel_jobs(2))
         returncode, stdout, stderr = self.run_command([
-            "ctest", "--test-dir", str(build_dir), "--output-on-failure"
-        ], check=False)
+            "ctest", "--test-dir", str(build_dir), "-j", jobs, "--output-on-failure"
+        ], check=False, env={"CTEST_PARALLEL_LEVEL": jobs})
 
         if returncode != 0:
             msg = f"Some tests failed: {stderr[:200]}"
             if self.strict:
-                self.checks.append(("Tests", False, msg))
+                self._record("Tests", False, msg)
                 return False
             else:
                 self.log("WARN", msg)
-                self.checks.append(("Tests", True, f"Warnings: {msg}"))
+                self._record("Tests", True, f"Warnings: {msg}")
                 return True
 
         self.log("INFO", "Tests passed ✓")
-        self.checks.append(("Tests", True, None))
+        self._record("Tests", True, None)
         return True
 
     def check_code_format(self) -> bool:
@@ -177,73 +283,75 @@ class ProjectValidator:
         clang_format_config = self.project_dir / ".clang-format"
         if not clang_format_config.exists():
             self.log("INFO", "No .clang-format found (skipping format check)")
-            self.checks.append(("Code Format", True, "No .clang-format (optional)"))
+            self._record("Code Format", True, "No .clang-format (optional)")
             return True
 
         self.log("INFO", "Checking code format with clang-format...")
 
-        # Find source files
-        src_files = list((self.project_dir / "src").glob("**/*.cpp")) if (self.project_dir / "src").exists() else []
-        header_files = list((self.project_dir / "include").glob("**/*.h*")) if (self.project_dir / "include").exists() else []
-        all_files = src_files + header_files
-
+        all_files = self._format_sources()
         if not all_files:
-            self.checks.append(("Code Format", True, "No source files to check"))
+            self._record("Code Format", True, "No source files to check")
             return True
 
-        returncode, stdout, stderr = self.run_command(
-            ["clang-format", "--dry-run", "--Werror"] + [str(f) for f in all_files],
-            check=False
-        )
+        # Split into batches (keeps argv short) and format-check them concurrently
+        batches = [all_files[i:i + _FORMAT_BATCH] for i in range(0, len(all_files), _FORMAT_BATCH)]
+        with ThreadPoolExecutor(max_workers=min(len(batches), os.cpu_count() or 1)) as pool:
+            results = list(pool.map(
+                lambda batch: self.run_command(["clang-format", "--dry-run", "--Werror", *batch], check=False),
+                batches
+            ))
+        returncode, stdout, stderr = next((r for r in results if r[0] != 0), results[0])
 
         if returncode != 0:
             msg = f"Code format check failed: {stderr[:200]}"
             if self.strict:
-                self.checks.append(("Code Format", False, msg))
+                self._record("Code Format", False, msg)
                 return False
             else:
                 self.log("WARN", msg)
-                self.checks.append(("Code Format", True, f"Warnings: {msg}"))
+                self._record("Code Format", True, f"Warnings: {msg}")
                 return True
 
         self.log("INFO", "Code format check passed ✓")
-        self.checks.append(("Code Format", True, None))
+        self._record("Code Format", True, None)
         return True
 
+    def _format_sources(self) -> List[str]:
+        """C++ files under the project's own source directories, skipping hidden directories."""
+        files = []
+        for top in _FORMAT_DIRS:
+            for root, dirs, names in os.walk(self.project_dir / top):
+                dirs[:] = [d for d in dirs if not d.startswith(".")]
+                files.extend(os.path.join(root, name) for name in names
+                             if os.path.splitext(name)[1] in _FORMAT_SUFFIXES)
+        files.sort()
+        return files
+
     def check_compiler_warnings(self) -> bool:
         """Check for compiler warnings in build output."""
         self.log("INFO", "Checking for compiler warnings...")
 
-        build_dir = self.project_dir / "build" / "validate"
-        cmake_cache = build_dir / "CMakeCache.txt"
-
-        if not cmake_cache.exists():
-            self.checks.append(("Compiler Warnings", True, "Build not configured"))
+        # Warnings come from the check_build output; building again would be an incremental no-op
+        if self._last_build_output is None:
+            self._record("Compiler Warnings", True, "Build not run")
             return True
 
-        # Try clean rebuild to capture all warnings
-        returncode, stdout, stderr = self.run_command(
-            ["cmake", "--build", str(build_dir), "--config", "Debug"],
-            check=False
-        )
-
-        build_output = stdout + stderr
-
         # Count warnings (simple heuristic)
-        warning_count = build_output.count("warning:")
+        stdout, stderr = self._last_build_output
+        warning_count = stdout.count("warning:") + stderr.count("warning:")
 
         if warning_count > 0:
             msg = f"Found {warning_count} compiler warnings"
             if self.strict:
-                self.checks.append(("Compiler Warnings", False, msg))
+                self._record("Compiler Warnings", False, msg)
                 return False
             else:
                 self.log("WARN", msg)
-                self.checks.append(("Compiler Warnings", True, f"Warnings: {msg}"))
+                self._record("Compiler Warnings", True, f"Warnings: {msg}")
                 return True
 
         self.log("INFO", "No compiler warnings ✓")
-        self.checks.append(("Compiler Warnings", True, None))
+        self._record("Compiler Warnings", True, None)
         return True
 
     def check_git_setup(self) -> bool:
@@ -252,27 +360,27 @@ class ProjectValidator:
 
         if not git_dir.exists():
             self.log("WARN", "Git repository not initialized")
-            self.checks.append(("Git: Repository", True, "Git not initialized (optional)"))
+            self._record("Git: Repository", True, "Git not initialized (optional)")
             return True
 
-        returncode, stdout, stderr = self.run_command(["git", "status"])
+        returncode, stdout, stderr = self.run_command(["git", "status"], capture_stdout=False)
         if returncode != 0:
             msg = f"Git status check failed: {stderr[:200]}"
-            self.checks.append(("Git: Repository", False, msg))
+            self._record("Git: Repository", False, msg)
             return False
 
         self.log("INFO", "Git repository initialized ✓")
-        self.checks.append(("Git: Repository", True, None))
+        self._record("Git: Repository", True, None)
 
         # Check for .gitignore
         gitignore = self.project_dir / ".gitignore"
         if not gitignore.exists():
             self.log("WARN", ".gitignore not found (recommended)")
-            self.checks.append(("Git: .gitignore", True, "No .gitignore (recommended)"))
+            self._record("Git: .gitignore", True, "No .gitignore (recommended)")
             return True
 
         self.log("INFO", ".gitignore present ✓")
-        self.checks.append(("Git: .gitignore", True, None))
+        self._record("Git: .gitignore", True, None)
         return True
 
     def check_compiler_setup(self) -> bool:
@@ -283,21 +391,22 @@ class ProjectValidator:
         cmake_cache = build_dir / "CMakeCache.txt"
 
         if not cmake_cache.exists():
-            self.checks.append(("Compiler: Setup", False, "CMake not configured"))
+            self._record("Compiler: Setup", False, "CMake not configured")
             return False
 
         try:
-            with open(cmake_cache, 'r') as f:
-                cache_content = f.read()
-                if "CMAKE_CXX_COMPILER" not in cache_content:
-                    self.checks.append(("Compiler: Setup", False, "C++ compiler not configured in CMake"))
-                    return False
+            # Scan line by line (as bytes) and stop at the first match
+            with open(cmake_cache, 'rb') as f:
+                found = any(b"CMAKE_CXX_COMPILER" in line for line in f)
+            if not found:
+                self._record("Compiler: Setup", False, "C++ compiler not configured in CMake")
+                return False
         except Exception as e:
-            self.checks.append(("Compiler: Setup", False, str(e)))
+            self._record("Compiler: Setup", False, str(e))
             return False
 
         self.log("INFO", "Compiler setup verified ✓")
-        self.checks.append(("Compiler: Setup", True, None))
+        self._record("Compiler: Setup", True, None)
         return True
 
     def validate(self) -> bool:
@@ -330,11 +439,13 @@ class ProjectValidator:
             self._print_report()
             return False
 
-        # Optional checks
-        self.check_tests()
-        self.check_compiler_warnings()
-        self.check_code_format()
-        self.check_git_setup()
+        # Optional checks (independent of each other, so run concurrently)
+        self._run_concurrently([
+            self.check_tests,
+            self.check_compiler_warnings,
+            self.check_code_format,
+            self.check_git_setup,
+        ])
 
         # Print final report
         self._print_report()
@@ -347,7 +458,7 @@ class ProjectValidator:
         print("VALIDATION REPORT")
         print("="*60 + "\n")
 
-        passed = sum(1 for _, result, _ in self.checks if result)
+        passed = self._passed = sum(1 for _, result, _ in self.checks if result)
         total = len(self.checks)
 
         for check_name, result, error in self.checks:
@@ -372,7 +483,8 @@ class ProjectValidator:
             "project_dir": str(self.project_dir),
             "strict_mode": self.strict,
             "total_checks": len(self.checks),
-            "passed_checks": sum(1 for _, result, _ in self.checks if result),
+            "passed_checks": self._passed if self._passed is not None
+                             else sum(1 for _, result, _ in self.checks if result),
             "checks": [
                 {
                     "name": check_name,
@@ -383,8 +495,12 @@ class ProjectValidator:
             ]
         }
 
-        with open(output_file, 'w') as f:
-            json.dump(report, f, indent=2)
+        if HAS_ORJSON:
+            with open(output_file, 'wb') as f:
+                f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_file, 'w') as f:
+                json.dump(report, f, indent=2)
 
         print(f"Validation report exported to {output_file}")
 
@@ -16,11 +16,13 @@ import re
 import sys
 import json
 from datetime import datetime
-from urllib.parse import urlparse, unquote, quote
+from urllib.parse import unquote, quote
 from pathlib import Path
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except ImportError:
     print("❌ requests 패키지가 필요합니다: pip install requests")
     sys.exit(1)
@@ -66,27 +68,21 @@ def load_env_file():
         load_dotenv(env_file)
         return {}
     
-    # 수동 파싱
+    # 수동 파싱 (파일을 한 번에 읽어 줄 단위로 분리)
     env_vars = {}
-    with open(env_file, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            # 빈 줄이나 주석 무시
-            if not line or line.startswith("#"):
-                continue
-            # KEY=VALUE 형식 파싱
-            if "=" in line:
-                key, value = line.split("=", 1)
-                key = key.strip()
-                value = value.strip()
-                # 따옴표 제거
-                if (value.startswith('"') and value.endswith('"')) or \
-                   (value.startswith("'") and value.endswith("'")):
-                    value = value[1:-1]
-                env_vars[key] = value
-                # 환경변수에도 설정
-                os.environ[key] = value
-    
+    for line in env_file.read_text(encoding="utf-8").splitlines():
+        # KEY=VALUE 형식 파싱 (빈 줄, 주석, '=' 없는 줄 무시)
+        key, sep, value = line.strip().partition("=")
+        if not sep or key.startswith("#"):
+            continue
+        value = value.strip()
+        # 따옴표 제거
+        if value[:1] in ('"', "'") and value[-1:] == value[:1]:
+            value = value[1:-1]
+        env_vars[key.strip()] = value
+    
+    # 환경변수에도 한 번에 설정
+    os.environ.update(env_vars)
     return env_vars
 
 
@@ -98,6 +94,31 @@ NOTION_API_KEY = os.environ.get("NOTION_API_KEY")
 NOTION_DATABASE_ID = os.environ.get("NOTION_DATABASE_ID")
 NOTION_API_URL = "https://api.notion.com/v1"
 NOTION_VERSION = "2022-06-28"
+NOTION_HEADERS = {
+    "Authorization": f"Bearer {NOTION_API_KEY}",
+    "Content-Type": "application/json",
+    "Notion-Version": NOTION_VERSION,
+}
+
+
+def _create_session() -> requests.Session:
+    """
+    연결을 재사용하는 공유 세션을 만듭니다.
+    TCP/TLS 연결을 요청마다 새로 맺지 않고, 일시적인 연결 오류는 자동 재시도합니다.
+    (POST/PATCH는 중복 생성 방지를 위해 재시도하지 않음)
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=4,
+        max_retries=Retry(total=3, backoff_factor=0.3),
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+# GitHub/노션 요청이 함께 쓰는 세션 (인증 헤더는 요청별로 전달)
+_SESSION = _create_session()
 
 # 언어 매핑
 LANGUAGE_MAP = {
@@ -133,6 +154,21 @@ ALGORITHM_MAP = {
     "힙": "힙",
 }
 
+# README 파싱용 정규식 (모듈 로드 시 한 번만 컴파일)
+_LEVEL_RE = re.compile(r'\[level \d+\]\s*', re.IGNORECASE)
+_TRAIL_NUM_RE = re.compile(r'\s*-\s*\d+\s*$')
+_TAG_RE = re.compile(r'코딩테스트 연습 >\s*["\']?([^"\'<>\n]+)["\']?')
+
+# review 섹션 시작 헤더
+_REVIEW_HEADERS = frozenset({"## review", "## Review"})
+
+# 섹션 제목 -> 결과 필드
+_SECTION_FIELDS = {
+    "문제 설명": "description",
+    "제한사항": "constraints",
+    "제한 사항": "constraints",
+}
+
 
 # ============================================================================
 # GitHub README 파싱
@@ -159,14 +195,14 @@ def fetch_github_readme(url: str) -> str:
         api_url = f"https://api.github.com/repos/{owner}/{repo}/contents/{encoded_path}?ref={branch}"
 
         print(f"📥 GitHub API 요청: {api_url[:80]}...")
-        response = requests.get(api_url, timeout=10)
+        response = _SESSION.get(api_url, timeout=10)
 
         if response.status_code == 200:
             file_info = response.json()
             download_url = file_info.get("download_url")
 
             if download_url:
-                response = requests.get(download_url, timeout=10)
+                response = _SESSION.get(download_url, timeout=10)
                 response.raise_for_status()
                 return response.text
 
@@ -174,7 +210,7 @@ def fetch_github_readme(url: str) -> str:
         response.raise_for_status()
     else:
         # raw URL인 경우 직접 사용
-        response = requests.get(url, timeout=10)
+        response = _SESSION.get(url, timeout=10)
         response.raise_for_status()
         return response.text
 
@@ -185,8 +221,9 @@ def parse_path_info(url: str) -> dict:
     
     예: /프로그래머스/2/12909.올바른괄호/README.md
     """
-    parsed = urlparse(unquote(url))
-    path_parts = parsed.path.split("/")
+    # 경로만 필요하므로 urlparse 대신 스킴/호스트와 쿼리/프래그먼트를 잘라냄
+    path = unquote(url.split("://", 1)[-1]).split("?", 1)[0].split("#", 1)[0]
+    path_parts = path.split("/")[1:]  # 호스트 제외
     
     info = {
         "platform": "프로그래머스",
@@ -195,7 +232,7 @@ def parse_path_info(url: str) -> dict:
         "problem_name": "Unknown",
     }
     
-    for i, part in enumerate(path_parts):
+    for part in path_parts:
         # 플랫폼 감지
         if "프로그래머스" in part:
             info["platform"] = "프로그래머스"
@@ -205,17 +242,17 @@ def parse_path_info(url: str) -> dict:
             info["platform"] = "LeetCode"
         
         # 난이도 감지 (숫자만 있는 폴더)
-        if part.isdigit() and 1 <= int(part) <= 5:
-            info["level"] = f"Lv.{part}"
+        if part.isdigit():
+            if 1 <= int(part) <= 5:
+                info["level"] = f"Lv.{part}"
         
         # 문제번호.문제명 폴더 감지
-        if "." in part and part.split(".")[0].isdigit():
-            parts = part.split(".", 1)
-            info["problem_number"] = int(parts[0])
-            if len(parts) > 1:
+        elif "." in part:
+            number, _, name = part.partition(".")
+            if number.isdigit():
+                info["problem_number"] = int(number)
                 # URL 인코딩된 공백 문자 처리
-                name = parts[1].replace("\u2005", " ").replace("%E2%80%85", " ").strip()
-                info["problem_name"] = name
+                info["problem_name"] = name.replace("\u2005", " ").replace("%E2%80%85", " ").strip()
     
     return info
 
@@ -232,68 +269,71 @@ def parse_readme_content(content: str) -> dict:
     }
     
     lines = content.split("\n")
-    current_section = None
+    # 현재 섹션이 저장될 결과 필드 (저장하지 않는 섹션이면 None)
+    current_field = None
+    # 현재 섹션 본문 (섹션이 바뀔 때 비우고 재사용)
     section_content = []
     in_review = False
     review_lines = []
     
-    for i, line in enumerate(lines):
+    for line in lines:
         # review 섹션 감지 (---로 구분된 영역)
-        if line.strip() == "## review" or line.strip() == "## Review":
+        if line.strip() in _REVIEW_HEADERS:
             in_review = True
             continue
         
         if in_review:
-            if line.startswith("---") or line.startswith("# "):
+            if line[:3] == "---" or line[:2] == "# ":
                 in_review = False
                 result["review"] = "\n".join(review_lines).strip()
             else:
                 review_lines.append(line)
             continue
         
+        # 첫 글자로 분기하여 접두사 비교를 줄임
+        head = line[:1]
+        
         # 제목 추출 (# 으로 시작)
-        if line.startswith("# ") and result["title"] is None:
+        if head == "#" and line[1:2] == " " and result["title"] is None:
             # [level X] 형식 제거
             title = line[2:].strip()
-            title = re.sub(r'\[level \d+\]\s*', '', title, flags=re.IGNORECASE)
+            title = _LEVEL_RE.sub('', title)
             # 문제번호 제거 (예: "올바른 괄호 - 12909" -> "올바른 괄호")
-            title = re.sub(r'\s*-\s*\d+\s*$', '', title)
+            title = _TRAIL_NUM_RE.sub('', title)
             result["title"] = title.strip()
             continue
         
         # 알고리즘 태그 추출
         if "코딩테스트 연습 >" in line:
-            match = re.search(r'코딩테스트 연습 >\s*["\']?([^"\'<>\n]+)["\']?', line)
+            match = _TAG_RE.search(line)
             if match:
                 tag_raw = match.group(1).strip()
                 tag = ALGORITHM_MAP.get(tag_raw, tag_raw)
                 if tag not in result["algorithm_tags"]:
                     result["algorithm_tags"].append(tag)
         
+        # 섹션 감지
+        if head == "#" and (line[:3] == "## " or line[:4] == "### "):
+            # 이전 섹션 저장
+            if current_field:
+                result[current_field] = "\n".join(section_content).strip()
+                section_content.clear()
+            
+            current_field = _SECTION_FIELDS.get(line.lstrip("#").strip())
+            continue
+        
         # 언어 추출 (코드 블록에서)
-        if line.startswith("```"):
+        if head == "`" and line[:3] == "```":
             lang = line[3:].strip().lower()
             if lang in LANGUAGE_MAP:
                 result["language"] = LANGUAGE_MAP[lang]
         
-        # 섹션 감지
-        if line.startswith("## ") or line.startswith("### "):
-            # 이전 섹션 저장
-            if current_section == "문제 설명":
-                result["description"] = "\n".join(section_content).strip()
-            elif current_section in ["제한사항", "제한 사항"]:
-                result["constraints"] = "\n".join(section_content).strip()
-            
-            current_section = line.lstrip("#").strip()
-            section_content = []
-        else:
+        if current_field:
             section_content.append(line)
     
     # 마지막 섹션 저장
-    if current_section == "문제 설명":
-        result["description"] = "\n".join(section_content).strip()
-    elif current_section in ["제한사항", "제한 사항"]:
-        result["constraints"] = "\n".join(section_content).strip()
+    if current_field:
+        result[current_field] = "\n".join(section_content).strip()
     
     # review가 남아있으면 저장
     if review_lines and not result["review"]:
@@ -315,20 +355,14 @@ def get_code_file_url(readme_url: str) -> str:
 
 def notion_request(method: str, endpoint: str, data: dict = None) -> dict:
     """노션 API 요청을 수행합니다."""
-    headers = {
-        "Authorization": f"Bearer {NOTION_API_KEY}",
-        "Content-Type": "application/json",
-        "Notion-Version": NOTION_VERSION,
-    }
-    
     url = f"{NOTION_API_URL}{endpoint}"
     
     if method == "POST":
-        response = requests.post(url, headers=headers, json=data, timeout=30)
+        response = _SESSION.post(url, headers=NOTION_HEADERS, json=data, timeout=30)
     elif method == "GET":
-        response = requests.get(url, headers=headers, timeout=30)
+        response = _SESSION.get(url, headers=NOTION_HEADERS, timeout=30)
     elif method == "PATCH":
-        response = requests.patch(url, headers=headers, json=data, timeout=30)
+        response = _SESSION.patch(url, headers=NOTION_HEADERS, json=data, timeout=30)
     else:
         raise ValueError(f"지원하지 않는 HTTP 메서드: {method}")
     
@@ -340,6 +374,74 @@ def notion_request(method: str, endpoint: str, data: dict = None) -> dict:
     return response.json()
 
 
+def _heading_block(text: str) -> dict:
+    """heading_2 블록을 만듭니다."""
+    return {
+        "object": "block",
+        "type": "heading_2",
+        "heading_2": {
+            "rich_text": [{"type": "text", "text": {"content": text}}]
+        }
+    }
+
+
+# 내용이 바뀌지 않는 블록 (요청마다 새로 만들지 않고 재사용, 수정 금지)
+_DIVIDER_BLOCK = {"object": "block", "type": "divider", "divider": {}}
+_DESCRIPTION_HEADING = _heading_block("📝 문제 설명")
+_CONSTRAINTS_HEADING = _heading_block("📋 제한 사항")
+_CODE_HEADING = _heading_block("💻 풀이 코드")
+_REVIEW_HEADING = _heading_block("📒 풀이 메모")
+
+
+def _make_children(description: str, constraints: str, code_url: str, review: str) -> list:
+    """페이지 본문 블록 목록을 만듭니다. 고정 블록은 공유하고 내용이 들어가는 블록만 새로 만듭니다."""
+    return [
+        # 문제 설명 섹션
+        _DESCRIPTION_HEADING,
+        {
+            "object": "block",
+            "type": "paragraph",
+            "paragraph": {
+                "rich_text": [{"type": "text", "text": {"content": description[:2000] if description else "문제 설명을 추가하세요."}}]
+            }
+        },
+        _DIVIDER_BLOCK,
+        
+        # 제한 사항 섹션
+        _CONSTRAINTS_HEADING,
+        {
+            "object": "block",
+            "type": "paragraph",
+            "paragraph": {
+                "rich_text": [{"type": "text", "text": {"content": constraints[:2000] if constraints else "제한 사항을 추가하세요."}}]
+            }
+        },
+        _DIVIDER_BLOCK,
+        
+        # 풀이 코드 섹션
+        _CODE_HEADING,
+        {
+            "object": "block",
+            "type": "bookmark",
+            "bookmark": {
+                "url": code_url
+            }
+        },
+        _DIVIDER_BLOCK,
+        
+        # 풀이 메모 섹션
+        _REVIEW_HEADING,
+        {
+            "object": "block",
+            "type": "callout",
+            "callout": {
+                "icon": {"type": "emoji", "emoji": "💡"},
+                "rich_text": [{"type": "text", "text": {"content": review if review else "접근 방법, 회고 등을 작성하세요."}}]
+            }
+        },
+    ]
+
+
 def create_notion_page(
     title: str,
     platform: str,
@@ -397,78 +499,7 @@ def create_notion_page(
         properties["언어"] = {"select": {"name": language}}
     
     # 본문 블록 구성
-    children = [
-        # 문제 설명 섹션
-        {
-            "object": "block",
-            "type": "heading_2",
-            "heading_2": {
-                "rich_text": [{"type": "text", "text": {"content": "📝 문제 설명"}}]
-            }
-        },
-        {
-            "object": "block",
-            "type": "paragraph",
-            "paragraph": {
-                "rich_text": [{"type": "text", "text": {"content": description[:2000] if description else "문제 설명을 추가하세요."}}]
-            }
-        },
-        # 구분선
-        {"object": "block", "type": "divider", "divider": {}},
-        
-        # 제한 사항 섹션
-        {
-            "object": "block",
-            "type": "heading_2",
-            "heading_2": {
-                "rich_text": [{"type": "text", "text": {"content": "📋 제한 사항"}}]
-            }
-        },
-        {
-            "object": "block",
-            "type": "paragraph",
-            "paragraph": {
-                "rich_text": [{"type": "text", "text": {"content": constraints[:2000] if constraints else "제한 사항을 추가하세요."}}]
-            }
-        },
-        # 구분선
-        {"object": "block", "type": "divider", "divider": {}},
-        
-        # 풀이 코드 섹션
-        {
-            "object": "block",
-            "type": "heading_2",
-            "heading_2": {
-                "rich_text": [{"type": "text", "text": {"content": "💻 풀이 코드"}}]
-            }
-        },
-        {
-            "object": "block",
-            "type": "bookmark",
-            "bookmark": {
-                "url": code_url
-            }
-        },
-        # 구분선
-        {"object": "block", "type": "divider", "divider": {}},
-        
-        # 풀이 메모 섹션
-        {
-            "object": "block",
-            "type": "heading_2",
-            "heading_2": {
-                "rich_text": [{"type": "text", "text": {"content": "📒 풀이 메모"}}]
-            }
-        },
-        {
-            "object": "block",
-            "type": "callout",
-            "callout": {
-                "icon": {"type": "emoji", "emoji": "💡"},
-                "rich_text": [{"type": "text", "text": {"content": review if review else "접근 방법, 회고 등을 작성하세요."}}]
-            }
-        },
-    ]
+    children = _make_children(description, constraints, code_url, review)
     
     # 페이지 생성 요청
     data = {
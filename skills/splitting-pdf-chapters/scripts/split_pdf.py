@@ -18,20 +18,87 @@ Examples:
 
     # Extract specific chapters (1, 3, 5-7)
     python split_pdf.py -p book.pdf -c "1,3,5-7" -o chapters
+
+    # Write chapters with 4 worker processes
+    python split_pdf.py -p book.pdf -o chapters -j 4
+
+    # Write chapters with pikepdf/QPDF instead of pypdf (pip install pikepdf)
+    python split_pdf.py -p book.pdf -o chapters --engine pikepdf
+
+    # Write chapters with the qpdf command-line tool
+    python split_pdf.py -p book.pdf -o chapters --engine qpdf
 """
 
-import re
+import os
 import sys
+import mmap
+import shutil
 import argparse
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
 from pathlib import Path
-from typing import List, Tuple, Optional, Set
+from typing import Any, Callable, Dict, List, Tuple, Optional, Set
 from pypdf import PdfReader, PdfWriter
 
-# Set UTF-8 encoding for output
-if sys.stdout.encoding != 'utf-8':
+# Set UTF-8 encoding for output; characters that cannot be encoded (e.g. lone
+# surrogates in bookmark titles) are replaced instead of raising
+if sys.stdout.encoding != 'utf-8' or sys.stdout.errors != 'replace':
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
 
 
+# PDFs smaller than this are read into memory in one go before parsing
+IN_MEMORY_LIMIT = 2 * 1024 ** 3
+
+# Buffer size for writing chapter files
+WRITE_BUFFER_SIZE = 1 << 20
+
+
+def open_pdf(pdf_path: Path) -> PdfReader:
+    """
+    Open a PDF for reading.
+
+    pypdf performs many small seeks and reads while parsing; reading the
+    file into memory first turns those into one sequential read. Files of
+    IN_MEMORY_LIMIT bytes or more are read from disk as before.
+
+    Args:
+        pdf_path: Path to the PDF file
+
+    Returns:
+        PdfReader object
+    """
+    if pdf_path.stat().st_size < IN_MEMORY_LIMIT:
+        with open(pdf_path, 'rb') as pdf_file:
+            # Ask for aggressive readahead where the platform supports it
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(pdf_file.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            return PdfReader(BytesIO(pdf_file.read()))
+    return PdfReader(pdf_path)
+
+
+def _open_pdf_mapped(pdf_path: Path) -> PdfReader:
+    """
+    Open a PDF for reading through a read-only memory map.
+
+    Used by worker processes: every worker maps the same OS page cache
+    instead of reading its own copy of the file into memory.
+
+    Args:
+        pdf_path: Path to the PDF file
+
+    Returns:
+        PdfReader object
+    """
+    with open(pdf_path, 'rb') as pdf_file:
+        # The map stays valid after the file is closed
+        return PdfReader(mmap.mmap(pdf_file.fileno(), 0, access=mmap.ACCESS_READ))
+
+
+# Translation table deleting invalid Windows filename characters: < > : " / \ | ? *
+_INVALID_FILENAME_CHARS = str.maketrans('', '', '<>:"/\\|?*')
+
+
 def sanitize_filename(filename: str, max_length: int = 200) -> str:
     """
     Sanitize a filename by removing invalid Windows filename characters.
@@ -43,12 +110,8 @@ def sanitize_filename(filename: str, max_length: int = 200) -> str:
     Returns:
         A sanitized filename safe for Windows
     """
-    # Remove invalid Windows filename characters: < > : " / \ | ? *
-    invalid_chars = r'[<>:"/\\|?*]'
-    sanitized = re.sub(invalid_chars, '', filename)
-
-    # Remove leading/trailing dots and spaces
-    sanitized = sanitized.strip('. ')
+    # Remove invalid Windows filename characters, then leading/trailing dots and spaces
+    sanitized = filename.translate(_INVALID_FILENAME_CHARS).strip('. ')
 
     # Truncate if too long
     if len(sanitized) > max_length:
@@ -65,32 +128,146 @@ def extract_bookmarks(pdf_reader: PdfReader) -> List[Tuple[str, int]]:
         pdf_reader: PdfReader object
 
     Returns:
-        List of tuples containing (bookmark_title, page_number)
+        List of tuples containing (bookmark_title, page_number), sorted by page
     """
     bookmarks = []
 
-    def extract_outline(outline, bookmarks_list):
-        """Recursively extract bookmarks from the outline."""
-        for item in outline:
+    try:
+        outline = pdf_reader.outline
+        # Walk nested outline lists with an explicit stack (in document order)
+        # so deeply nested outlines cannot hit the recursion limit
+        stack = [outline] if outline else []
+        while stack:
+            item = stack.pop()
             if isinstance(item, dict):
                 title = item.get('/Title', 'Unknown')
+                # pypdf maps page object numbers to indices once per reader,
+                # so this is a dict lookup rather than a page-tree walk
                 page_num = pdf_reader.get_destination_page_number(item)
                 if page_num is not None:
-                    bookmarks_list.append((title, page_num))
-            else:
-                # If item is a list/outline, recursively process it
-                extract_outline(item, bookmarks_list)
-
-    try:
-        outline = pdf_reader.outline
-        if outline:
-            extract_outline(outline, bookmarks)
+                    bookmarks.append((title, page_num))
+            elif isinstance(item, list):
+                stack.extend(reversed(item))
     except Exception as e:
         print(f"Warning: Could not extract bookmarks: {e}")
 
+    # Sort bookmarks by page number to ensure proper order
+    bookmarks.sort(key=lambda x: x[1])
     return bookmarks
 
 
+def _chapter_ranges(bookmarks: List[Tuple[str, int]], total_pages: int) -> List[Tuple[str, int, int]]:
+    """
+    Pair each bookmark with the start of the next one (or the end of the PDF).
+
+    Args:
+        bookmarks: Sorted (title, start_page) tuples from extract_bookmarks
+        total_pages: Number of pages in the PDF
+
+    Returns:
+        List of tuples containing (title, start_page, end_page)
+    """
+    return [(title, start, end) for (title, start), (_, end)
+            in zip(bookmarks, [*bookmarks[1:], ("", total_pages)])]
+
+
+def _write_chapter(pdf_reader: PdfReader, start_page: int, end_page: int, output_path: Path) -> None:
+    """
+    Copy pages [start_page, end_page) of the PDF into a new file.
+
+    Args:
+        pdf_reader: PdfReader of the source PDF
+        start_page: First page index (0-indexed, inclusive)
+        end_page: Last page index (exclusive)
+        output_path: Path of the chapter PDF to write
+    """
+    # Append the whole range at once so shared resources are cloned once per chapter
+    pdf_writer = PdfWriter()
+    pdf_writer.append(pdf_reader, pages=(start_page, end_page), import_outline=False)
+
+    # pypdf issues many small writes; a large buffer turns them into a few syscalls
+    with open(output_path, 'wb', buffering=WRITE_BUFFER_SIZE) as output_file:
+        pdf_writer.write(output_file)
+
+
+def _open_pikepdf(pdf_path: Path) -> Any:
+    """Open the source PDF with pikepdf (imported lazily; it is optional)."""
+    import pikepdf
+    return pikepdf.open(pdf_path)
+
+
+def _write_chapter_pikepdf(src: Any, start_page: int, end_page: int, output_path: Path) -> None:
+    """
+    Copy pages [start_page, end_page) into a new file using pikepdf.
+
+    QPDF copies and writes the pages in C++, which is much faster than
+    pypdf on large books.
+
+    Args:
+        src: pikepdf.Pdf of the source PDF
+        start_page: First page index (0-indexed, inclusive)
+        end_page: Last page index (exclusive)
+        output_path: Path of the chapter PDF to write
+    """
+    import pikepdf
+    with pikepdf.new() as dst:
+        dst.pages.extend(src.pages[start_page:end_page])
+        dst.save(output_path)
+
+
+def _qpdf_source(pdf_path: Path) -> Path:
+    """qpdf reads the source PDF itself, so its source is just the path."""
+    return pdf_path
+
+
+def _write_chapter_qpdf(pdf_path: Path, start_page: int, end_page: int, output_path: Path) -> None:
+    """
+    Copy pages [start_page, end_page) into a new file with the qpdf command-line tool.
+
+    Args:
+        pdf_path: Path of the source PDF
+        start_page: First page index (0-indexed, inclusive)
+        end_page: Last page index (exclusive)
+        output_path: Path of the chapter PDF to write
+    """
+    cmd = ['qpdf', '--empty']
+    # An empty range would read as a reversed range, so write an empty PDF instead
+    if end_page > start_page:
+        cmd += ['--pages', str(pdf_path), f"{start_page + 1}-{end_page}", '--']
+    cmd.append(str(output_path))
+
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    # Exit status 3 means the file was written but qpdf reported warnings
+    if result.returncode not in (0, 3):
+        raise RuntimeError(f"qpdf failed for {output_path.name}: {result.stderr.strip()}")
+
+
+# Engine name -> (open source PDF, write one chapter from it)
+ENGINES: Dict[str, Tuple[Callable[[Path], Any], Callable[[Any, int, int, Path], None]]] = {
+    'pypdf': (open_pdf, _write_chapter),
+    'pikepdf': (_open_pikepdf, _write_chapter_pikepdf),
+    'qpdf': (_qpdf_source, _write_chapter_qpdf),
+}
+
+# Source PDF and chapter writer of a worker process (see _init_worker)
+_worker_source: Any = None
+_worker_write: Optional[Callable[[Any, int, int, Path], None]] = None
+
+
+def _init_worker(pdf_path: Path, engine: str) -> None:
+    """Open the source PDF once in a worker process."""
+    global _worker_source, _worker_write
+    open_source, _worker_write = ENGINES[engine]
+    if engine == 'pypdf':
+        open_source = _open_pdf_mapped
+    _worker_source = open_source(pdf_path)
+
+
+def _write_chapter_in_worker(job: Tuple[int, int, Path]) -> None:
+    """Write one chapter in a worker process; job is (start_page, end_page, output_path)."""
+    _worker_write(_worker_source, *job)
+
+
 def parse_chapter_selection(chapters_str: str, max_chapters: int) -> Optional[Set[int]]:
     """
     Parse chapter selection string like '1,3,5-7' into a set of chapter numbers.
@@ -149,7 +326,7 @@ def list_chapters(pdf_path: Path) -> bool:
     try:
         # Read the PDF
         print(f"Reading PDF: {pdf_path}")
-        pdf_reader = PdfReader(pdf_path)
+        pdf_reader = open_pdf(pdf_path)
         total_pages = len(pdf_reader.pages)
 
         # Extract bookmarks
@@ -159,21 +336,11 @@ def list_chapters(pdf_path: Path) -> bool:
             print("No bookmarks found in PDF.")
             return False
 
-        # Sort bookmarks by page number
-        bookmarks.sort(key=lambda x: x[1])
-
         print(f"\nFound {len(bookmarks)} chapters in '{pdf_path.name}':\n")
 
-        for chapter_num, (title, start_page) in enumerate(bookmarks, 1):
-            # Determine end page
-            if chapter_num < len(bookmarks):
-                end_page = bookmarks[chapter_num][1]
-            else:
-                end_page = total_pages
-
+        for chapter_num, (title, start_page, end_page) in enumerate(_chapter_ranges(bookmarks, total_pages), 1):
             num_pages = end_page - start_page
-            safe_title = title.encode('utf-8', errors='replace').decode('utf-8')
-            print(f"  {chapter_num:3d}. {safe_title:<50} (pages {start_page + 1:4d}-{end_page:4d}, {num_pages:4d} pages)")
+            print(f"  {chapter_num:3d}. {title:<50} (pages {start_page + 1:4d}-{end_page:4d}, {num_pages:4d} pages)")
 
         return True
 
@@ -184,7 +351,10 @@ def list_chapters(pdf_path: Path) -> bool:
         return False
 
 
-def split_pdf(pdf_path: Path, output_dir: Path, selected_chapters: Optional[Set[int]] = None) -> bool:
+def split_pdf(pdf_path: Path, output_dir: Path, selected_chapters: Optional[Set[int]] = None,
+              jobs: Optional[int] = None, engine: str = 'pypdf',
+              pdf_reader: Optional[PdfReader] = None,
+              bookmarks: Optional[List[Tuple[str, int]]] = None) -> bool:
     """
     Split a PDF into chapters based on bookmarks.
 
@@ -192,6 +362,10 @@ def split_pdf(pdf_path: Path, output_dir: Path, selected_chapters: Optional[Set[
         pdf_path: Path to the PDF file
         output_dir: Directory where chapter PDFs will be saved
         selected_chapters: Optional set of specific chapters to extract (1-indexed)
+        jobs: Number of worker processes writing chapters (default: CPU count, 1 = no pool)
+        engine: Library used to write chapters: 'pypdf', 'pikepdf' or 'qpdf' (bookmarks are always read with pypdf)
+        pdf_reader: Optional already-opened reader for pdf_path, to avoid parsing it again
+        bookmarks: Optional bookmarks already extracted from pdf_reader
 
     Returns:
         True if successful, False otherwise
@@ -201,15 +375,28 @@ def split_pdf(pdf_path: Path, output_dir: Path, selected_chapters: Optional[Set[
         print(f"Error: PDF file not found at {pdf_path}")
         return False
 
+    if engine == 'pikepdf':
+        try:
+            import pikepdf  # noqa: F401
+        except ImportError:
+            print("Error: pikepdf is not installed. Install it with: pip install pikepdf")
+            return False
+
+    if engine == 'qpdf' and shutil.which('qpdf') is None:
+        print("Warning: qpdf not found on PATH, writing chapters with pypdf")
+        engine = 'pypdf'
+
     try:
         # Read the PDF
         print(f"Reading PDF: {pdf_path}")
-        pdf_reader = PdfReader(pdf_path)
+        if pdf_reader is None:
+            pdf_reader = open_pdf(pdf_path)
         total_pages = len(pdf_reader.pages)
         print(f"Total pages: {total_pages}")
 
         # Extract bookmarks
-        bookmarks = extract_bookmarks(pdf_reader)
+        if bookmarks is None:
+            bookmarks = extract_bookmarks(pdf_reader)
 
         if not bookmarks:
             print("Error: No bookmarks found in PDF. Cannot split by chapters.")
@@ -221,50 +408,53 @@ def split_pdf(pdf_path: Path, output_dir: Path, selected_chapters: Optional[Set[
         output_dir.mkdir(parents=True, exist_ok=True)
         print(f"Output directory: {output_dir}")
 
-        # Sort bookmarks by page number to ensure proper order
-        bookmarks.sort(key=lambda x: x[1])
-
-        # Filter chapters if specified
-        chapters_to_extract = bookmarks
-        if selected_chapters:
-            chapters_to_extract = [
-                bookmarks[i - 1] for i in sorted(selected_chapters)
-                if 1 <= i <= len(bookmarks)
-            ]
-            print(f"Extracting {len(chapters_to_extract)} selected chapters")
-
-        # Extract and save each chapter
-        extracted_count = 0
-        for chapter_num, (title, start_page) in enumerate(bookmarks, 1):
+        # Build the work list: (chapter number, title, start page, end page, filename)
+        chapters = []
+        for chapter_num, (title, start_page, end_page) in enumerate(_chapter_ranges(bookmarks, total_pages), 1):
             # Skip if not selected
             if selected_chapters and chapter_num not in selected_chapters:
                 continue
 
-            # Determine end page (start of next chapter or end of PDF)
-            if chapter_num < len(bookmarks):
-                end_page = bookmarks[chapter_num][1]
-            else:
-                end_page = total_pages
-
             # Create filename
             sanitized_title = sanitize_filename(title)
             filename = f"{chapter_num:02d}_{sanitized_title}.pdf"
-            output_path = output_dir / filename
+            chapters.append((chapter_num, title, start_page, end_page, filename))
 
-            # Extract pages for this chapter
-            pdf_writer = PdfWriter()
-            for page_num in range(start_page, end_page):
-                pdf_writer.add_page(pdf_reader.pages[page_num])
-
-            # Save chapter PDF
-            with open(output_path, 'wb') as output_file:
-                pdf_writer.write(output_file)
-
-            num_pages = end_page - start_page
-            safe_title = title.encode('utf-8', errors='replace').decode('utf-8')
-            print(f"  {chapter_num:3d}. {safe_title:<50} (pages {start_page + 1:4d}-{end_page:4d}, {num_pages:4d} pages) -> {filename}")
+        if selected_chapters:
+            print(f"Extracting {len(chapters)} selected chapters")
+
+        # Extract and save each chapter; chapters are independent, so several
+        # can be written at once by worker processes
+        open_source, write_chapter = ENGINES[engine]
+        workers = min(jobs or os.cpu_count() or 1, len(chapters))
+        pool = source = None
+        if workers > 1:
+            pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(pdf_path, engine))
+            written = pool.map(_write_chapter_in_worker, [
+                (start_page, end_page, output_dir / filename)
+                for _, _, start_page, end_page, filename in chapters
+            ])
+        else:
+            # The pypdf reader is already open; other engines open the file themselves
+            source = pdf_reader if engine == 'pypdf' else open_source(pdf_path)
+            written = (
+                write_chapter(source, start_page, end_page, output_dir / filename)
+                for _, _, start_page, end_page, filename in chapters
+            )
+
+        # Report in chapter order as each chapter is written
+        extracted_count = 0
+        try:
+            for (chapter_num, title, start_page, end_page, filename), _ in zip(chapters, written):
+                num_pages = end_page - start_page
+                print(f"  {chapter_num:3d}. {title:<50} (pages {start_page + 1:4d}-{end_page:4d}, {num_pages:4d} pages) -> {filename}")
 
-            extracted_count += 1
+                extracted_count += 1
+        finally:
+            if pool is not None:
+                pool.shutdown()
+            if source is not None and source is not pdf_reader and hasattr(source, 'close'):
+                source.close()
 
         print(f"\nSuccessfully extracted {extracted_count} chapters!")
         print(f"Chapters saved to: {output_dir}")
@@ -315,6 +505,20 @@ Examples:
         help='List available chapters without splitting'
     )
 
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        default=os.cpu_count() or 1,
+        help='Number of worker processes for writing chapters (default: CPU count)'
+    )
+
+    parser.add_argument(
+        '--engine',
+        choices=sorted(ENGINES),
+        default='pypdf',
+        help='Library used to write chapter files (default: pypdf; pikepdf and qpdf are faster but optional)'
+    )
+
     return parser.parse_args()
 
 
@@ -338,6 +542,8 @@ def main():
 
     # Parse chapter selection if provided
     selected_chapters = None
+    pdf_reader = None
+    bookmarks = None
     if args.chapters:
         # First list chapters to get count
         if not pdf_path.exists():
@@ -345,7 +551,7 @@ def main():
             return 1
 
         try:
-            pdf_reader = PdfReader(pdf_path)
+            pdf_reader = open_pdf(pdf_path)
             bookmarks = extract_bookmarks(pdf_reader)
             if not bookmarks:
                 print("Error: No bookmarks found in PDF.")
@@ -359,7 +565,8 @@ def main():
             return 1
 
     # Split the PDF
-    success = split_pdf(pdf_path, output_dir, selected_chapters)
+    success = split_pdf(pdf_path, output_dir, selected_chapters, jobs=args.jobs, engine=args.engine,
+                        pdf_reader=pdf_reader, bookmarks=bookmarks)
 
     if success:
         print("\n[OK] PDF splitting completed successfully!")